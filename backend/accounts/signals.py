@@ -0,0 +1,17 @@
+"""User 변경 시 JWT 인증의 활성 사용자 캐시 갱신 (core.authentication)"""
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from accounts.models import User
+from core.authentication import set_user_active
+
+
+@receiver(post_save, sender=User)
+def refresh_active_user(sender, instance, **kwargs):
+    set_user_active(instance.pk, instance.is_active)
+
+
+@receiver(post_delete, sender=User)
+def revoke_deleted_user(sender, instance, **kwargs):
+    set_user_active(instance.pk, False)
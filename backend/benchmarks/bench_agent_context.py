@@ -0,0 +1,163 @@
+"""
+최근 거래 표 벤치마크 — 삭제 요청당 LLM 턴 수 (AGENT_RECENT_CONTEXT_*)
+
+합성 거래 N건을 넣고, 최근 거래일수록 자주 지우는 분포(순위 ~ 기하분포)로
+"2월 13일 스타벅스 4,500원 삭제해줘" 같은 삭제 요청을 만듭니다.
+
+    기본 (LLM 없음): 대상이 첫 프롬프트의 표에 들어 있는 비율(hit)을 잽니다.
+        표 없음 = search + delete 2턴, 표에 있으면 delete 1턴으로 계산
+    --provider groq 등: 실제 run_agent_loop를 표 끔/켬으로 돌려
+        요청당 LLM 호출 수와 올바른 거래를 지웠는지 비교 (API 키 · Redis 필요,
+        요청마다 롤백하므로 데이터는 바뀌지 않음)
+
+규칙 기반 사전 라우팅(AGENT_PRE_ROUTER)은 끄고 측정합니다.
+
+실행:
+    cd backend
+    python benchmarks/bench_agent_context.py --rows 500 --requests 200
+    python benchmarks/bench_agent_context.py --requests 30 --provider groq
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+# 실제 사용자와 겹치지 않는 큰 id (user_id 는 bigint)
+BENCH_USER_ID = "900000002"
+MERCHANTS = ["스타벅스", "김밥천국", "GS25", "쿠팡", "카카오T", "올리브영", "CGV"]
+CATEGORIES = ["식비", "교통", "쇼핑", "의료", "문화"]
+
+
+def _delete_requests(rows: list[dict], count: int, recency: float, rng) -> list:
+    """(대상 tx_id, 메시지) 목록 — 순위 k 를 고를 확률 ∝ (1 - recency)^k."""
+    requests = []
+    for _ in range(count):
+        rank = 0
+        while rng.random() > recency and rank < len(rows) - 1:
+            rank += 1
+        row = rows[rank]
+        day = row["occurred_date"]
+        message = (
+            f"{day.month}월 {day.day}일 {row['merchant']} {row['amount']:,}원 삭제해줘"
+        )
+        requests.append((str(row["tx_id"]), message))
+    return requests
+
+
+def _run_live(requests: list, provider: str, rows_setting: int) -> dict:
+    from django.db import transaction
+    from django.test import override_settings
+
+    from ledger.models import Transaction
+    from ledger.services.orchestrator import run_agent_loop
+
+    calls, correct = [], 0
+    with override_settings(
+        AGENT_PRE_ROUTER=False, AGENT_RECENT_CONTEXT_ROWS=rows_setting
+    ):
+        for tx_id, message in requests:
+            with transaction.atomic():
+                result = run_agent_loop(
+                    BENCH_USER_ID, message, provider_override=provider
+                )
+                calls.append(result["llm_calls"])
+                correct += not Transaction.objects.filter(tx_id=tx_id).exists()
+                transaction.set_rollback(True)
+    return {
+        "avg_calls": statistics.mean(calls),
+        "accuracy": correct / len(requests),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=500)
+    parser.add_argument("--days", type=int, default=90, help="거래를 분산할 최근 일수")
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument(
+        "--recency", type=float, default=0.15, help="기하분포 p (클수록 최근 위주)"
+    )
+    parser.add_argument("--provider", default=None, help="지정하면 실제 LLM 호출")
+    parser.add_argument("--settings", default="config.test_settings")
+    args = parser.parse_args()
+
+    sys.path.insert(0, str(BACKEND_DIR))
+    os.environ["DJANGO_SETTINGS_MODULE"] = args.settings
+    import django
+
+    django.setup()
+    from django.conf import settings
+    from django.core.management import call_command
+
+    from ledger.models import Transaction
+    from ledger.services.orchestrator import _recent_context
+    from ledger.services.transaction_query import TransactionQueryService
+
+    call_command("migrate", verbosity=0)
+    Transaction.all_objects.filter(user_id=BENCH_USER_ID).delete()
+
+    rng = random.Random(42)
+    today = date.today()
+    Transaction.objects.bulk_create(
+        (
+            Transaction(
+                user_id=BENCH_USER_ID,
+                occurred_date=today - timedelta(days=rng.randrange(args.days)),
+                type="expense",
+                amount=rng.randrange(10, 2_000) * 100,
+                category=rng.choice(CATEGORIES),
+                merchant=rng.choice(MERCHANTS),
+                memo=rng.choice([None, "점심", "팀 회식", "주말"]),
+                source_text="합성 거래",
+            )
+            for _ in range(args.rows)
+        ),
+        batch_size=5_000,
+    )
+
+    try:
+        rows = TransactionQueryService.recent_transactions(BENCH_USER_ID, args.rows)
+        requests = _delete_requests(rows, args.requests, args.recency, rng)
+
+        timings = []
+        for _ in range(50):
+            started = time.perf_counter()
+            context, handles = _recent_context(BENCH_USER_ID)
+            timings.append((time.perf_counter() - started) * 1000)
+        in_context = set(handles.values())
+        hits = sum(tx_id in in_context for tx_id, _ in requests) / len(requests)
+
+        print(
+            f"표: {len(handles)}행 / 상한 {settings.AGENT_RECENT_CONTEXT_ROWS}행, "
+            f"{len(context):,}자 (≈토큰, 상한 {settings.AGENT_RECENT_CONTEXT_TOKENS}), "
+            f"조회+렌더링 중앙값 {statistics.median(timings):.2f}ms"
+        )
+        print(f"삭제 대상이 표에 있는 비율: {hits:.1%}")
+        print(
+            f"삭제 요청당 턴 (예상): 표 없음 2.00 → 표 있음 {2 - hits:.2f} "
+            f"(요청당 {hits:.2f}턴 절약)"
+        )
+
+        if args.provider:
+            off = _run_live(requests, args.provider, 0)
+            on = _run_live(requests, args.provider, settings.AGENT_RECENT_CONTEXT_ROWS)
+            print()
+            print(f"실측 ({args.provider}, {len(requests)}건):")
+            for name, stats in (("표 없음", off), ("표 있음", on)):
+                print(
+                    f"  {name}: 요청당 LLM 호출 {stats['avg_calls']:.2f}, "
+                    f"정확도 {stats['accuracy']:.1%}"
+                )
+            print(f"  요청당 {off['avg_calls'] - on['avg_calls']:.2f}턴 절약")
+    finally:
+        Transaction.all_objects.filter(user_id=BENCH_USER_ID).delete()
+
+
+if __name__ == "__main__":
+    main()
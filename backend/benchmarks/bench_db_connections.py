@@ -0,0 +1,140 @@
+"""
+DB 커넥션 모드별 요청당 연결 비용 벤치마크 — GET /api/v1/transactions/
+
+DB_POOL_MODE(none / persistent / pool)마다 별도 프로세스를 띄워
+실제 WSGIHandler로 요청을 보내고, 요청 종료 시 close_old_connections까지
+운영과 동일하게 거치도록 합니다. (Django 테스트 클라이언트는 요청 사이에
+연결을 닫지 않으므로 이 비교에 쓸 수 없습니다.)
+
+필요: .env의 DATABASE_URL이 가리키는 PostgreSQL (마이그레이션 완료 상태)
+
+실행:
+    cd backend
+    python benchmarks/bench_db_connections.py --requests 500
+    python benchmarks/bench_db_connections.py --modes none,persistent
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from io import BytesIO
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+BENCH_USERNAME = "bench_db_connections"
+
+
+def _worker(n_requests: int) -> dict:
+    """현재 프로세스의 DB_POOL_MODE로 n_requests번 요청하고 통계를 반환."""
+    sys.path.insert(0, str(BACKEND_DIR))
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+
+    import django
+
+    django.setup()
+
+    from django.conf import settings
+    from django.contrib.auth import get_user_model
+    from django.core.handlers.wsgi import WSGIHandler
+    from django.db import connection
+    from django.db.backends.signals import connection_created
+    from rest_framework_simplejwt.tokens import RefreshToken
+
+    from ledger.views import TransactionListCreateView
+
+    # 조회 스로틀(분당 10회)과 Redis 의존성은 측정 대상이 아니므로 제외
+    TransactionListCreateView.throttle_classes = []
+
+    user, _ = get_user_model().objects.get_or_create(username=BENCH_USERNAME)
+    token = str(RefreshToken.for_user(user).access_token)
+    connection.close()
+
+    opened = 0
+
+    def _on_connect(sender, connection, **kwargs):
+        nonlocal opened
+        opened += 1
+
+    connection_created.connect(_on_connect)
+
+    handler = WSGIHandler()
+    environ_base = {
+        "REQUEST_METHOD": "GET",
+        "PATH_INFO": "/api/v1/transactions/",
+        "QUERY_STRING": "",
+        "SERVER_NAME": "localhost",
+        "SERVER_PORT": "8001",
+        "SERVER_PROTOCOL": "HTTP/1.1",
+        "HTTP_HOST": "localhost",
+        "HTTP_AUTHORIZATION": f"Bearer {token}",
+        "wsgi.url_scheme": "http",
+        "wsgi.errors": sys.stderr,
+        "wsgi.multithread": False,
+        "wsgi.multiprocess": True,
+        "wsgi.run_once": False,
+    }
+
+    def _start_response(status, headers, exc_info=None):
+        if not status.startswith("200"):
+            raise RuntimeError(f"예상치 못한 응답: {status}")
+
+    latencies = []
+    for _ in range(n_requests):
+        environ = dict(environ_base, **{"wsgi.input": BytesIO(b"")})
+        started = time.perf_counter()
+        response = handler(environ, _start_response)
+        b"".join(response)
+        response.close()  # request_finished → close_old_connections
+        latencies.append((time.perf_counter() - started) * 1000)
+
+    latencies.sort()
+    return {
+        "mode": settings.DB_POOL_MODE,
+        "requests": n_requests,
+        "connections_opened": opened,
+        "mean_ms": round(statistics.fmean(latencies), 3),
+        "p50_ms": round(latencies[len(latencies) // 2], 3),
+        "p95_ms": round(latencies[int(len(latencies) * 0.95) - 1], 3),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=300)
+    parser.add_argument("--modes", default="none,persistent,pool")
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(_worker(args.requests)))
+        return
+
+    rows = []
+    for mode in args.modes.split(","):
+        env = dict(os.environ, DB_POOL_MODE=mode)
+        proc = subprocess.run(
+            [sys.executable, __file__, "--worker", "--requests", str(args.requests)],
+            cwd=BACKEND_DIR,
+            env=env,
+            capture_output=True,
+            text=True,
+        )
+        if proc.returncode != 0:
+            print(f"[{mode}] 실패:\n{proc.stderr.strip()}", file=sys.stderr)
+            continue
+        rows.append(json.loads(proc.stdout.strip().splitlines()[-1]))
+
+    print(f"{'mode':<11} {'reqs':>6} {'conns':>6} {'mean':>9} {'p50':>9} {'p95':>9}")
+    for r in rows:
+        print(
+            f"{r['mode']:<11} {r['requests']:>6} {r['connections_opened']:>6} "
+            f"{r['mean_ms']:>7.2f}ms {r['p50_ms']:>7.2f}ms {r['p95_ms']:>7.2f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
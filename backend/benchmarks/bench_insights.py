@@ -0,0 +1,70 @@
+"""
+인사이트 계산 벤치마크 — compute_insights (GET /api/v1/insights/ 의 계산 단계)
+
+합성 거래 N건(기본 100만, 최근 13개월에 분산)을 컬럼 배열로 만들고
+월별 추이 · 이동평균 · 요일 패턴 · 상위 가맹점 · 전월 대비를 계산하는 시간을 잽니다.
+DB 로드(load_columns)는 포함하지 않습니다.
+
+실행:
+    cd backend
+    python benchmarks/bench_insights.py --rows 1000000
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+from datetime import date
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--merchants", type=int, default=5_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--months", type=int, default=12)
+    args = parser.parse_args()
+
+    sys.path.insert(0, str(BACKEND_DIR))
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+    import django
+
+    django.setup()
+    import numpy as np
+
+    from ledger.services.analytics import TransactionColumns, compute_insights
+    from ledger.services.normalizer import CATEGORIES
+
+    rng = np.random.default_rng(42)
+    today = date(2026, 2, 13)
+    n = args.rows
+    cols = TransactionColumns(
+        dates=(today.toordinal() - rng.integers(0, 400, n)).astype(np.int32),
+        amounts=rng.integers(1_000, 200_000, n, dtype=np.int64),
+        is_expense=rng.random(n) < 0.9,
+        categories=rng.integers(0, len(CATEGORIES), n).astype(np.int16),
+        category_labels=tuple(sorted(CATEGORIES)),
+        merchants=rng.integers(-1, args.merchants, n).astype(np.int32),
+        merchant_labels=tuple(f"가맹점{i}" for i in range(args.merchants)),
+    )
+
+    compute_insights(cols, today=today, months=args.months)  # warm-up
+    timings = []
+    for _ in range(args.repeat):
+        started = time.perf_counter()
+        compute_insights(cols, today=today, months=args.months)
+        timings.append((time.perf_counter() - started) * 1000)
+
+    print(f"rows={n:,} merchants={args.merchants:,} months={args.months}")
+    print(
+        f"mean={statistics.mean(timings):.1f}ms "
+        f"min={min(timings):.1f}ms max={max(timings):.1f}ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
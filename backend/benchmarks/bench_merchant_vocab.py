@@ -0,0 +1,86 @@
+"""
+가맹점 어휘 인덱스 조회 지연시간 벤치마크 — MerchantIndex.match
+
+임의의 한글 가맹점명 N개(지점명 접미사 포함)로 인덱스를 만들고
+약어(앞 두 글자 / 띄엄띄엄 두 글자), 한 글자 오타, 없는 이름을 조회합니다.
+Redis/DB 없이 프로세스 내 인덱스만 측정합니다.
+
+실행:
+    cd backend
+    python benchmarks/bench_merchant_vocab.py --merchants 10000
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+_SYLLABLES = [chr(c) for c in range(0xAC00, 0xAC00 + 400)]
+_SUFFIXES = ["", "점", " 강남점", " 역삼점", " 본점"]
+
+
+def _random_name(rng: random.Random) -> str:
+    length = rng.randint(2, 8)
+    return "".join(rng.choice(_SYLLABLES) for _ in range(length)) + rng.choice(
+        _SUFFIXES
+    )
+
+
+def _typo(rng: random.Random, name: str) -> str:
+    i = rng.randrange(len(name))
+    return name[:i] + rng.choice(_SYLLABLES) + name[i + 1 :]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--merchants", type=int, default=10_000)
+    parser.add_argument("--queries", type=int, default=2_000)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    sys.path.insert(0, str(BACKEND_DIR))
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+    import django
+
+    django.setup()
+    from ledger.services.merchant_vocab import MerchantIndex
+
+    rng = random.Random(args.seed)
+    names = [_random_name(rng) for _ in range(args.merchants)]
+
+    started = time.perf_counter()
+    index = MerchantIndex(names)
+    build_ms = (time.perf_counter() - started) * 1000
+
+    bare = [n.split()[0] for n in names if len(n.split()[0]) >= 3]
+    kinds = {
+        "prefix": lambda: rng.choice(bare)[:2],
+        "abbrev": lambda: (lambda n: n[0] + n[2])(rng.choice(bare)),
+        "typo": lambda: _typo(rng, rng.choice(bare)),
+        "miss": lambda: "".join(rng.choice(_SYLLABLES) for _ in range(4)),
+    }
+
+    print(f"merchants={len(index)} build={build_ms:.1f}ms")
+    print(f"{'kind':<8}{'hit%':>7}{'mean_us':>10}{'p99_us':>10}")
+    for kind, make in kinds.items():
+        queries = [make() for _ in range(args.queries)]
+        timings, hits = [], 0
+        for q in queries:
+            t = time.perf_counter()
+            hits += bool(index.match(q))
+            timings.append((time.perf_counter() - t) * 1e6)
+        timings.sort()
+        p99 = timings[int(len(timings) * 0.99) - 1]
+        print(
+            f"{kind:<8}{hits / len(queries) * 100:>6.1f}%"
+            f"{statistics.mean(timings):>10.1f}{p99:>10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""
+거래 조회 형태별 실행 계획 확인 — EXPLAIN (ANALYZE, BUFFERS)
+
+서비스 코드가 실제로 실행하는 SQL을 CaptureQueriesContext로 잡아 그대로 EXPLAIN 합니다.
+
+    summary  TransactionQueryService.get_summary (월, 전월 비교)      → idx_tx_summary (Index Only Scan)
+    list     GET /transactions/ 목록 (render_transaction_list)         → idx_tx_user_date_created
+    category 카테고리 목록                                             → idx_tx_user_cat_date
+    delete   delete_transaction_by_query 의 대상 조회 (롤백)          → idx_tx_user_amount
+
+합성 거래를 --users명에게 나눠 넣고 VACUUM ANALYZE 후 측정하며, 끝나면 삭제합니다.
+"Heap Fetches: 0" 이면 INCLUDE 컬럼까지 인덱스만으로 읽은 것입니다.
+
+필요: .env의 DATABASE_URL이 가리키는 PostgreSQL (마이그레이션 + 파티션 생성 완료 상태)
+
+실행:
+    cd backend
+    python benchmarks/bench_query_plans.py --rows 1000000 --users 50
+"""
+
+import argparse
+import os
+import random
+import sys
+from datetime import date, timedelta
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+# 실제 사용자와 겹치지 않는 큰 id 대역 (user_id 는 bigint)
+BENCH_USER_BASE = 900_000_100
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--users", type=int, default=50)
+    parser.add_argument("--keep", action="store_true", help="합성 데이터 유지")
+    args = parser.parse_args()
+
+    sys.path.insert(0, str(BACKEND_DIR))
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+    import django
+
+    django.setup()
+    from django.db import connection, transaction
+    from django.test.utils import CaptureQueriesContext
+
+    from ledger.models import Transaction
+    from ledger.renderers import render_transaction_list
+    from ledger.services.transaction_command import TransactionCommandService
+    from ledger.services.transaction_query import TransactionQueryService
+
+    if connection.vendor != "postgresql":
+        sys.exit("PostgreSQL 전용 벤치마크입니다 (EXPLAIN ANALYZE, BUFFERS).")
+
+    rng = random.Random(42)
+    today = date.today()
+    categories = ["식비", "교통", "쇼핑", "주거", "의료", "문화", "구독"]
+    user_ids = [str(BENCH_USER_BASE + i) for i in range(args.users)]
+    target = user_ids[0]
+
+    bench_rows = Transaction.objects.filter(
+        user_id__gte=BENCH_USER_BASE, user_id__lt=BENCH_USER_BASE + args.users
+    )
+    bench_rows.delete()
+    Transaction.objects.bulk_create(
+        (
+            Transaction(
+                user_id=rng.choice(user_ids),
+                occurred_date=today - timedelta(days=rng.randrange(365)),
+                type="expense" if rng.random() < 0.9 else "income",
+                amount=rng.randrange(1, 200) * 100,
+                category=rng.choice(categories),
+                merchant=rng.choice([None, "스타벅스", "김밥천국", "GS25"]),
+                memo=rng.choice([None, "점심", "팀 회식"]),
+            )
+            for _ in range(args.rows)
+        ),
+        batch_size=10_000,
+    )
+    with connection.cursor() as cursor:
+        # Index Only Scan은 visibility map이 채워져 있어야 heap을 건너뜀
+        cursor.execute("VACUUM (ANALYZE) transactions")
+
+    def capture(fn) -> str:
+        with CaptureQueriesContext(connection) as ctx:
+            fn()
+        selects = [
+            q["sql"] for q in ctx.captured_queries if q["sql"].startswith("SELECT")
+        ]
+        return selects[0]
+
+    def delete_lookup():
+        with transaction.atomic():
+            TransactionCommandService.delete_transaction_by_query(
+                target, today - timedelta(days=3), 8000, category="식비"
+            )
+            transaction.set_rollback(True)
+
+    month = today.strftime("%Y-%m")
+    shapes = {
+        "summary": capture(
+            lambda: TransactionQueryService.get_summary(
+                target, month=month, compare_previous=True
+            )
+        ),
+        "list": capture(
+            lambda: render_transaction_list(
+                TransactionQueryService.list_transactions(
+                    target, from_date=today - timedelta(days=30), to_date=today
+                )
+            )
+        ),
+        "category": capture(
+            lambda: render_transaction_list(
+                TransactionQueryService.list_transactions(target, category="식비")
+            )
+        ),
+        "delete": capture(delete_lookup),
+    }
+
+    try:
+        with connection.cursor() as cursor:
+            for name, sql in shapes.items():
+                cursor.execute(f"EXPLAIN (ANALYZE, BUFFERS) {sql}")
+                print(f"── {name} ──")
+                print("\n".join(row[0] for row in cursor.fetchall()))
+                print()
+    finally:
+        if not args.keep:
+            bench_rows.delete()
+
+
+if __name__ == "__main__":
+    main()
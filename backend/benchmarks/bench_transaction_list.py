@@ -0,0 +1,105 @@
+"""
+거래 목록 렌더링 벤치마크 — GET /transactions/ 의 조회 + JSON 인코딩 단계
+
+    slow: QuerySet → TransactionResponseSerializer(many=True) → JSONRenderer
+    fast: QuerySet.values_list → dict → orjson (ledger.renderers)
+
+두 경로의 출력이 바이트 단위로 같은지 확인한 뒤 행 수별 rows/sec을 비교합니다.
+기본은 인메모리 SQLite(config.test_settings)에 합성 거래를 넣어 측정하며,
+--settings config.settings 로 .env의 PostgreSQL을 대상으로 할 수 있습니다.
+
+실행:
+    cd backend
+    python benchmarks/bench_transaction_list.py --sizes 1000 10000 100000
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+# 실제 사용자와 겹치지 않는 큰 id (user_id 는 bigint)
+BENCH_USER_ID = "900000001"
+
+
+def _timed(fn, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000]
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--settings", default="config.test_settings")
+    args = parser.parse_args()
+
+    sys.path.insert(0, str(BACKEND_DIR))
+    os.environ["DJANGO_SETTINGS_MODULE"] = args.settings
+    import django
+
+    django.setup()
+    from django.core.management import call_command
+    from rest_framework.renderers import JSONRenderer
+
+    from ledger.models import Transaction
+    from ledger.renderers import render_transaction_list
+    from ledger.serializers import TransactionResponseSerializer
+
+    call_command("migrate", verbosity=0)
+    Transaction.objects.filter(user_id=BENCH_USER_ID).delete()
+
+    rng = random.Random(42)
+    categories = ["식비", "교통", "쇼핑", "주거", "의료"]
+    Transaction.objects.bulk_create(
+        (
+            Transaction(
+                user_id=BENCH_USER_ID,
+                occurred_date=date(2026, 2, 13) - timedelta(days=rng.randrange(365)),
+                type="expense",
+                amount=rng.randrange(1_000, 200_000),
+                category=rng.choice(categories),
+                merchant=rng.choice([None, "스타벅스", "김밥천국", "GS25"]),
+                memo=rng.choice([None, "점심", "팀 회식"]),
+                source_text="합성 거래",
+            )
+            for _ in range(max(args.sizes))
+        ),
+        batch_size=5_000,
+    )
+    base = Transaction.objects.filter(user_id=BENCH_USER_ID).order_by(
+        "-occurred_date", "-created_at"
+    )
+
+    def slow(qs):
+        data = TransactionResponseSerializer(qs, many=True).data
+        return JSONRenderer().render({"transactions": data})
+
+    try:
+        print(f"{'rows':>8} {'slow rows/s':>12} {'fast rows/s':>12} {'speedup':>8}")
+        for size in args.sizes:
+            qs = base[:size]
+            assert render_transaction_list(qs) == slow(qs), "출력 불일치"
+            slow_s = _timed(lambda: slow(base[:size]), args.repeat)
+            fast_s = _timed(lambda: render_transaction_list(base[:size]), args.repeat)
+            print(
+                f"{size:>8,} {size / slow_s:>12,.0f} {size / fast_s:>12,.0f} "
+                f"{slow_s / fast_s:>7.1f}x"
+            )
+    finally:
+        Transaction.objects.filter(user_id=BENCH_USER_ID).delete()
+
+
+if __name__ == "__main__":
+    main()
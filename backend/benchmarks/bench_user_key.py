@@ -0,0 +1,182 @@
+"""
+user_id 키 타입 벤치마크 — text(str(user.id)) vs bigint
+
+같은 합성 거래를 user_id 타입만 다른 두 테이블에 넣고, transactions와 같은 모양의
+인덱스 두 개를 만든 뒤 비교합니다.
+
+    idx_*_list     (user_id, occurred_date DESC, created_at DESC)        → 목록
+    idx_*_summary  (user_id, type, occurred_date) INCLUDE (category, amount) → 요약
+
+    - 인덱스 크기 (PostgreSQL: pg_relation_size)
+    - 목록(최근 50건) / 월 요약(GROUP BY category) 쿼리의 사용자별 지연시간 중앙값 · p95
+
+text 키는 인덱스 항목마다 가변 길이 헤더가 붙고 비교가 collation 기반 문자열 비교라,
+bigint(8바이트 고정, 정수 비교)보다 인덱스가 크고 탐색이 느립니다.
+
+필요: .env의 DATABASE_URL이 가리키는 PostgreSQL (벤치마크 테이블은 끝나면 삭제)
+    --settings config.test_settings 로 SQLite에서 작은 규모로 지연시간만 확인할 수 있습니다.
+
+실행:
+    cd backend
+    python benchmarks/bench_user_key.py --rows 5000000 --users 20000
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+CATEGORIES = ["식비", "교통", "쇼핑", "주거", "의료", "문화", "구독"]
+
+
+def _load(connection, table: str, key_type: str, rows: list, batch: int) -> float:
+    """테이블 생성 + 적재 + 인덱스 생성. 적재 시간(초) 반환."""
+    with connection.cursor() as cursor:
+        cursor.execute(f"DROP TABLE IF EXISTS {table}")
+        cursor.execute(
+            f"CREATE TABLE {table} ("
+            f"  user_id {key_type} NOT NULL, occurred_date date NOT NULL,"
+            f"  type text NOT NULL, amount integer NOT NULL,"
+            f"  category text NOT NULL, created_at timestamp NOT NULL)"
+        )
+        started = time.perf_counter()
+        for start in range(0, len(rows), batch):
+            chunk = rows[start : start + batch]
+            placeholders = ",".join(["(%s, %s, %s, %s, %s, %s)"] * len(chunk))
+            cursor.execute(
+                f"INSERT INTO {table} VALUES {placeholders}",
+                [value for row in chunk for value in row],
+            )
+        include = (
+            " INCLUDE (category, amount)" if connection.vendor == "postgresql" else ""
+        )
+        cursor.execute(
+            f"CREATE INDEX idx_{table}_list "
+            f"ON {table} (user_id, occurred_date DESC, created_at DESC)"
+        )
+        cursor.execute(
+            f"CREATE INDEX idx_{table}_summary "
+            f"ON {table} (user_id, type, occurred_date){include}"
+        )
+        if connection.vendor == "postgresql":
+            cursor.execute(f"VACUUM (ANALYZE) {table}")
+        else:
+            cursor.execute(f"ANALYZE {table}")
+        return time.perf_counter() - started
+
+
+def _index_mb(connection, table: str) -> dict:
+    if connection.vendor != "postgresql":
+        return {}
+    with connection.cursor() as cursor:
+        sizes = {}
+        for name in ("list", "summary"):
+            cursor.execute("SELECT pg_relation_size(%s)", [f"idx_{table}_{name}"])
+            sizes[name] = cursor.fetchone()[0] / 1024 / 1024
+        return sizes
+
+
+def _latency_ms(connection, table: str, users: list, month_start: date) -> dict:
+    month_end = (month_start + timedelta(days=32)).replace(day=1)
+    queries = {
+        "list": (
+            f"SELECT user_id, occurred_date, amount, category FROM {table} "
+            f"WHERE user_id = %s ORDER BY occurred_date DESC, created_at DESC LIMIT 50",
+            lambda u: [u],
+        ),
+        "summary": (
+            f"SELECT category, SUM(amount) FROM {table} "
+            f"WHERE user_id = %s AND type = 'expense' "
+            f"AND occurred_date >= %s AND occurred_date < %s GROUP BY category",
+            lambda u: [u, month_start, month_end],
+        ),
+    }
+    results = {}
+    with connection.cursor() as cursor:
+        for name, (sql, params) in queries.items():
+            timings = []
+            for user in users:
+                started = time.perf_counter()
+                cursor.execute(sql, params(user))
+                cursor.fetchall()
+                timings.append((time.perf_counter() - started) * 1000)
+            timings.sort()
+            results[name] = (
+                statistics.median(timings),
+                timings[int(len(timings) * 0.95) - 1],
+            )
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=5_000_000)
+    parser.add_argument("--users", type=int, default=20_000)
+    parser.add_argument("--queries", type=int, default=2_000, help="측정할 사용자 수")
+    parser.add_argument("--batch", type=int, default=1_000)
+    parser.add_argument("--settings", default="config.settings")
+    args = parser.parse_args()
+
+    sys.path.insert(0, str(BACKEND_DIR))
+    os.environ["DJANGO_SETTINGS_MODULE"] = args.settings
+    import django
+
+    django.setup()
+    from django.db import connection
+
+    rng = random.Random(42)
+    today = date.today()
+    # 실제 id처럼 자릿수가 섞이도록 1..users*50 범위에서 뽑음
+    user_ids = rng.sample(range(1, args.users * 50), args.users)
+    rows = [
+        (
+            rng.choice(user_ids),
+            today - timedelta(days=rng.randrange(365)),
+            "expense" if rng.random() < 0.9 else "income",
+            rng.randrange(1, 200) * 100,
+            rng.choice(CATEGORIES),
+            f"{today} {rng.randrange(24):02d}:{rng.randrange(60):02d}:00",
+        )
+        for _ in range(args.rows)
+    ]
+    sample = rng.sample(user_ids, min(args.queries, len(user_ids)))
+
+    variants = {
+        "text": ("bench_user_key_text", "text", str),
+        "bigint": ("bench_user_key_bigint", "bigint", int),
+    }
+    results = {}
+    try:
+        for name, (table, key_type, cast) in variants.items():
+            typed = [(cast(row[0]), *row[1:]) for row in rows]
+            print(f"{name}: {args.rows:,} rows 적재 중...")
+            load = _load(connection, table, key_type, typed, args.batch)
+            results[name] = {
+                "load_s": load,
+                "index_mb": _index_mb(connection, table),
+                "latency": _latency_ms(
+                    connection, table, [cast(u) for u in sample], today.replace(day=1)
+                ),
+            }
+    finally:
+        with connection.cursor() as cursor:
+            for table, _, _ in variants.values():
+                cursor.execute(f"DROP TABLE IF EXISTS {table}")
+
+    print()
+    for name, stats in results.items():
+        line = f"{name:>6}: 적재+인덱스 {stats['load_s']:.1f}s"
+        for index, mb in stats["index_mb"].items():
+            line += f", {index} 인덱스 {mb:,.1f}MB"
+        print(line)
+        for query, (median, p95) in stats["latency"].items():
+            print(f"        {query:<8} 중앙값 {median:.3f}ms  p95 {p95:.3f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+UUID PK 삽입 처리량 벤치마크 — uuid4 vs uuid7 (core.ids)
+
+(id uuid PRIMARY KEY, user_id text, amount int) 테이블 두 개에 같은 수의 행을
+배치 INSERT하면서 구간별 rows/sec을 기록합니다. 테이블이 커질수록 uuid4는
+PK 인덱스 전역에 흩어져 삽입되어 처리량이 떨어지고, uuid7은 오른쪽 끝에만 붙습니다.
+PostgreSQL이면 마지막에 PK 인덱스 크기와 WAL 생성량도 출력합니다.
+
+필요: .env의 DATABASE_URL이 가리키는 PostgreSQL (벤치마크 테이블은 끝나면 삭제)
+    --settings config.test_settings 로 SQLite에서 작은 규모로 확인할 수 있습니다.
+
+실행:
+    cd backend
+    python benchmarks/bench_uuid_inserts.py --rows 10000000
+"""
+
+import argparse
+import os
+import sys
+import time
+import uuid
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+
+def _run(connection, table: str, make_id, rows: int, batch: int, report: int):
+    vendor = connection.vendor
+    with connection.cursor() as cursor:
+        cursor.execute(f"DROP TABLE IF EXISTS {table}")
+        cursor.execute(
+            f"CREATE TABLE {table} (id uuid PRIMARY KEY, user_id text, amount integer)"
+        )
+        if vendor == "postgresql":
+            cursor.execute("SELECT pg_current_wal_lsn()")
+            wal_start = cursor.fetchone()[0]
+
+        placeholders = ",".join(["(%s, %s, %s)"] * batch)
+        sql = f"INSERT INTO {table} (id, user_id, amount) VALUES {placeholders}"
+        started = section = time.perf_counter()
+        inserted = 0
+        while inserted < rows:
+            params = []
+            for i in range(batch):
+                value = make_id()
+                params += [value if vendor == "postgresql" else value.hex, "u1", i]
+            cursor.execute(sql, params)
+            inserted += batch
+            if inserted % report == 0:
+                now = time.perf_counter()
+                print(
+                    f"  {table} {inserted:>12,} rows  "
+                    f"{report / (now - section):>10,.0f} rows/s"
+                )
+                section = now
+        elapsed = time.perf_counter() - started
+
+        stats = {"rows_per_sec": inserted / elapsed}
+        if vendor == "postgresql":
+            cursor.execute(
+                "SELECT pg_relation_size(%s), pg_wal_lsn_diff(pg_current_wal_lsn(), %s)",
+                [f"{table}_pkey", wal_start],
+            )
+            stats["index_mb"], stats["wal_mb"] = (
+                v / 1024 / 1024 for v in cursor.fetchone()
+            )
+        cursor.execute(f"DROP TABLE {table}")
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=10_000_000)
+    parser.add_argument("--batch", type=int, default=1_000)
+    parser.add_argument("--report-every", type=int, default=1_000_000)
+    parser.add_argument("--settings", default="config.settings")
+    args = parser.parse_args()
+
+    sys.path.insert(0, str(BACKEND_DIR))
+    os.environ["DJANGO_SETTINGS_MODULE"] = args.settings
+    import django
+
+    django.setup()
+    from django.db import connection
+
+    from core.ids import uuid7
+
+    report = max(args.batch, args.report_every - args.report_every % args.batch)
+    results = {}
+    for name, make_id in (("uuid4", uuid.uuid4), ("uuid7", uuid7)):
+        print(f"{name}: {args.rows:,} rows")
+        results[name] = _run(
+            connection, f"bench_pk_{name}", make_id, args.rows, args.batch, report
+        )
+
+    print()
+    for name, stats in results.items():
+        line = f"{name}: {stats['rows_per_sec']:,.0f} rows/s"
+        if "index_mb" in stats:
+            line += f", pkey {stats['index_mb']:,.0f}MB, WAL {stats['wal_mb']:,.0f}MB"
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
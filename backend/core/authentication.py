@@ -0,0 +1,103 @@
+"""JWT 인증 — DB 조회 없이 토큰 클레임으로 사용자 구성
+
+simplejwt의 JWTAuthentication은 요청마다 users 행을 읽습니다. ledger 뷰는
+str(request.user.id)만 쓰므로, 검증된 토큰으로 TokenUser를 만들고
+"활성 사용자인지"만 캐시로 확인합니다.
+
+    1) 프로세스 내 캐시   AUTH_ACTIVE_USER_LOCAL_TTL_SECONDS (기본 5초)
+    2) Redis 캐시        AUTH_ACTIVE_USER_CACHE_SECONDS (기본 300초)
+    3) 둘 다 없으면 users 조회 후 양쪽에 기록
+
+사용자가 비활성화/삭제되면 accounts.signals가 set_user_active()로 Redis 값을 즉시 갱신하므로
+다른 프로세스에는 최대 로컬 TTL만큼 늦게 반영됩니다. Redis 장애 시에는 DB 조회로 동작합니다.
+"""
+
+import logging
+import threading
+import time
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.models import TokenUser
+from rest_framework_simplejwt.settings import api_settings
+
+logger = logging.getLogger(__name__)
+
+ACTIVE_KEY_PREFIX = "auth:active:"
+_LOCAL_MAX_ENTRIES = 50_000
+
+_local: dict[str, tuple[float, bool]] = {}
+_local_lock = threading.Lock()
+
+
+def _remember_local(user_id: str, active: bool) -> None:
+    with _local_lock:
+        if len(_local) >= _LOCAL_MAX_ENTRIES:
+            _local.clear()
+        _local[user_id] = (
+            time.monotonic() + settings.AUTH_ACTIVE_USER_LOCAL_TTL_SECONDS,
+            active,
+        )
+
+
+def set_user_active(user_id, active: bool) -> None:
+    """활성 상태를 캐시에 기록 (비활성화/삭제 시 즉시 반영용)."""
+    user_id = str(user_id)
+    _remember_local(user_id, active)
+    try:
+        cache.set(
+            f"{ACTIVE_KEY_PREFIX}{user_id}",
+            int(active),
+            timeout=settings.AUTH_ACTIVE_USER_CACHE_SECONDS,
+        )
+    except Exception:
+        logger.warning("active user cache write failed user=%s", user_id, exc_info=True)
+
+
+def is_user_active(user_id) -> bool:
+    """존재하고 활성 상태인 사용자인지 (프로세스 캐시 → Redis → DB)."""
+    user_id = str(user_id)
+    entry = _local.get(user_id)
+    if entry and entry[0] > time.monotonic():
+        return entry[1]
+
+    try:
+        cached = cache.get(f"{ACTIVE_KEY_PREFIX}{user_id}")
+    except Exception:
+        logger.warning("active user cache read failed user=%s", user_id, exc_info=True)
+        cached = None
+    if cached is not None:
+        _remember_local(user_id, bool(cached))
+        return bool(cached)
+
+    active = (
+        get_user_model()
+        .objects.filter(
+            **{api_settings.USER_ID_FIELD: user_id},
+            is_active=True,
+        )
+        .exists()
+    )
+    set_user_active(user_id, active)
+    return active
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """요청마다 users를 읽지 않는 JWT 인증 — request.user는 TokenUser."""
+
+    def get_user(self, validated_token) -> TokenUser:
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError as e:
+            raise InvalidToken(
+                _("Token contained no recognizable user identification")
+            ) from e
+
+        if not is_user_active(user_id):
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+
+        return TokenUser(validated_token)
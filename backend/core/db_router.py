@@ -0,0 +1,60 @@
+"""DB 라우터 — primary(default) / 읽기 복제본(replica) 분리
+
+- 쓰기와 마이그레이션은 항상 primary
+- 복제본 읽기는 조회 서비스가 read_db_for(user_id)로 명시적으로 선택
+  (QuerySet은 지연 평가되므로 .using(alias)로 alias를 고정해야 안전)
+- 사용자가 쓰기를 하면 mark_recent_write()로 REPLICA_STICKY_SECONDS 동안
+  해당 사용자의 읽기를 primary에 고정 (read-your-writes)
+"""
+
+from django.conf import settings
+from django.core.cache import cache
+
+PRIMARY_ALIAS = "default"
+REPLICA_ALIAS = "replica"
+STICKY_KEY_PREFIX = "db:sticky:"
+
+
+def replica_enabled() -> bool:
+    """DATABASE_REPLICA_URL이 설정되어 replica alias가 존재하는지."""
+    return REPLICA_ALIAS in settings.DATABASES
+
+
+def mark_recent_write(user_id: str) -> None:
+    """사용자의 다음 읽기들을 잠시 primary로 고정."""
+    if not replica_enabled():
+        return
+    cache.set(
+        f"{STICKY_KEY_PREFIX}{user_id}", 1, timeout=settings.REPLICA_STICKY_SECONDS
+    )
+
+
+def read_db_for(user_id: str) -> str:
+    """조회에 사용할 DB alias. 최근 쓰기가 있으면 primary."""
+    if not replica_enabled():
+        return PRIMARY_ALIAS
+    if cache.get(f"{STICKY_KEY_PREFIX}{user_id}"):
+        return PRIMARY_ALIAS
+    return REPLICA_ALIAS
+
+
+class PrimaryReplicaRouter:
+    """
+    기본 라우팅은 primary.
+
+    replica에서 읽은 인스턴스를 save()/delete()해도
+    db_for_write가 primary를 반환하므로 복제본에 쓰지 않습니다.
+    """
+
+    def db_for_read(self, model, **hints):
+        return PRIMARY_ALIAS
+
+    def db_for_write(self, model, **hints):
+        return PRIMARY_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # 두 alias는 같은 데이터를 가리키므로 관계 허용
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db == PRIMARY_ALIAS
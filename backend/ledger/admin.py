@@ -1,7 +1,7 @@
 from django.contrib import admin
 from unfold.admin import ModelAdmin
 
-from .models import Transaction
+from .models import Budget, RecurringRule, Transaction
 
 
 @admin.register(Transaction)
@@ -13,6 +13,28 @@ class TransactionAdmin(ModelAdmin):
         "category",
         "subcategory",
         "memo",
+        "deleted_at",
     ]
-    list_filter = ["type", "category", "occurred_date"]
+    list_filter = ["type", "category", "occurred_date", "deleted_at"]
     search_fields = ["memo", "merchant", "category", "subcategory"]
+
+
+@admin.register(Budget)
+class BudgetAdmin(ModelAdmin):
+    list_display = ["user_id", "month", "category", "amount"]
+    list_filter = ["month", "category"]
+
+
+@admin.register(RecurringRule)
+class RecurringRuleAdmin(ModelAdmin):
+    list_display = [
+        "user_id",
+        "frequency",
+        "category",
+        "merchant",
+        "amount",
+        "next_run_date",
+        "active",
+    ]
+    list_filter = ["frequency", "active"]
+    search_fields = ["merchant", "category", "memo"]
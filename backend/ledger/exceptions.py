@@ -28,11 +28,11 @@ class LLMAuthError(ApplicationError):
 
 
 class UndoTokenExpiredError(ApplicationError):
-    """Undo 토큰 만료 또는 유효하지 않음"""
+    """되돌릴 작업 그룹이 없음 (undo 스택이 비었거나 만료, 잘못된 토큰)"""
 
     status_code = 400
     default_detail = (
-        "undo_token이 만료됐거나 잘못됐습니다. 5분 이내에 다시 시도해주세요."
+        "되돌릴 작업이 없거나 undo_token이 만료됐습니다. 5분 이내에 다시 시도해주세요."
     )
     default_code = "undo_token_expired"
 
@@ -45,9 +45,25 @@ class TransactionNotFoundError(ApplicationError):
     default_code = "transaction_not_found"
 
 
+class TransactionConflictError(ApplicationError):
+    """수정 충돌 — 읽은 뒤 다른 요청이 먼저 수정함 (version 불일치)"""
+
+    status_code = 409
+    default_detail = "다른 곳에서 먼저 수정된 거래입니다. 다시 조회한 뒤 수정해주세요."
+    default_code = "transaction_conflict"
+
+
 class TransactionValueError(ApplicationError):
     """거래 내역 입력값 오류"""
 
     status_code = 400
     default_detail = "입력값이 올바르지 않습니다."
     default_code = "transaction_value_error"
+
+
+class ChatJobNotFoundError(ApplicationError):
+    """비동기 chat 작업이 없거나 만료됨"""
+
+    status_code = 404
+    default_detail = "작업을 찾을 수 없습니다. 만료되었거나 잘못된 job_id입니다."
+    default_code = "chat_job_not_found"
@@ -0,0 +1,214 @@
+"""user_key 백필 — 0009(expand)와 0010(contract) 사이에 실행 (PostgreSQL 전용)
+
+    python manage.py backfill_user_keys
+    python manage.py backfill_user_keys --batch-size 5000 --sleep 0.1
+
+1) PK 키셋 순서로 batch-size 행씩 user_key = user_id::bigint 를 채웁니다.
+   배치마다 커밋하므로 잠금은 해당 배치 행에만 잠깐 걸리고, 중단 후 재실행하면
+   user_key 가 비어 있는 행만 다시 채웁니다. 새 행은 0009 트리거가 채웁니다.
+2) 최종 인덱스와 같은 모양의 *_k 인덱스를 CONCURRENTLY 로 만듭니다.
+   파티션 테이블은 부모에 ON ONLY 로 만든 뒤 파티션별로 만들어 ATTACH 합니다.
+
+끝나면 정수로 변환할 수 없는 user_id 수를 출력합니다 (0이어야 0010 적용 가능).
+"""
+
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from ledger.partitions import PARTITIONED_TABLES, list_partitions
+
+# 테이블 → 키셋 순회에 쓸 PK 컬럼
+USER_KEY_TABLES = {
+    "transactions": "tx_id",
+    "idempotency_keys": "id",
+    "audit_logs": "event_id",
+}
+
+# (테이블, 최종 이름, UNIQUE 여부, 컬럼) — 0010 이 *_k 를 최종 이름으로 바꿈
+USER_KEY_INDEXES = [
+    (
+        "transactions",
+        "idx_tx_user_date_created",
+        False,
+        "(user_key, occurred_date DESC, created_at DESC)",
+    ),
+    (
+        "transactions",
+        "idx_tx_user_cat_date",
+        False,
+        "(user_key, category, occurred_date DESC)",
+    ),
+    (
+        "transactions",
+        "idx_tx_summary",
+        False,
+        "(user_key, type, occurred_date) INCLUDE (category, amount)",
+    ),
+    (
+        "transactions",
+        "idx_tx_user_amount",
+        False,
+        "(user_key, amount) INCLUDE (occurred_date, category, created_at)",
+    ),
+    ("audit_logs", "idx_audit_user_created", False, "(user_key, created_at DESC)"),
+    ("idempotency_keys", "pk_idempotency", True, "(user_key, idem_key)"),
+]
+
+USER_KEY_CAST = "CASE WHEN user_id ~ '^[0-9]+$' THEN user_id::bigint END"
+
+
+def _has_user_key(cursor, table: str) -> bool:
+    cursor.execute(
+        "SELECT 1 FROM information_schema.columns "
+        "WHERE table_name = %s AND column_name = 'user_key'",
+        [table],
+    )
+    return cursor.fetchone() is not None
+
+
+def _index_valid(cursor, name: str) -> bool | None:
+    """인덱스 유효 여부 (없으면 None). CONCURRENTLY 가 중단되면 INVALID 로 남음."""
+    cursor.execute(
+        "SELECT x.indisvalid FROM pg_index x JOIN pg_class c ON c.oid = x.indexrelid "
+        "WHERE c.relname = %s",
+        [name],
+    )
+    row = cursor.fetchone()
+    return None if row is None else row[0]
+
+
+def _attached_tables(cursor, parent_index: str) -> set[str]:
+    """부모 인덱스에 ATTACH 된 파티션 인덱스들의 테이블 이름."""
+    cursor.execute(
+        """
+        SELECT t.relname
+        FROM pg_inherits i
+        JOIN pg_class p ON p.oid = i.inhparent
+        JOIN pg_index x ON x.indexrelid = i.inhrelid
+        JOIN pg_class t ON t.oid = x.indrelid
+        WHERE p.relname = %s
+        """,
+        [parent_index],
+    )
+    return {row[0] for row in cursor.fetchall()}
+
+
+class Command(BaseCommand):
+    help = "user_key(bigint)를 배치로 채우고 user_key 인덱스를 온라인으로 생성"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=10_000)
+        parser.add_argument(
+            "--sleep",
+            type=float,
+            default=0.0,
+            help="배치 사이 대기 초 (복제 지연/부하 조절)",
+        )
+        parser.add_argument(
+            "--skip-indexes",
+            action="store_true",
+            help="백필만 하고 인덱스 생성은 건너뜀",
+        )
+
+    def handle(self, *args, **options):
+        if connection.vendor != "postgresql":
+            self.stdout.write(
+                "PostgreSQL이 아니므로 건너뜁니다 (0010 마이그레이션이 테이블을 변환)."
+            )
+            return
+
+        with connection.cursor() as cursor:
+            missing = [t for t in USER_KEY_TABLES if not _has_user_key(cursor, t)]
+        if missing:
+            raise CommandError(
+                f"user_key 컬럼이 없습니다: {', '.join(missing)} "
+                f"(0009 미적용 또는 0010 적용 완료)"
+            )
+
+        invalid = 0
+        for table, pk in USER_KEY_TABLES.items():
+            invalid += self._backfill(
+                table, pk, options["batch_size"], options["sleep"]
+            )
+
+        if not options["skip_indexes"]:
+            for table, name, unique, columns in USER_KEY_INDEXES:
+                self._build_index(table, f"{name}_k", unique, columns)
+
+        if invalid:
+            self.stdout.write(
+                self.style.WARNING(
+                    f"정수로 변환할 수 없는 user_id {invalid:,}건 — 0010 적용 전 정리 필요"
+                )
+            )
+        else:
+            self.stdout.write(self.style.SUCCESS("user_key 백필 완료"))
+
+    def _backfill(self, table: str, pk: str, batch_size: int, sleep: float) -> int:
+        """table 의 user_key 를 채우고 변환 불가 행 수를 반환."""
+        last = None
+        updated = 0
+        while True:
+            with connection.cursor() as cursor:
+                # 배치 상한 키 — PK 인덱스만 읽음
+                where = f"WHERE {pk} > %s " if last is not None else ""
+                cursor.execute(
+                    f"SELECT MAX({pk}) FROM ("
+                    f"  SELECT {pk} FROM {table} {where}ORDER BY {pk} LIMIT %s"
+                    f") batch",
+                    ([last] if last is not None else []) + [batch_size],
+                )
+                upper = cursor.fetchone()[0]
+                if upper is None:
+                    break
+
+                lower = f"{pk} > %s AND " if last is not None else ""
+                cursor.execute(
+                    f"UPDATE {table} SET user_key = {USER_KEY_CAST} "
+                    f"WHERE {lower}{pk} <= %s AND user_key IS NULL",
+                    ([last] if last is not None else []) + [upper],
+                )
+                updated += cursor.rowcount
+            last = upper
+            self.stdout.write(f"{table}: {updated:,}행 갱신")
+            if sleep:
+                time.sleep(sleep)
+
+        with connection.cursor() as cursor:
+            cursor.execute(f"SELECT COUNT(*) FROM {table} WHERE user_key IS NULL")
+            return cursor.fetchone()[0]
+
+    def _build_index(self, table: str, name: str, unique: bool, columns: str) -> None:
+        kind = "UNIQUE INDEX" if unique else "INDEX"
+        with connection.cursor() as cursor:
+            if table not in PARTITIONED_TABLES:
+                if _index_valid(cursor, name) is False:
+                    cursor.execute(f"DROP INDEX CONCURRENTLY {name}")
+                cursor.execute(
+                    f"CREATE {kind} CONCURRENTLY IF NOT EXISTS {name} "
+                    f"ON {table} {columns}"
+                )
+                self.stdout.write(f"인덱스: {name}")
+                return
+
+            # 파티션 테이블은 CONCURRENTLY 불가 → 부모는 ON ONLY(INVALID)로 만들고
+            # 파티션 인덱스를 모두 ATTACH 하면 부모가 VALID 가 됨
+            cursor.execute(
+                f"CREATE {kind} IF NOT EXISTS {name} ON ONLY {table} {columns}"
+            )
+            attached = _attached_tables(cursor, name)
+            for partition in list_partitions(cursor, table):
+                # 도중에 생긴 파티션은 인덱스가 자동으로 만들어져 붙어 있음
+                if partition in attached:
+                    continue
+                child = f"{partition}_{name}"
+                if _index_valid(cursor, child) is False:
+                    cursor.execute(f"DROP INDEX CONCURRENTLY {child}")
+                cursor.execute(
+                    f"CREATE {kind} CONCURRENTLY IF NOT EXISTS {child} "
+                    f"ON {partition} {columns}"
+                )
+                cursor.execute(f"ALTER INDEX {name} ATTACH PARTITION {child}")
+            self.stdout.write(f"인덱스: {name} ({table} 파티션별)")
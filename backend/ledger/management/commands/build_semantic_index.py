@@ -0,0 +1,56 @@
+"""의미 검색 인덱스 일괄 생성 — 기존 거래/일괄 입력 후 배치 임베딩
+
+    python manage.py build_semantic_index
+    python manage.py build_semantic_index --user-id 42 --batch-size 512
+
+SEMANTIC_SEARCH_MODEL이 설정되어 있어야 합니다.
+대상 사용자의 기존 벡터를 지운 뒤 batch-size 단위로 임베딩해 다시 채웁니다.
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+from django_redis import get_redis_connection
+
+from ledger.models import Transaction
+from ledger.services.semantic_index import (
+    VECTOR_KEY_PREFIX,
+    VERSION_KEY_PREFIX,
+    index_transactions,
+    semantic_enabled,
+)
+
+
+class Command(BaseCommand):
+    help = "거래 merchant/memo/source_text를 배치 임베딩해 의미 검색 인덱스 재구성"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--user-id", help="특정 사용자만 재구성")
+        parser.add_argument("--batch-size", type=int, default=256)
+
+    def handle(self, *args, **options):
+        if not semantic_enabled():
+            raise CommandError("SEMANTIC_SEARCH_MODEL이 설정되지 않았습니다.")
+
+        qs = Transaction.objects.all()
+        if options["user_id"]:
+            qs = qs.filter(user_id=options["user_id"])
+
+        pipe = get_redis_connection("default").pipeline()
+        # Meta.ordering 을 지워야 DISTINCT가 사용자 단위로 계산됨
+        for user_id in qs.values_list("user_id", flat=True).order_by().distinct():
+            pipe.delete(f"{VECTOR_KEY_PREFIX}{user_id}")
+            pipe.incr(f"{VERSION_KEY_PREFIX}{user_id}")
+        pipe.execute()
+
+        batch, indexed = [], 0
+        fields = ("tx_id", "user_id", "merchant", "memo", "source_text")
+        for tx in qs.only(*fields).iterator(chunk_size=options["batch_size"]):
+            batch.append(tx)
+            if len(batch) >= options["batch_size"]:
+                indexed += index_transactions(batch)
+                batch = []
+        if batch:
+            indexed += index_transactions(batch)
+
+        self.stdout.write(
+            self.style.SUCCESS(f"의미 검색 인덱스: {indexed}건 임베딩 완료")
+        )
@@ -0,0 +1,65 @@
+"""월 파티션 유지보수 — 다가올 월 파티션 생성 + 오래된 audit_logs 파티션 정리
+
+cron 예시 (매일 03:00):
+    0 3 * * * cd backend && python manage.py manage_partitions --drop
+"""
+
+from datetime import date
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+
+from ledger.partitions import (
+    PARTITIONED_TABLES,
+    add_months,
+    detach_partitions_before,
+    ensure_month_partition,
+)
+
+
+class Command(BaseCommand):
+    help = "transactions/audit_logs 월 파티션 생성 및 audit_logs 보존기간 정리"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--months-ahead",
+            type=int,
+            default=3,
+            help="이번 달 이후 미리 만들어 둘 파티션 개월 수 (기본 3)",
+        )
+        parser.add_argument(
+            "--retention-months",
+            type=int,
+            default=settings.AUDIT_RETENTION_MONTHS,
+            help="audit_logs 보존 개월 수 (기본 AUDIT_RETENTION_MONTHS)",
+        )
+        parser.add_argument(
+            "--drop",
+            action="store_true",
+            help="보존기간이 지난 audit_logs 파티션을 분리 후 삭제 (기본: 분리만)",
+        )
+
+    def handle(self, *args, **options):
+        if connection.vendor != "postgresql":
+            self.stdout.write("PostgreSQL이 아니므로 파티션 관리를 건너뜁니다.")
+            return
+
+        this_month = date.today().replace(day=1)
+
+        with transaction.atomic(), connection.cursor() as cursor:
+            for table in PARTITIONED_TABLES:
+                for offset in range(options["months_ahead"] + 1):
+                    month_start = add_months(this_month, offset)
+                    if ensure_month_partition(cursor, table, month_start):
+                        self.stdout.write(f"생성: {table} {month_start:%Y-%m}")
+
+            cutoff = add_months(this_month, -options["retention_months"])
+            handled = detach_partitions_before(
+                cursor, "audit_logs", cutoff, drop=options["drop"]
+            )
+            verb = "삭제" if options["drop"] else "분리"
+            for name in handled:
+                self.stdout.write(f"{verb}: {name}")
+
+        self.stdout.write(self.style.SUCCESS("파티션 유지보수 완료"))
@@ -0,0 +1,54 @@
+"""삭제 표시된 거래 정리 — 보존기간이 지난 tombstone을 배치로 실제 삭제
+
+    python manage.py purge_deleted_transactions
+    python manage.py purge_deleted_transactions --retention-days 7 --batch-size 5000
+
+삭제/취소는 deleted_at만 기록하므로 보존기간 안에서는 UPDATE 한 번으로 되돌릴 수 있습니다.
+배치마다 커밋하므로 오래 잠그지 않으며, 중단 후 재실행해도 안전합니다.
+
+cron 예시 (매일 04:00):
+    0 4 * * * cd backend && python manage.py purge_deleted_transactions
+"""
+
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from ledger.services.transaction_command import TransactionCommandService
+
+
+class Command(BaseCommand):
+    help = "보존기간이 지난 삭제 표시 거래를 배치 단위로 실제 삭제"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--retention-days",
+            type=int,
+            default=settings.DELETED_TX_RETENTION_DAYS,
+            help="삭제 표시 후 보존 일수 (기본 DELETED_TX_RETENTION_DAYS)",
+        )
+        parser.add_argument("--batch-size", type=int, default=1000)
+        parser.add_argument(
+            "--sleep", type=float, default=0.0, help="배치 사이 대기 초 (부하 조절)"
+        )
+
+    def handle(self, *args, **options):
+        before = timezone.now() - timedelta(days=options["retention_days"])
+
+        purged = 0
+        for count in TransactionCommandService.purge_deleted(
+            before, batch_size=options["batch_size"]
+        ):
+            purged += count
+            self.stdout.write(f"{purged:,}건 삭제")
+            if options["sleep"]:
+                time.sleep(options["sleep"])
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"삭제 표시 거래 {purged:,}건 정리 (기준 {before:%Y-%m-%d})"
+            )
+        )
@@ -0,0 +1,75 @@
+"""감사로그 워커 — Redis Stream(audit:events) → audit_logs bulk_create
+
+AUDIT_WRITER=stream 일 때 별도 프로세스로 상시 실행합니다.
+사용자별 순서 보장을 위해 워커는 1개만 띄우세요.
+
+    python manage.py run_audit_writer
+
+ACK되지 않고 --claim-idle-ms 이상 지난 pending 항목(죽은 워커의 몫 포함)은
+시작 시와 이후 주기적으로 XAUTOCLAIM으로 회수해 다시 저장합니다.
+"""
+
+import socket
+import time
+
+from django.core.management.base import BaseCommand
+
+from ledger.services.audit import (
+    claim_stale_events,
+    ensure_consumer_group,
+    flush_audit_events,
+)
+
+
+class Command(BaseCommand):
+    help = "Redis Stream의 감사 이벤트를 audit_logs에 일괄 저장"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=500)
+        parser.add_argument(
+            "--block-ms",
+            type=int,
+            default=1000,
+            help="새 이벤트 대기 시간(ms)",
+        )
+        parser.add_argument(
+            "--consumer",
+            default=socket.gethostname(),
+            help="컨슈머 이름 (기본: 호스트명 — 재시작해도 같은 이름)",
+        )
+        parser.add_argument(
+            "--claim-idle-ms",
+            type=int,
+            default=60_000,
+            help="이 시간 이상 ACK되지 않은 pending 항목을 회수해 재처리",
+        )
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="쌓인 이벤트를 모두 처리하면 종료",
+        )
+
+    def handle(self, *args, **options):
+        ensure_consumer_group()
+        consumer = options["consumer"]
+        batch_size = options["batch_size"]
+
+        claim_idle_ms = options["claim_idle_ms"]
+
+        # 1) 이전 실행(또는 죽은 다른 컨슈머)이 ACK하지 못한 항목 회수
+        total = claim_stale_events(consumer, batch_size, claim_idle_ms)
+        next_claim = time.monotonic() + claim_idle_ms / 1000
+
+        # 2) 새 이벤트 처리 (+ 주기적으로 pending 회수)
+        while True:
+            written = flush_audit_events(
+                consumer, batch_size, block_ms=options["block_ms"]
+            )
+            if time.monotonic() >= next_claim:
+                written += claim_stale_events(consumer, batch_size, claim_idle_ms)
+                next_claim = time.monotonic() + claim_idle_ms / 1000
+            total += written
+            if options["once"] and not written:
+                break
+
+        self.stdout.write(self.style.SUCCESS(f"감사 이벤트 {total}건 저장"))
@@ -0,0 +1,75 @@
+"""Chat 비동기 작업 워커 — POST /chat/ (async_mode=true) 요청 처리
+
+    python manage.py run_chat_worker --threads 8
+
+LLM 호출은 I/O 대기가 대부분이므로 스레드로 동시 처리하고,
+프로바이더별 동시 실행 수는 CHAT_JOB_PROVIDER_CONCURRENCY로 제한됩니다.
+별도 스레드가 주기적으로 reap_stale_jobs()를 돌려 죽은 워커의 작업을 정리합니다.
+"""
+
+import logging
+import threading
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from ledger.services.chat_jobs import reap_stale_jobs, run_next_chat_job
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = "Redis 큐의 chat 작업을 실행 (run_agent_loop)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--threads", type=int, default=4)
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="큐가 비면 종료",
+        )
+
+    def handle(self, *args, **options):
+        stop = threading.Event()
+
+        def _loop():
+            while not stop.is_set():
+                try:
+                    handled = run_next_chat_job(timeout=1 if options["once"] else 5)
+                finally:
+                    close_old_connections()
+                if options["once"] and not handled:
+                    break
+
+        def _reap():
+            interval = max(settings.CHAT_JOB_LEASE_SECONDS / 4, 1)
+            while True:  # 시작하자마자 한 번, 이후 interval 마다
+                try:
+                    counts = reap_stale_jobs()
+                    if counts.get("requeued") or counts.get("failed"):
+                        logger.warning("중단된 chat 작업 정리: %s", counts)
+                except Exception:
+                    logger.exception("chat 작업 정리 실패")
+                if stop.wait(interval):
+                    break
+
+        threads = [
+            threading.Thread(target=_loop, name=f"chat-worker-{i}", daemon=True)
+            for i in range(options["threads"])
+        ]
+        for t in threads:
+            t.start()
+        reaper = threading.Thread(target=_reap, name="chat-reaper", daemon=True)
+        reaper.start()
+        self.stdout.write(f"chat 워커 {len(threads)}개 스레드 시작")
+        try:
+            for t in threads:
+                t.join()
+        except KeyboardInterrupt:
+            stop.set()
+            for t in threads:
+                t.join()
+        stop.set()
+        reaper.join()
+        self.stdout.write(self.style.SUCCESS("chat 워커 종료"))
@@ -0,0 +1,58 @@
+"""반복 거래 스케줄러 — 도래한 RecurringRule을 거래로 생성
+
+    python manage.py run_recurring_scheduler
+    python manage.py run_recurring_scheduler --date 2026-03-01 --chunk-size 5000
+
+매일 1회(cron 등) 실행하세요. (규칙, 회차)별 멱등성 키로 중복 생성되지 않으므로
+재실행하거나 여러 번 겹쳐 실행해도 안전합니다.
+"""
+
+from datetime import date
+
+from django.core.management.base import BaseCommand, CommandError
+
+from ledger.services.recurring import run_due_rules
+
+
+class Command(BaseCommand):
+    help = "next_run_date가 도래한 반복 거래 규칙을 청크 단위로 거래 생성"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--date", help="기준일 YYYY-MM-DD (기본: 오늘)")
+        parser.add_argument("--chunk-size", type=int, default=1000)
+        parser.add_argument(
+            "--max-catch-up",
+            type=int,
+            default=12,
+            help="규칙당 한 번에 만들 밀린 회차 수 상한",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            today = date.fromisoformat(options["date"]) if options["date"] else None
+        except ValueError:
+            raise CommandError("--date는 YYYY-MM-DD 형식이어야 합니다.")
+
+        rules = created = skipped = invalid = 0
+        for chunk in run_due_rules(
+            today=today,
+            chunk_size=options["chunk_size"],
+            max_catch_up=options["max_catch_up"],
+        ):
+            rules += chunk["rules"]
+            created += len(chunk["created"])
+            skipped += chunk["skipped"]
+            invalid += len(chunk["invalid"])
+            self.stdout.write(
+                f"규칙 {rules:,}개 처리 (생성 {created:,}건, 중복 건너뜀 {skipped:,}건)"
+            )
+
+        if invalid:
+            self.stdout.write(
+                self.style.WARNING(f"잘못된 규칙 {invalid:,}개 비활성화 (로그 확인)")
+            )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"반복 거래: 규칙 {rules:,}개, 거래 {created:,}건 생성, {skipped:,}건 건너뜀"
+            )
+        )
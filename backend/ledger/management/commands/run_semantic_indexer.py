@@ -0,0 +1,42 @@
+"""의미 검색 색인 워커 — 새 거래 임베딩 (txvec:pending → txvec:{user_id})
+
+SEMANTIC_SEARCH_MODEL을 켰다면 별도 프로세스로 상시 실행합니다.
+거래 생성 요청은 tx_id만 대기열에 넣고, 임베딩(CPU)은 이 워커가 배치로 처리합니다.
+
+    python manage.py run_semantic_indexer --batch-size 256
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import close_old_connections
+
+from ledger.services.semantic_index import index_pending, semantic_enabled
+
+
+class Command(BaseCommand):
+    help = "색인 대기열의 거래를 배치 임베딩해 의미 검색 인덱스에 추가"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=256)
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="대기열이 비면 종료",
+        )
+
+    def handle(self, *args, **options):
+        if not semantic_enabled():
+            raise CommandError("SEMANTIC_SEARCH_MODEL이 설정되지 않았습니다.")
+
+        total = 0
+        while True:
+            try:
+                handled = index_pending(
+                    options["batch_size"], timeout=1 if options["once"] else 5
+                )
+            finally:
+                close_old_connections()
+            total += handled
+            if options["once"] and not handled:
+                break
+
+        self.stdout.write(self.style.SUCCESS(f"의미 검색 색인: 대기열 {total}건 처리"))
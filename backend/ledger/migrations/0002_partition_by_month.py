@@ -0,0 +1,102 @@
+# Generated by Django 5.2.18 on 2026-10-19 11:21
+
+from datetime import date
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+# (테이블, PK, 파티션 키) — PostgreSQL 파티션 테이블의 PK는 파티션 키를 포함해야 함
+PARTITION_SPECS = [
+    ("transactions", "tx_id", "occurred_date"),
+    ("audit_logs", "event_id", "created_at"),
+]
+# 초기 변환 시 월 파티션을 만들 범위 (이보다 오래된 행은 default 파티션)
+BACKFILL_MONTHS = 24
+MONTHS_AHEAD = 3
+
+
+def _add_months(month_start, months):
+    index = month_start.year * 12 + (month_start.month - 1) + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def _bound(column, month_start):
+    if column == "created_at":
+        return f"{month_start.isoformat()} 00:00:00+00"
+    return month_start.isoformat()
+
+
+def partition_tables(apps, schema_editor):
+    """기존 heap 테이블 → 월 단위 Range 파티션 테이블로 변환 (PostgreSQL 전용)."""
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    this_month = date.today().replace(day=1)
+    with schema_editor.connection.cursor() as cursor:
+        for table, pk, column in PARTITION_SPECS:
+            heap = f"{table}_heap"
+
+            cursor.execute(
+                "SELECT indexname, indexdef FROM pg_indexes "
+                "WHERE tablename = %s AND indexname <> %s",
+                [table, f"{table}_pkey"],
+            )
+            indexes = cursor.fetchall()
+
+            cursor.execute(f"ALTER TABLE {table} RENAME TO {heap}")
+            for name, _ in indexes:
+                cursor.execute(f"DROP INDEX {name}")
+            cursor.execute(f"ALTER TABLE {heap} DROP CONSTRAINT {table}_pkey")
+
+            cursor.execute(
+                f"CREATE TABLE {table} "
+                f"(LIKE {heap} INCLUDING DEFAULTS INCLUDING CONSTRAINTS) "
+                f"PARTITION BY RANGE ({column})"
+            )
+            cursor.execute(
+                f"ALTER TABLE {table} ADD CONSTRAINT {table}_pkey "
+                f"PRIMARY KEY ({pk}, {column})"
+            )
+            cursor.execute(f"CREATE TABLE {table}_default PARTITION OF {table} DEFAULT")
+
+            cursor.execute(f"SELECT MIN({column})::date FROM {heap}")
+            oldest = cursor.fetchone()[0]
+            first = _add_months(this_month, -BACKFILL_MONTHS)
+            if oldest:
+                first = max(first, oldest.replace(day=1))
+            month = first
+            while month <= _add_months(this_month, MONTHS_AHEAD):
+                cursor.execute(
+                    f"CREATE TABLE {table}_p{month:%Y%m} PARTITION OF {table} "
+                    f"FOR VALUES FROM ('{_bound(column, month)}') "
+                    f"TO ('{_bound(column, _add_months(month, 1))}')"
+                )
+                month = _add_months(month, 1)
+
+            # 부모에 만든 인덱스는 모든 파티션에 전파됨
+            for _, indexdef in indexes:
+                cursor.execute(indexdef)
+
+            cursor.execute(f"INSERT INTO {table} SELECT * FROM {heap}")
+            cursor.execute(f"DROP TABLE {heap}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ledger', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='auditlog',
+            name='tx',
+            field=models.ForeignKey(blank=True, db_column='tx_id', db_constraint=False, null=True, on_delete=django.db.models.deletion.SET_NULL, to='ledger.transaction'),
+        ),
+        migrations.AlterField(
+            model_name='idempotencykey',
+            name='tx',
+            field=models.ForeignKey(db_column='tx_id', db_constraint=False, on_delete=django.db.models.deletion.CASCADE, to='ledger.transaction'),
+        ),
+        migrations.RunPython(partition_tables),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 5.2.18 on 2026-10-19 11:24
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ledger", "0003_auditlog_created_at_default"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="auditlog",
+            name="tx",
+            field=models.ForeignKey(
+                blank=True,
+                db_column="tx_id",
+                db_constraint=False,
+                null=True,
+                on_delete=django.db.models.deletion.DO_NOTHING,
+                to="ledger.transaction",
+            ),
+        ),
+    ]
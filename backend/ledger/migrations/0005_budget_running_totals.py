@@ -0,0 +1,97 @@
+# Generated by Django 5.2.18 on 2026-10-19 11:42
+
+from django.db import migrations, models
+from django.db.models import Sum
+from django.db.models.functions import TruncMonth
+
+
+def backfill_month_totals(apps, schema_editor):
+    """기존 지출 거래로 (사용자, 월, 카테고리) 누계 초기화."""
+    Transaction = apps.get_model("ledger", "Transaction")
+    CategoryMonthTotal = apps.get_model("ledger", "CategoryMonthTotal")
+    rows = (
+        Transaction.objects.filter(type="expense")
+        .annotate(month_start=TruncMonth("occurred_date"))
+        .values("user_id", "month_start", "category")
+        .annotate(spent=Sum("amount"))
+        .order_by()
+    )
+    CategoryMonthTotal.objects.bulk_create(
+        (
+            CategoryMonthTotal(
+                user_id=row["user_id"],
+                month=row["month_start"].strftime("%Y-%m"),
+                category=row["category"],
+                spent=row["spent"],
+            )
+            for row in rows.iterator()
+        ),
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ledger", "0004_auditlog_keep_tx_id"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Budget",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("user_id", models.TextField()),
+                ("month", models.TextField()),
+                ("category", models.TextField()),
+                ("amount", models.BigIntegerField()),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "db_table": "budgets",
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("user_id", "month", "category"),
+                        name="uq_budget_month_cat",
+                    )
+                ],
+            },
+        ),
+        migrations.CreateModel(
+            name="CategoryMonthTotal",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("user_id", models.TextField()),
+                ("month", models.TextField()),
+                ("category", models.TextField()),
+                ("spent", models.BigIntegerField(default=0)),
+            ],
+            options={
+                "db_table": "category_month_totals",
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("user_id", "month", "category"),
+                        name="uq_cat_month_total",
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(backfill_month_totals, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,75 @@
+# Generated by Django 5.2.18 on 2026-10-19 11:46
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ledger", "0005_budget_running_totals"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="RecurringRule",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("user_id", models.TextField()),
+                (
+                    "type",
+                    models.TextField(
+                        choices=[("expense", "지출"), ("income", "수입")],
+                        default="expense",
+                    ),
+                ),
+                ("amount", models.IntegerField()),
+                ("currency", models.TextField(default="KRW")),
+                ("category", models.TextField()),
+                ("subcategory", models.TextField(default="기타")),
+                ("merchant", models.TextField(blank=True, null=True)),
+                ("memo", models.TextField(blank=True, null=True)),
+                (
+                    "frequency",
+                    models.TextField(
+                        choices=[("monthly", "매월"), ("weekly", "매주")],
+                        default="monthly",
+                    ),
+                ),
+                (
+                    "day_of_month",
+                    models.PositiveSmallIntegerField(blank=True, null=True),
+                ),
+                ("start_date", models.DateField()),
+                ("end_date", models.DateField(blank=True, null=True)),
+                ("next_run_date", models.DateField()),
+                ("active", models.BooleanField(default=True)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "db_table": "recurring_rules",
+                "indexes": [
+                    models.Index(
+                        condition=models.Q(("active", True)),
+                        fields=["next_run_date", "id"],
+                        name="idx_rule_due",
+                    ),
+                    models.Index(fields=["user_id"], name="idx_rule_user"),
+                ],
+                "constraints": [
+                    models.CheckConstraint(
+                        condition=models.Q(("amount__gt", 0)),
+                        name="ck_rule_amount_positive",
+                    )
+                ],
+            },
+        ),
+    ]
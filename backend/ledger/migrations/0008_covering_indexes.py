@@ -0,0 +1,56 @@
+# Generated by Django 5.2.18 on 2026-10-19 11:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ledger", "0007_uuid7_primary_keys"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="transaction",
+            index=models.Index(
+                fields=["user_id", "-occurred_date", "-created_at"],
+                name="idx_tx_user_date_created",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="transaction",
+            index=models.Index(
+                fields=["user_id", "category", "-occurred_date"],
+                name="idx_tx_user_cat_date",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="transaction",
+            index=models.Index(
+                fields=["user_id", "type", "occurred_date"],
+                include=("category", "amount"),
+                name="idx_tx_summary",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="transaction",
+            index=models.Index(
+                fields=["user_id", "amount"],
+                include=("occurred_date", "category", "created_at"),
+                name="idx_tx_user_amount",
+            ),
+        ),
+        # 새 인덱스를 만든 뒤 대체된 인덱스 제거 (idx_tx_user_subcat은 등치 조회가 없어 미사용)
+        migrations.RemoveIndex(
+            model_name="transaction",
+            name="idx_tx_user_date",
+        ),
+        migrations.RemoveIndex(
+            model_name="transaction",
+            name="idx_tx_user_cat",
+        ),
+        migrations.RemoveIndex(
+            model_name="transaction",
+            name="idx_tx_user_subcat",
+        ),
+    ]
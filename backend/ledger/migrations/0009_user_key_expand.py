@@ -0,0 +1,62 @@
+"""user_id text → bigint 1단계 (expand) — PostgreSQL 전용, 컬럼 추가만 수행
+
+    1) transactions / idempotency_keys / audit_logs 에 user_key bigint NULL 추가
+       (NULL 허용 + 기본값 없음이라 테이블 재작성 없이 카탈로그만 변경)
+    2) BEFORE INSERT/UPDATE 트리거가 새 행의 user_key = user_id::bigint 를 채움
+
+이전 릴리스가 동작 중에 적용해도 안전합니다 (ORM은 user_key를 모름).
+기존 행 채우기와 user_key 인덱스 생성은 backfill_user_keys 명령이 배치로 수행하고,
+0010이 user_id 를 user_key 로 교체합니다. 모델 상태는 바꾸지 않습니다.
+"""
+
+from django.db import migrations
+
+USER_KEY_TABLES = ["transactions", "idempotency_keys", "audit_logs"]
+
+
+def add_user_key(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    with schema_editor.connection.cursor() as cursor:
+        # 긴 쿼리 뒤에서 ACCESS EXCLUSIVE 잠금을 기다리며 다른 요청을 막지 않도록
+        cursor.execute("SET LOCAL lock_timeout = '5s'")
+        cursor.execute("""
+            CREATE OR REPLACE FUNCTION ledger_sync_user_key() RETURNS trigger AS $$
+            BEGIN
+                NEW.user_key := CASE WHEN NEW.user_id ~ '^[0-9]+$'
+                                     THEN NEW.user_id::bigint END;
+                RETURN NEW;
+            END
+            $$ LANGUAGE plpgsql
+            """)
+        for table in USER_KEY_TABLES:
+            cursor.execute(f"ALTER TABLE {table} ADD COLUMN user_key bigint")
+            cursor.execute(
+                f"CREATE TRIGGER trg_{table}_user_key "
+                f"BEFORE INSERT OR UPDATE OF user_id ON {table} "
+                f"FOR EACH ROW EXECUTE FUNCTION ledger_sync_user_key()"
+            )
+
+
+def drop_user_key(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    with schema_editor.connection.cursor() as cursor:
+        for table in USER_KEY_TABLES:
+            cursor.execute(f"DROP TRIGGER IF EXISTS trg_{table}_user_key ON {table}")
+            # user_key 인덱스도 함께 삭제됨
+            cursor.execute(f"ALTER TABLE {table} DROP COLUMN IF EXISTS user_key")
+        cursor.execute("DROP FUNCTION IF EXISTS ledger_sync_user_key()")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ledger", "0008_covering_indexes"),
+    ]
+
+    operations = [
+        migrations.RunPython(add_user_key, drop_user_key),
+    ]
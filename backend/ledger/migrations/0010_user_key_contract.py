@@ -0,0 +1,180 @@
+"""user_id text → bigint 2단계 (contract) — backfill_user_keys 완료 후 적용
+
+PostgreSQL (테이블별, ACCESS EXCLUSIVE 잠금 안에서):
+    트리거 제거 → 남은 행 보정 → user_id(text) 삭제 (기존 인덱스/제약 함께 삭제)
+    → user_key 를 user_id 로 이름 변경 → NOT NULL → *_k 인덱스를 최종 이름으로 변경
+인덱스는 backfill_user_keys 가 미리 만들어 두므로 잠금 구간에는 카탈로그 변경과
+NOT NULL 검증 스캔만 남습니다. 명령을 건너뛴 개발 DB면 여기서 인덱스를 만듭니다.
+
+그 외 DB (SQLite 등)는 테이블 재작성으로 컬럼 타입만 바꿉니다.
+budgets / category_month_totals / recurring_rules 는 작아서 AlterField 로 바로 변환합니다.
+"""
+
+from django.db import migrations, models
+
+USER_KEY_TABLES = ["transactions", "idempotency_keys", "audit_logs"]
+USER_KEY_MODELS = ["transaction", "idempotencykey", "auditlog"]
+
+# (테이블, 최종 이름, UNIQUE 여부, 컬럼) — 모델 Meta 의 인덱스/제약과 같은 모양
+USER_KEY_INDEXES = [
+    (
+        "transactions",
+        "idx_tx_user_date_created",
+        False,
+        "(user_key, occurred_date DESC, created_at DESC)",
+    ),
+    (
+        "transactions",
+        "idx_tx_user_cat_date",
+        False,
+        "(user_key, category, occurred_date DESC)",
+    ),
+    (
+        "transactions",
+        "idx_tx_summary",
+        False,
+        "(user_key, type, occurred_date) INCLUDE (category, amount)",
+    ),
+    (
+        "transactions",
+        "idx_tx_user_amount",
+        False,
+        "(user_key, amount) INCLUDE (occurred_date, category, created_at)",
+    ),
+    ("audit_logs", "idx_audit_user_created", False, "(user_key, created_at DESC)"),
+    ("idempotency_keys", "pk_idempotency", True, "(user_key, idem_key)"),
+]
+
+USER_KEY_CAST = "CASE WHEN user_id ~ '^[0-9]+$' THEN user_id::bigint END"
+
+
+def _bigint_field(model):
+    field = models.BigIntegerField()
+    field.set_attributes_from_name("user_id")
+    field.model = model
+    return field
+
+
+def _index_valid(cursor, name):
+    cursor.execute(
+        "SELECT x.indisvalid FROM pg_index x JOIN pg_class c ON c.oid = x.indexrelid "
+        "WHERE c.relname = %s",
+        [name],
+    )
+    row = cursor.fetchone()
+    return None if row is None else row[0]
+
+
+def swap_user_key(apps, schema_editor):
+    connection = schema_editor.connection
+    if connection.vendor != "postgresql":
+        for model_name in USER_KEY_MODELS:
+            model = apps.get_model("ledger", model_name)
+            schema_editor.alter_field(
+                model, model._meta.get_field("user_id"), _bigint_field(model)
+            )
+        return
+
+    with connection.cursor() as cursor:
+        for table in USER_KEY_TABLES:
+            cursor.execute(f"LOCK TABLE {table} IN ACCESS EXCLUSIVE MODE")
+            cursor.execute(f"DROP TRIGGER IF EXISTS trg_{table}_user_key ON {table}")
+            cursor.execute(
+                f"UPDATE {table} SET user_key = {USER_KEY_CAST} WHERE user_key IS NULL"
+            )
+            cursor.execute(f"SELECT COUNT(*) FROM {table} WHERE user_key IS NULL")
+            invalid = cursor.fetchone()[0]
+            if invalid:
+                raise RuntimeError(
+                    f"{table}: 정수로 변환할 수 없는 user_id {invalid}건 — "
+                    f"정리한 뒤 다시 migrate 하세요."
+                )
+
+            for index_table, name, unique, columns in USER_KEY_INDEXES:
+                if index_table != table:
+                    continue
+                valid = _index_valid(cursor, f"{name}_k")
+                if valid is None:
+                    cursor.execute(
+                        f"CREATE {'UNIQUE ' if unique else ''}INDEX {name}_k "
+                        f"ON {table} {columns}"
+                    )
+                elif not valid:
+                    raise RuntimeError(
+                        f"{name}_k 인덱스가 완성되지 않았습니다 — "
+                        f"backfill_user_keys 를 다시 실행하세요."
+                    )
+
+            cursor.execute(f"ALTER TABLE {table} DROP COLUMN user_id")
+            cursor.execute(f"ALTER TABLE {table} RENAME COLUMN user_key TO user_id")
+            cursor.execute(f"ALTER TABLE {table} ALTER COLUMN user_id SET NOT NULL")
+
+            for index_table, name, unique, _ in USER_KEY_INDEXES:
+                if index_table != table:
+                    continue
+                if unique:
+                    cursor.execute(
+                        f"ALTER TABLE {table} ADD CONSTRAINT {name} "
+                        f"UNIQUE USING INDEX {name}_k"
+                    )
+                else:
+                    cursor.execute(f"ALTER INDEX {name}_k RENAME TO {name}")
+
+        cursor.execute("DROP FUNCTION IF EXISTS ledger_sync_user_key()")
+
+
+def restore_text_user_id(apps, schema_editor):
+    connection = schema_editor.connection
+    if connection.vendor != "postgresql":
+        for model_name in USER_KEY_MODELS:
+            model = apps.get_model("ledger", model_name)
+            schema_editor.alter_field(
+                model, _bigint_field(model), model._meta.get_field("user_id")
+            )
+        return
+
+    # 인덱스/제약은 타입 변경 시 PostgreSQL이 그대로 다시 만듦
+    with connection.cursor() as cursor:
+        for table in USER_KEY_TABLES:
+            cursor.execute(
+                f"ALTER TABLE {table} ALTER COLUMN user_id TYPE text "
+                f"USING user_id::text"
+            )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ledger", "0009_user_key_expand"),
+    ]
+
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            database_operations=[
+                migrations.RunPython(swap_user_key, restore_text_user_id),
+            ],
+            state_operations=[
+                migrations.AlterField(
+                    model_name=model_name,
+                    name="user_id",
+                    field=models.BigIntegerField(),
+                )
+                for model_name in USER_KEY_MODELS
+            ],
+        ),
+        migrations.AlterField(
+            model_name="budget",
+            name="user_id",
+            field=models.BigIntegerField(),
+        ),
+        migrations.AlterField(
+            model_name="categorymonthtotal",
+            name="user_id",
+            field=models.BigIntegerField(),
+        ),
+        migrations.AlterField(
+            model_name="recurringrule",
+            name="user_id",
+            field=models.BigIntegerField(),
+        ),
+    ]
@@ -0,0 +1,85 @@
+# Generated by Django 5.2.18 on 2026-10-19 12:07
+
+import django.db.models.manager
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ledger", "0010_user_key_contract"),
+    ]
+
+    operations = [
+        migrations.AlterModelManagers(
+            name="transaction",
+            managers=[
+                ("all_objects", django.db.models.manager.Manager()),
+            ],
+        ),
+        migrations.AddField(
+            model_name="transaction",
+            name="deleted_at",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        # 조회 인덱스를 같은 이름의 부분 인덱스(deleted_at IS NULL)로 교체
+        # (PostgreSQL은 한 트랜잭션 안에서 교체되므로 인덱스 없는 구간이 보이지 않음)
+        migrations.RemoveIndex(
+            model_name="transaction",
+            name="idx_tx_user_date_created",
+        ),
+        migrations.RemoveIndex(
+            model_name="transaction",
+            name="idx_tx_user_cat_date",
+        ),
+        migrations.RemoveIndex(
+            model_name="transaction",
+            name="idx_tx_summary",
+        ),
+        migrations.RemoveIndex(
+            model_name="transaction",
+            name="idx_tx_user_amount",
+        ),
+        migrations.AddIndex(
+            model_name="transaction",
+            index=models.Index(
+                condition=models.Q(("deleted_at__isnull", True)),
+                fields=["user_id", "-occurred_date", "-created_at"],
+                name="idx_tx_user_date_created",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="transaction",
+            index=models.Index(
+                condition=models.Q(("deleted_at__isnull", True)),
+                fields=["user_id", "category", "-occurred_date"],
+                name="idx_tx_user_cat_date",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="transaction",
+            index=models.Index(
+                condition=models.Q(("deleted_at__isnull", True)),
+                fields=["user_id", "type", "occurred_date"],
+                include=("category", "amount"),
+                name="idx_tx_summary",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="transaction",
+            index=models.Index(
+                condition=models.Q(("deleted_at__isnull", True)),
+                fields=["user_id", "amount"],
+                include=("occurred_date", "category", "created_at"),
+                name="idx_tx_user_amount",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="transaction",
+            index=models.Index(
+                condition=models.Q(("deleted_at__isnull", False)),
+                fields=["deleted_at"],
+                name="idx_tx_tombstone",
+            ),
+        ),
+    ]
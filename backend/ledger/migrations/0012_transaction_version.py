@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-19 12:11
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ledger", "0011_soft_delete"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="transaction",
+            name="version",
+            field=models.IntegerField(default=1),
+        ),
+    ]
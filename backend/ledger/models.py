@@ -1,20 +1,33 @@
 """Django ORM 모델 - 기존 DB 테이블 매핑"""
 
-import uuid
-
 from django.db import models
+from django.utils import timezone
+
+from core.ids import uuid7
+
+# 조회 인덱스는 살아 있는 거래만 담음 (삭제 표시된 행 제외)
+LIVE = models.Q(deleted_at__isnull=True)
+
+
+class LiveTransactionManager(models.Manager):
+    """삭제 표시(deleted_at)되지 않은 거래만 — 서비스 코드의 기본 조회 경로."""
+
+    def get_queryset(self):
+        return super().get_queryset().filter(deleted_at__isnull=True)
 
 
 class Transaction(models.Model):
-    """거래 내역 (기존 transactions 테이블)"""
+    """거래 내역 (기존 transactions 테이블, PostgreSQL에서는 occurred_date 월 파티션)"""
 
     TYPE_CHOICES = [
         ("expense", "지출"),
         ("income", "수입"),
     ]
 
-    tx_id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
-    user_id = models.TextField()
+    # UUIDv7 — 시간순이라 PK 인덱스 오른쪽 끝에 삽입 (core.ids)
+    tx_id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
+    # accounts.User.id (FK 없음 — 파티션 테이블이고 사용자 삭제 후에도 이력 유지)
+    user_id = models.BigIntegerField()
     occurred_date = models.DateField()
     type = models.TextField(choices=TYPE_CHOICES)
     amount = models.IntegerField()
@@ -26,14 +39,52 @@ class Transaction(models.Model):
     source_text = models.TextField(null=True, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+    # 낙관적 잠금 — 수정마다 1 증가, UPDATE ... WHERE version = 읽은 값 으로 충돌 감지
+    version = models.IntegerField(default=1)
+    # 삭제 표시 (tombstone) — 되돌리기는 NULL로 UPDATE, 보존기간 후 purge_deleted_transactions가 실제 삭제
+    deleted_at = models.DateTimeField(null=True, blank=True)
+
+    # 첫 번째 매니저가 기본(관리자 · 관계 조회) — 삭제 표시 포함
+    all_objects = models.Manager()
+    objects = LiveTransactionManager()
 
     class Meta:
         db_table = "transactions"
         ordering = ["-occurred_date", "-created_at"]
+        # 조회 형태별 부분 인덱스 (PostgreSQL은 INCLUDE 컬럼까지 인덱스만으로 읽음)
         indexes = [
-            models.Index(fields=["user_id", "-occurred_date"], name="idx_tx_user_date"),
-            models.Index(fields=["user_id", "category"], name="idx_tx_user_cat"),
-            models.Index(fields=["user_id", "subcategory"], name="idx_tx_user_subcat"),
+            # 목록/검색: user_id [+ 기간] ORDER BY occurred_date DESC, created_at DESC
+            models.Index(
+                fields=["user_id", "-occurred_date", "-created_at"],
+                name="idx_tx_user_date_created",
+                condition=LIVE,
+            ),
+            # 카테고리 목록: user_id + category ORDER BY occurred_date DESC
+            models.Index(
+                fields=["user_id", "category", "-occurred_date"],
+                name="idx_tx_user_cat_date",
+                condition=LIVE,
+            ),
+            # 요약: user_id + type + 기간 → GROUP BY category, SUM(amount)
+            models.Index(
+                fields=["user_id", "type", "occurred_date"],
+                include=["category", "amount"],
+                name="idx_tx_summary",
+                condition=LIVE,
+            ),
+            # 조건부 삭제: user_id + amount [+ 날짜/카테고리] ORDER BY created_at DESC
+            models.Index(
+                fields=["user_id", "amount"],
+                include=["occurred_date", "category", "created_at"],
+                name="idx_tx_user_amount",
+                condition=LIVE,
+            ),
+            # purge: 보존기간이 지난 삭제 표시 행 (삭제 표시된 행만 담겨 작음)
+            models.Index(
+                fields=["deleted_at"],
+                name="idx_tx_tombstone",
+                condition=models.Q(deleted_at__isnull=False),
+            ),
         ]
 
     def __str__(self):
@@ -43,12 +94,15 @@ class Transaction(models.Model):
 class IdempotencyKey(models.Model):
     """중복 방지 키 (기존 idempotency_keys 테이블)"""
 
-    user_id = models.TextField()
+    user_id = models.BigIntegerField()
     idem_key = models.TextField()
+    # transactions는 월 파티션 테이블이라 PK가 (tx_id, occurred_date) → DB FK 불가,
+    # CASCADE는 ORM에서 처리
     tx = models.ForeignKey(
         Transaction,
         on_delete=models.CASCADE,
         db_column="tx_id",
+        db_constraint=False,
     )
     created_at = models.DateTimeField(auto_now_add=True)
 
@@ -65,7 +119,7 @@ class IdempotencyKey(models.Model):
 
 
 class AuditLog(models.Model):
-    """감사 로그 (기존 audit_logs 테이블)"""
+    """감사 로그 (기존 audit_logs 테이블, PostgreSQL에서는 created_at 월 파티션)"""
 
     ACTION_CHOICES = [
         ("create", "생성"),
@@ -74,19 +128,22 @@ class AuditLog(models.Model):
         ("undo", "취소"),
     ]
 
-    event_id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
-    user_id = models.TextField()
+    event_id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
+    user_id = models.BigIntegerField()
     action = models.TextField(choices=ACTION_CHOICES)
+    # 거래가 삭제돼도 tx_id를 유지해야 스냅샷 이력으로 복원 가능 (ledger.services.snapshot)
     tx = models.ForeignKey(
         Transaction,
-        on_delete=models.SET_NULL,
+        on_delete=models.DO_NOTHING,
         null=True,
         blank=True,
         db_column="tx_id",
+        db_constraint=False,
     )
     before_snapshot = models.JSONField(null=True, blank=True)
     after_snapshot = models.JSONField(null=True, blank=True)
-    created_at = models.DateTimeField(auto_now_add=True)
+    # 비동기 기록(AUDIT_WRITER=stream) 시 이벤트 발생 시각을 보존해야 하므로 auto_now_add 대신 default
+    created_at = models.DateTimeField(default=timezone.now, editable=False)
 
     class Meta:
         db_table = "audit_logs"
@@ -99,3 +156,104 @@ class AuditLog(models.Model):
 
     def __str__(self):
         return f"[{self.action}] {self.user_id} @ {self.created_at}"
+
+
+class Budget(models.Model):
+    """월별 카테고리 예산 (budgets 테이블)"""
+
+    user_id = models.BigIntegerField()
+    month = models.TextField()  # "YYYY-MM"
+    category = models.TextField()
+    amount = models.BigIntegerField()
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "budgets"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user_id", "month", "category"], name="uq_budget_month_cat"
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.user_id} {self.month} {self.category} {self.amount:,}원"
+
+
+class CategoryMonthTotal(models.Model):
+    """
+    (사용자, 월, 카테고리)별 지출 누계 (category_month_totals 테이블)
+
+    거래 생성/삭제 시 같은 DB 트랜잭션 안에서 증분 갱신되므로
+    남은 예산을 월 집계 쿼리 없이 행 하나로 계산할 수 있습니다.
+    """
+
+    user_id = models.BigIntegerField()
+    month = models.TextField()  # "YYYY-MM"
+    category = models.TextField()
+    spent = models.BigIntegerField(default=0)
+
+    class Meta:
+        db_table = "category_month_totals"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user_id", "month", "category"],
+                name="uq_cat_month_total",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.user_id} {self.month} {self.category} {self.spent:,}원"
+
+
+class RecurringRule(models.Model):
+    """
+    반복 거래 규칙 (recurring_rules 테이블) — 구독료, 통신비 등
+
+    next_run_date가 오늘 이하인 활성 규칙을 run_recurring_scheduler가 거래로 만들고
+    다음 발생일로 전진시킵니다.
+    """
+
+    FREQUENCY_CHOICES = [
+        ("monthly", "매월"),
+        ("weekly", "매주"),
+    ]
+
+    user_id = models.BigIntegerField()
+    type = models.TextField(choices=Transaction.TYPE_CHOICES, default="expense")
+    amount = models.IntegerField()
+    currency = models.TextField(default="KRW")
+    category = models.TextField()
+    subcategory = models.TextField(default="기타")
+    merchant = models.TextField(null=True, blank=True)
+    memo = models.TextField(null=True, blank=True)
+    frequency = models.TextField(choices=FREQUENCY_CHOICES, default="monthly")
+    # monthly: 매월 며칠 (말일보다 크면 말일), weekly: start_date의 요일
+    day_of_month = models.PositiveSmallIntegerField(null=True, blank=True)
+    start_date = models.DateField()
+    end_date = models.DateField(null=True, blank=True)
+    next_run_date = models.DateField()
+    active = models.BooleanField(default=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "recurring_rules"
+        indexes = [
+            # 스케줄러의 "오늘까지 도래한 활성 규칙" 스캔 전용
+            models.Index(
+                fields=["next_run_date", "id"],
+                name="idx_rule_due",
+                condition=models.Q(active=True),
+            ),
+            models.Index(fields=["user_id"], name="idx_rule_user"),
+        ]
+        constraints = [
+            # 잘못된 규칙 하나가 스케줄러 청크 전체를 실패시키지 않도록 DB에서 차단
+            models.CheckConstraint(
+                condition=models.Q(amount__gt=0), name="ck_rule_amount_positive"
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.user_id} {self.frequency} {self.category} {self.amount:,}원"
@@ -0,0 +1,108 @@
+"""월 단위 Range 파티션 관리 (PostgreSQL 전용)
+
+- transactions: occurred_date 기준
+- audit_logs: created_at 기준 (UTC 월 경계)
+
+파티션 이름 규칙: {table}_pYYYYMM, 범위 밖 행은 {table}_default 로 들어갑니다.
+과거 날짜 거래처럼 default에 쌓인 행은 해당 월 파티션을 만들 때 함께 옮깁니다.
+"""
+
+import re
+from datetime import date
+
+# 파티션 대상 테이블 → 파티션 키
+PARTITIONED_TABLES = {
+    "transactions": "occurred_date",
+    "audit_logs": "created_at",
+}
+
+_PARTITION_RE = re.compile(r"^(?P<table>\w+)_p(?P<year>\d{4})(?P<month>\d{2})$")
+
+
+def add_months(month_start: date, months: int) -> date:
+    """월 첫날에 months개월을 더한 월 첫날."""
+    index = month_start.year * 12 + (month_start.month - 1) + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(table: str, month_start: date) -> str:
+    return f"{table}_p{month_start:%Y%m}"
+
+
+def parse_partition_month(table: str, name: str) -> date | None:
+    """파티션 이름 → 해당 월 첫날. 규칙에 맞지 않으면 None (default 등)."""
+    m = _PARTITION_RE.match(name)
+    if not m or m.group("table") != table:
+        return None
+    return date(int(m.group("year")), int(m.group("month")), 1)
+
+
+def _bound(table: str, month_start: date) -> str:
+    if PARTITIONED_TABLES[table] == "created_at":
+        return f"{month_start.isoformat()} 00:00:00+00"
+    return month_start.isoformat()
+
+
+def list_partitions(cursor, table: str) -> list[str]:
+    """부모 테이블에 붙어 있는 파티션 이름 목록."""
+    cursor.execute(
+        """
+        SELECT c.relname
+        FROM pg_inherits i
+        JOIN pg_class c ON c.oid = i.inhrelid
+        JOIN pg_class p ON p.oid = i.inhparent
+        WHERE p.relname = %s
+        ORDER BY c.relname
+        """,
+        [table],
+    )
+    return [row[0] for row in cursor.fetchall()]
+
+
+def ensure_month_partition(cursor, table: str, month_start: date) -> bool:
+    """
+    month_start 월 파티션이 없으면 생성. 생성했으면 True.
+
+    default 파티션에 해당 월 행이 있으면 ATTACH 전에 새 파티션으로 옮깁니다.
+    (행이 남아 있으면 ATTACH가 실패하므로)
+    """
+    name = partition_name(table, month_start)
+    if name in list_partitions(cursor, table):
+        return False
+
+    column = PARTITIONED_TABLES[table]
+    lower = _bound(table, month_start)
+    upper = _bound(table, add_months(month_start, 1))
+
+    cursor.execute(
+        f"CREATE TABLE {name} "
+        f"(LIKE {table} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"
+    )
+    cursor.execute(
+        f"WITH moved AS ("
+        f"  DELETE FROM {table}_default"
+        f"  WHERE {column} >= %s AND {column} < %s RETURNING *"
+        f") INSERT INTO {name} SELECT * FROM moved",
+        [lower, upper],
+    )
+    cursor.execute(
+        f"ALTER TABLE {table} ATTACH PARTITION {name} "
+        f"FOR VALUES FROM ('{lower}') TO ('{upper}')"
+    )
+    return True
+
+
+def detach_partitions_before(
+    cursor, table: str, cutoff: date, drop: bool = False
+) -> list[str]:
+    """cutoff 월보다 이전 월 파티션을 분리(옵션: 삭제). 처리한 이름 목록 반환."""
+    handled = []
+    for name in list_partitions(cursor, table):
+        month_start = parse_partition_month(table, name)
+        if month_start is None or month_start >= cutoff:
+            continue
+        cursor.execute(f"ALTER TABLE {table} DETACH PARTITION {name}")
+        if drop:
+            cursor.execute(f"DROP TABLE {name}")
+        handled.append(name)
+    return handled
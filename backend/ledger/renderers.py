@@ -0,0 +1,102 @@
+"""거래 목록 고속 렌더링 — ModelSerializer + JSONRenderer 대체 경로
+
+GET /transactions/ 는 행 수만큼 모델 인스턴스 생성 → 필드별 to_representation →
+json.dumps 를 거쳤습니다. 여기서는 values_list 튜플을 dict로 묶고(transaction_rows)
+ORJSONRenderer가 orjson으로 한 번에 인코딩합니다. 뷰는 Response(data)를 그대로
+반환하므로 DRF 콘텐츠 협상, 예외 처리, 테스트 클라이언트의 response.data 가 유지됩니다.
+
+출력은 TransactionResponseSerializer + JSONRenderer 와 바이트 단위로 같습니다.
+    - tx_id / occurred_date / created_at: serializer 와 같은 문자열로 변환
+    - created_at: 현재 타임존으로 변환, UTC면 "Z" (DRF DateTimeField 와 동일)
+    - user_id: bigint 컬럼이지만 응답은 문자열 (serializer의 CharField 와 동일)
+    - U+2028/U+2029: DRF JSONRenderer 처럼 \\u 이스케이프
+"""
+
+import orjson
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+from ledger.serializers import TransactionResponseSerializer
+
+TRANSACTION_LIST_FIELDS = tuple(TransactionResponseSerializer.Meta.fields)
+
+
+def _escape_line_separators(body: bytes) -> bytes:
+    return body.replace(b"\xe2\x80\xa8", b"\\u2028").replace(
+        b"\xe2\x80\xa9", b"\\u2029"
+    )
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    orjson 인코딩 JSONRenderer.
+
+    "application/json; indent=N" 요청은 들여쓰기를 위해 JSONRenderer 로 위임하고,
+    orjson이 모르는 타입(Decimal, lazy 문자열 등)은 DRF JSONEncoder 로 변환합니다.
+    """
+
+    _fallback = JSONEncoder()
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        if self.get_indent(accepted_media_type or "", renderer_context or {}):
+            return super().render(data, accepted_media_type, renderer_context)
+        body = orjson.dumps(
+            data, default=self._fallback.default, option=orjson.OPT_UTC_Z
+        )
+        return _escape_line_separators(body)
+
+
+def _datetime_str(value, tz) -> str | None:
+    # DRF DateTimeField.to_representation 과 같은 형식
+    if value is None:
+        return None
+    value = value.astimezone(tz).isoformat()
+    if value.endswith("+00:00"):
+        value = value[:-6] + "Z"
+    return value
+
+
+def transaction_rows(queryset) -> list[dict]:
+    """거래 QuerySet → TransactionResponseSerializer(many=True).data 와 같은 dict 목록."""
+    tz = timezone.get_current_timezone()
+    rows = queryset.values_list(*TRANSACTION_LIST_FIELDS)
+    return [
+        {
+            "tx_id": str(tx_id),
+            "user_id": str(user_id),
+            "occurred_date": occurred_date.isoformat(),
+            "type": tx_type,
+            "amount": amount,
+            "currency": currency,
+            "category": category,
+            "subcategory": subcategory,
+            "merchant": merchant,
+            "memo": memo,
+            "source_text": source_text,
+            "created_at": _datetime_str(created_at, tz),
+            "version": version,
+        }
+        for (
+            tx_id,
+            user_id,
+            occurred_date,
+            tx_type,
+            amount,
+            currency,
+            category,
+            subcategory,
+            merchant,
+            memo,
+            source_text,
+            created_at,
+            version,
+        ) in rows.iterator(chunk_size=2000)
+    ]
+
+
+def render_transaction_list(queryset) -> bytes:
+    """거래 QuerySet → {"transactions": [...]} JSON 바이트 (벤치마크/테스트용)."""
+    return ORJSONRenderer().render({"transactions": transaction_rows(queryset)})
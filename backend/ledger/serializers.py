@@ -1,8 +1,11 @@
 """DRF Serializers — 입력 검증 + ModelSerializer 기반 응답 직렬화"""
 
+from datetime import datetime
+
 from rest_framework import serializers
 
 from ledger.models import Transaction
+from ledger.services.normalizer import CATEGORIES
 
 
 # ──────────────────────────────────────────
@@ -10,6 +13,17 @@ from ledger.models import Transaction
 # ──────────────────────────────────────────
 
 
+def _validate_month(value: str | None) -> str | None:
+    """YYYY-MM 형식 + 실제 월(01~12)인지 확인 (정규식만으로는 2026-13 통과)"""
+    if value is None:
+        return value
+    try:
+        datetime.strptime(value, "%Y-%m")
+    except ValueError:
+        raise serializers.ValidationError("month는 YYYY-MM 형식이어야 합니다")
+    return value
+
+
 class ChatRequestSerializer(serializers.Serializer):
     """POST /chat/ 요청"""
 
@@ -17,6 +31,8 @@ class ChatRequestSerializer(serializers.Serializer):
     session_id = serializers.CharField(required=False, allow_null=True, default=None)
     idem_key = serializers.CharField(required=False, allow_null=True, default=None)
     llm_provider = serializers.CharField(required=False, allow_null=True, default=None)
+    # True면 큐에 넣고 즉시 job_id 반환 (GET /chat/jobs/<job_id>/ 로 결과 조회)
+    async_mode = serializers.BooleanField(required=False, default=False)
 
 
 class CreateTransactionSerializer(serializers.Serializer):
@@ -34,10 +50,42 @@ class CreateTransactionSerializer(serializers.Serializer):
     idem_key = serializers.CharField(required=False, allow_null=True, default=None)
 
 
+class UpdateTransactionSerializer(serializers.Serializer):
+    """PATCH /transactions/<tx_id>/ 요청 — 보낸 필드만 수정 (정규화는 서비스 계층에서 처리)"""
+
+    occurred_date = serializers.CharField(required=False)
+    type = serializers.ChoiceField(choices=["expense", "income"], required=False)
+    amount = serializers.CharField(required=False)
+    category = serializers.CharField(required=False)
+    subcategory = serializers.CharField(required=False)
+    currency = serializers.CharField(required=False)
+    merchant = serializers.CharField(required=False, allow_null=True, allow_blank=True)
+    memo = serializers.CharField(required=False, allow_null=True, allow_blank=True)
+    # 조회 시 받은 version — 그 사이 다른 수정이 있었으면 409
+    version = serializers.IntegerField(required=False, min_value=1)
+
+    def validate(self, data):
+        if not set(data) - {"version"}:
+            raise serializers.ValidationError("수정할 필드가 없습니다")
+        return data
+
+
 class UndoRequestSerializer(serializers.Serializer):
-    """POST /undo/ 요청"""
+    """POST /undo/ 요청 — undo_token이 없으면 가장 최근 작업 그룹"""
+
+    undo_token = serializers.CharField(required=False, allow_null=True, default=None)
+
+
+class BudgetRequestSerializer(serializers.Serializer):
+    """POST /budgets/ 요청 — 월별 카테고리 예산 설정"""
 
-    undo_token = serializers.CharField()
+    month = serializers.RegexField(
+        regex=r"^\d{4}-\d{2}$",
+        validators=[_validate_month],
+        error_messages={"invalid": "month는 YYYY-MM 형식이어야 합니다"},
+    )
+    category = serializers.ChoiceField(choices=sorted(CATEGORIES))
+    amount = serializers.IntegerField(min_value=0)
 
 
 # ──────────────────────────────────────────
@@ -91,6 +139,30 @@ class SummaryQuerySerializer(serializers.Serializer):
         return data
 
 
+class InsightsQuerySerializer(serializers.Serializer):
+    """GET /insights/ 쿼리 파라미터 — 최근 N개월, 이동평균 일수"""
+
+    months = serializers.IntegerField(
+        required=False, default=6, min_value=1, max_value=24
+    )
+    window = serializers.IntegerField(
+        required=False, default=7, min_value=1, max_value=31
+    )
+
+
+class BudgetQuerySerializer(serializers.Serializer):
+    """GET /budgets/ 쿼리 파라미터 — 생략 시 이번 달"""
+
+    month = serializers.RegexField(
+        regex=r"^\d{4}-\d{2}$",
+        validators=[_validate_month],
+        required=False,
+        default=None,
+        allow_null=True,
+        error_messages={"invalid": "month는 YYYY-MM 형식이어야 합니다"},
+    )
+
+
 # ──────────────────────────────────────────
 # 응답 Serializers (ModelSerializer)
 # ──────────────────────────────────────────
@@ -100,6 +172,8 @@ class TransactionResponseSerializer(serializers.ModelSerializer):
     """거래 내역 응답 — Transaction 모델 기반 자동 직렬화"""
 
     tx_id = serializers.UUIDField(read_only=True)
+    # DB는 bigint지만 응답은 기존처럼 문자열 (클라이언트 호환)
+    user_id = serializers.CharField(read_only=True)
 
     class Meta:
         model = Transaction
@@ -116,5 +190,6 @@ class TransactionResponseSerializer(serializers.ModelSerializer):
             "memo",
             "source_text",
             "created_at",
+            "version",
         ]
         read_only_fields = fields
@@ -0,0 +1,250 @@
+"""Analytics — 컬럼형 NumPy 배열 기반 소비 인사이트 (Read)
+
+사용자 거래를 한 번만 읽어 컬럼 배열로 만들고, 모든 지표를 벡터 연산으로 계산합니다.
+
+    날짜      int32  (date.toordinal())
+    금액      int64
+    지출 여부  bool
+    카테고리   int16  사전 인코딩 (codes + labels)
+    가맹점    int32  사전 인코딩 (-1 = 없음)
+
+지표: 월별 추이, 일별 이동평균, 요일별 패턴, 상위 가맹점, 전월 대비 증감
+"""
+
+from dataclasses import dataclass
+from datetime import date, timedelta
+
+import numpy as np
+
+from core.db_router import read_db_for
+from ledger.models import Transaction
+
+WEEKDAYS = ("월", "화", "수", "목", "금", "토", "일")
+
+
+@dataclass(frozen=True)
+class TransactionColumns:
+    dates: np.ndarray
+    amounts: np.ndarray
+    is_expense: np.ndarray
+    categories: np.ndarray
+    category_labels: tuple[str, ...]
+    merchants: np.ndarray
+    merchant_labels: tuple[str, ...]
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+
+def _dictionary_encode(values, dtype, missing=None):
+    labels: dict[str, int] = {}
+    codes = np.fromiter(
+        (
+            -1 if v == missing or v is None else labels.setdefault(v, len(labels))
+            for v in values
+        ),
+        dtype=dtype,
+        count=len(values),
+    )
+    return codes, tuple(labels)
+
+
+def load_columns(
+    user_id: str, from_date: date | None = None, to_date: date | None = None
+) -> TransactionColumns:
+    """사용자 거래를 컬럼 배열로 로드 (한 번의 SELECT)."""
+    qs = Transaction.objects.using(read_db_for(user_id)).filter(user_id=user_id)
+    if from_date:
+        qs = qs.filter(occurred_date__gte=from_date)
+    if to_date:
+        qs = qs.filter(occurred_date__lte=to_date)
+    rows = list(
+        qs.order_by().values_list(
+            "occurred_date", "amount", "type", "category", "merchant"
+        )
+    )
+    dates, amounts, types, categories, merchants = zip(*rows) if rows else ([],) * 5
+
+    category_codes, category_labels = _dictionary_encode(categories, np.int16)
+    merchant_codes, merchant_labels = _dictionary_encode(merchants, np.int32, "")
+    return TransactionColumns(
+        dates=np.fromiter((d.toordinal() for d in dates), np.int32, len(dates)),
+        amounts=np.fromiter(amounts, np.int64, len(amounts)),
+        is_expense=np.fromiter((t == "expense" for t in types), bool, len(types)),
+        categories=category_codes,
+        category_labels=category_labels,
+        merchants=merchant_codes,
+        merchant_labels=merchant_labels,
+    )
+
+
+def _month_start(today: date, months_back: int) -> date:
+    year, month = divmod(today.year * 12 + today.month - 1 - months_back, 12)
+    return date(year, month + 1, 1)
+
+
+def compute_insights(
+    cols: TransactionColumns,
+    today: date | None = None,
+    months: int = 6,
+    window: int = 7,
+    daily_days: int = 30,
+    top_n: int = 5,
+) -> dict:
+    """
+    최근 months개월(이번 달 포함) 기준 인사이트.
+
+    행 단위 연산은 일별 합계(bincount)와 가맹점/카테고리 합계뿐이고,
+    월별 추이 · 이동평균 · 요일 패턴은 수백 개짜리 일별 배열에서 계산합니다.
+    """
+    today = today or date.today()
+    end_ord = today.toordinal()
+    start = _month_start(today, months - 1)
+    cur_start = today.replace(day=1)
+    prev_start = _month_start(today, 1)
+    prev_last = cur_start - timedelta(days=1)
+    prev_end = prev_start.replace(day=min(today.day, prev_last.day))
+    span = daily_days + window - 1
+
+    # 필요한 가장 이른 날짜부터 오늘까지 한 번만 골라냄
+    lo = min(start.toordinal(), prev_start.toordinal(), end_ord - span + 1)
+    n_days = end_ord - lo + 1
+    in_range = (cols.dates >= lo) & (cols.dates <= end_ord)
+    day = cols.dates[in_range] - lo
+    amounts = cols.amounts[in_range]
+    expense = cols.is_expense[in_range]
+    spent = np.where(expense, amounts, 0)
+
+    # 일별 합계 — 이후 기간 지표는 이 배열의 구간 연산
+    daily_spent = np.bincount(day, weights=spent, minlength=n_days)
+    daily_income = np.bincount(day, weights=amounts, minlength=n_days) - daily_spent
+
+    def offset(d: date) -> int:
+        return d.toordinal() - lo
+
+    # 1) 월별 추이 (지출/수입)
+    month_starts = [_month_start(today, months - 1 - i) for i in range(months)]
+    bounds = [offset(d) for d in month_starts]
+    monthly_expense = np.add.reduceat(daily_spent, bounds)
+    monthly_income = np.add.reduceat(daily_income, bounds)
+    monthly = [
+        {
+            "month": month_starts[i].strftime("%Y-%m"),
+            "expense": int(monthly_expense[i]),
+            "income": int(monthly_income[i]),
+        }
+        for i in range(months)
+    ]
+
+    # 2) 일별 지출 + window일 이동평균 (첫날 평균을 위해 window-1일 앞부터)
+    recent = daily_spent[-span:]
+    csum = np.concatenate(([0.0], np.cumsum(recent)))
+    rolling = (csum[window:] - csum[:-window]) / window
+    daily_trend = [
+        {
+            "date": str(date.fromordinal(end_ord - daily_days + 1 + i)),
+            "expense": int(recent[window - 1 + i]),
+            "rolling_avg": round(float(rolling[i]), 1),
+        }
+        for i in range(daily_days)
+    ]
+
+    # 3) 요일별 패턴 (기간 내 해당 요일 수로 나눈 평균)
+    period_days = np.arange(offset(start), n_days)
+    weekday_of_day = (period_days + lo - 1) % 7
+    weekday_total = np.bincount(
+        weekday_of_day, weights=daily_spent[period_days], minlength=7
+    )
+    weekday_count = np.bincount(weekday_of_day, minlength=7)
+    weekday_profile = [
+        {
+            "weekday": WEEKDAYS[i],
+            "total": int(weekday_total[i]),
+            "avg": round(float(weekday_total[i] / max(weekday_count[i], 1)), 1),
+        }
+        for i in range(7)
+    ]
+
+    # 4) 상위 가맹점 (기간 내 지출)
+    n_merchants = len(cols.merchant_labels)
+    merchants = cols.merchants[in_range]
+    picked = expense & (merchants >= 0) & (day >= offset(start))
+    merchant_total = np.bincount(
+        merchants[picked], weights=amounts[picked], minlength=n_merchants
+    )
+    merchant_count = np.bincount(merchants[picked], minlength=n_merchants)
+    k = min(top_n, n_merchants)
+    top = np.argpartition(-merchant_total, k - 1)[:k] if k else np.array([], int)
+    top = top[np.argsort(-merchant_total[top], kind="stable")]
+    top_merchants = [
+        {
+            "merchant": cols.merchant_labels[i],
+            "total": int(merchant_total[i]),
+            "count": int(merchant_count[i]),
+        }
+        for i in top
+        if merchant_count[i]
+    ]
+
+    # 5) 전월 대비 — 같은 일수끼리 비교 (이번 달 1일~오늘 ↔ 지난달 1일~같은 날)
+    cur_total = int(daily_spent[offset(cur_start) :].sum())
+    prev_total = int(daily_spent[offset(prev_start) : offset(prev_end) + 1].sum())
+    n_categories = len(cols.category_labels)
+    is_current = day >= offset(cur_start)
+    picked = expense & (
+        is_current | ((day >= offset(prev_start)) & (day <= offset(prev_end)))
+    )
+    # 이번 달은 [0, n), 지난달은 [n, 2n) 칸에 한 번의 bincount로 집계
+    by_cat = np.bincount(
+        cols.categories[in_range][picked] + n_categories * ~is_current[picked],
+        weights=amounts[picked],
+        minlength=2 * n_categories,
+    )
+    cur_by_cat, prev_by_cat = by_cat[:n_categories], by_cat[n_categories:]
+    changed = np.flatnonzero(cur_by_cat + prev_by_cat)
+    changed = changed[np.argsort(-np.abs(cur_by_cat - prev_by_cat)[changed])]
+    period_over_period = {
+        "current": {"from": str(cur_start), "to": str(today), "total": cur_total},
+        "previous": {"from": str(prev_start), "to": str(prev_end), "total": prev_total},
+        "change": cur_total - prev_total,
+        "change_rate": (
+            round((cur_total - prev_total) / prev_total, 3) if prev_total else None
+        ),
+        "by_category": [
+            {
+                "category": cols.category_labels[i],
+                "current": int(cur_by_cat[i]),
+                "previous": int(prev_by_cat[i]),
+                "change": int(cur_by_cat[i] - prev_by_cat[i]),
+            }
+            for i in changed
+        ],
+    }
+
+    return {
+        "period": {"from": str(start), "to": str(today)},
+        "monthly": monthly,
+        "daily": daily_trend,
+        "weekday": weekday_profile,
+        "top_merchants": top_merchants,
+        "period_over_period": period_over_period,
+    }
+
+
+class InsightsService:
+    """
+    소비 인사이트 조회 (Query).
+    지표에 필요한 가장 이른 날짜부터 한 번만 로드해 compute_insights에 넘깁니다.
+    """
+
+    @staticmethod
+    def get_insights(
+        user_id: str, months: int = 6, window: int = 7, today: date | None = None
+    ) -> dict:
+        today = today or date.today()
+        from_date = min(
+            _month_start(today, max(months, 2) - 1),  # 기간 + 전월 비교
+            today - timedelta(days=30 + window),  # 이동평균
+        )
+        cols = load_columns(user_id, from_date=from_date, to_date=today)
+        return compute_insights(cols, today=today, months=months, window=window)
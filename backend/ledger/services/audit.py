@@ -1,9 +1,43 @@
-"""감사로그 서비스 - Django ORM 사용"""
+"""감사로그 서비스 - Django ORM / Redis Stream
 
+AUDIT_WRITER 설정:
+    sync   — 요청 트랜잭션 안에서 AuditLog INSERT (기본)
+    stream — 커밋 후 Redis Stream에 XADD 1회만 수행하고,
+             run_audit_writer 워커가 bulk_create로 일괄 저장
+
+stream 모드의 전달 보장 (XADD 이후 구간은 at-least-once):
+    - 워커가 저장 후 XACK 전에 죽으면, 일정 시간(min_idle_ms) 이상 ACK되지 않은
+      pending 항목을 XAUTOCLAIM으로 가져와 다시 처리합니다. 컨슈머 이름이 바뀌어도
+      (재시작, 다른 호스트) 회수되며, event_id(PK)가 같으므로 중복은 무시됩니다.
+    - 필드가 비었거나(이미 XDEL된 항목) 저장에 실패하는 항목은 ACK 후
+      audit:events:dead 스트림으로 옮겨 워커가 멈추지 않게 합니다.
+    - XADD가 실패하면(Redis 장애) 같은 event_id로 AuditLog를 바로 INSERT하므로
+      커밋이 끝난 요청이 500으로 바뀌지 않습니다.
+    - XADD는 DB 커밋 이후(on_commit)에 실행됩니다. 커밋과 XADD 사이에 프로세스가
+      죽으면 그 이벤트는 유실됩니다. 이 구간까지 보장해야 하면 sync 모드를 쓰세요.
+스트림 순서대로 한 워커가 처리하므로 사용자별 순서가 유지됩니다.
+"""
+
+import json
+import logging
+from datetime import datetime
 from uuid import UUID
 
+from django.conf import settings
+from django.db import DatabaseError, transaction
+from django.utils import timezone
+from django_redis import get_redis_connection
+from redis.exceptions import RedisError, ResponseError
+
+from core.ids import uuid7
 from ledger.models import AuditLog
 
+AUDIT_STREAM_KEY = "audit:events"
+AUDIT_CONSUMER_GROUP = "audit-writer"
+AUDIT_DEAD_LETTER_KEY = "audit:events:dead"
+
+logger = logging.getLogger(__name__)
+
 
 def log_audit(
     user_id: str,
@@ -13,6 +47,20 @@ def log_audit(
     after_snapshot: dict | None = None,
 ) -> None:
     """audit_logs에 기록."""
+    if settings.AUDIT_WRITER == "stream":
+        event = {
+            "event_id": str(uuid7()),
+            "user_id": user_id,
+            "action": action,
+            "tx_id": str(tx_id) if tx_id else "",
+            "before_snapshot": json.dumps(before_snapshot, ensure_ascii=False),
+            "after_snapshot": json.dumps(after_snapshot, ensure_ascii=False),
+            "created_at": timezone.now().isoformat(),
+        }
+        # 롤백된 쓰기의 감사로그가 남지 않도록 커밋 이후에 적재
+        transaction.on_commit(lambda: _append_event(event), robust=True)
+        return
+
     AuditLog.objects.create(
         user_id=user_id,
         action=action,
@@ -20,3 +68,223 @@ def log_audit(
         before_snapshot=before_snapshot,
         after_snapshot=after_snapshot,
     )
+
+
+def log_audit_bulk(entries: list[dict]) -> None:
+    """
+    log_audit 여러 건 (일괄 생성용).
+    entries: log_audit 인자와 같은 키의 dict — sync는 bulk_create 1회,
+    stream은 커밋 후 파이프라인 XADD 1회.
+    """
+    if not entries:
+        return
+    if settings.AUDIT_WRITER == "stream":
+        now = timezone.now().isoformat()
+        events = [
+            {
+                "event_id": str(uuid7()),
+                "user_id": entry["user_id"],
+                "action": entry["action"],
+                "tx_id": str(entry["tx_id"]) if entry.get("tx_id") else "",
+                "before_snapshot": json.dumps(
+                    entry.get("before_snapshot"), ensure_ascii=False
+                ),
+                "after_snapshot": json.dumps(
+                    entry.get("after_snapshot"), ensure_ascii=False
+                ),
+                "created_at": now,
+            }
+            for entry in entries
+        ]
+        transaction.on_commit(lambda: _append_events(events), robust=True)
+        return
+
+    AuditLog.objects.bulk_create(
+        [
+            AuditLog(
+                user_id=entry["user_id"],
+                action=entry["action"],
+                tx_id=entry.get("tx_id"),
+                before_snapshot=entry.get("before_snapshot"),
+                after_snapshot=entry.get("after_snapshot"),
+            )
+            for entry in entries
+        ],
+        batch_size=1000,
+    )
+
+
+def _append_event(event: dict) -> None:
+    try:
+        get_redis_connection("default").xadd(AUDIT_STREAM_KEY, event)
+    except RedisError:
+        _write_fallback([event])
+
+
+def _append_events(events: list[dict]) -> None:
+    try:
+        pipe = get_redis_connection("default").pipeline(transaction=False)
+        for event in events:
+            pipe.xadd(AUDIT_STREAM_KEY, event)
+        pipe.execute()
+    except RedisError:
+        # 일부만 XADD됐어도 워커 저장분은 event_id 충돌로 무시됨
+        _write_fallback(events)
+
+
+def _write_fallback(events: list[dict]) -> None:
+    logger.warning("audit stream 적재 실패 — %d건을 직접 저장합니다", len(events))
+    AuditLog.objects.bulk_create(
+        [_to_audit_log(event) for event in events],
+        batch_size=1000,
+        ignore_conflicts=True,
+    )
+
+
+def _decode(fields: dict) -> dict:
+    return {
+        (k.decode("utf-8") if isinstance(k, bytes) else k): (
+            v.decode("utf-8") if isinstance(v, bytes) else v
+        )
+        for k, v in fields.items()
+    }
+
+
+def _to_audit_log(fields: dict) -> AuditLog:
+    fields = _decode(fields)
+    return AuditLog(
+        event_id=UUID(fields["event_id"]),
+        user_id=fields["user_id"],
+        action=fields["action"],
+        tx_id=UUID(fields["tx_id"]) if fields["tx_id"] else None,
+        before_snapshot=json.loads(fields["before_snapshot"]),
+        after_snapshot=json.loads(fields["after_snapshot"]),
+        created_at=datetime.fromisoformat(fields["created_at"]),
+    )
+
+
+def ensure_consumer_group() -> None:
+    """스트림과 컨슈머 그룹이 없으면 생성."""
+    redis = get_redis_connection("default")
+    try:
+        redis.xgroup_create(
+            AUDIT_STREAM_KEY, AUDIT_CONSUMER_GROUP, id="0", mkstream=True
+        )
+    except ResponseError as e:
+        if "BUSYGROUP" not in str(e):
+            raise
+
+
+def _dead_letter(redis, message_id, fields: dict | None, error: str) -> None:
+    logger.error("감사 이벤트 %s 저장 실패 — dead letter로 이동: %s", message_id, error)
+    redis.xadd(
+        AUDIT_DEAD_LETTER_KEY,
+        {
+            "message_id": message_id,
+            "fields": json.dumps(_decode(fields or {}), ensure_ascii=False),
+            "error": error,
+        },
+    )
+
+
+def _write_messages(redis, messages: list, batch_size: int) -> int:
+    """
+    스트림 항목 → audit_logs bulk_create 후 ACK. 저장(또는 중복 무시)된 수 반환.
+
+    빈 항목은 건너뛰고, 변환/저장에 실패한 항목은 dead letter로 옮겨 함께 ACK합니다.
+    """
+    messages = [(message_id, fields) for message_id, fields in messages if message_id]
+    logs, log_ids = [], []
+    for message_id, fields in messages:
+        if not fields:
+            # 이미 XDEL된 항목 — 저장할 내용이 없으니 ACK만
+            logger.warning("감사 이벤트 %s 필드 없음 — 건너뜀", message_id)
+            continue
+        try:
+            logs.append(_to_audit_log(fields))
+            log_ids.append(message_id)
+        except (KeyError, ValueError, TypeError) as e:
+            _dead_letter(redis, message_id, fields, f"변환 실패: {e}")
+
+    written = len(logs)
+    try:
+        AuditLog.objects.bulk_create(logs, batch_size=batch_size, ignore_conflicts=True)
+    except DatabaseError:
+        # 한 건 때문에 배치 전체가 영원히 재시도되지 않도록 건별로 다시 저장
+        written = 0
+        fields_by_id = dict(messages)
+        for message_id, log in zip(log_ids, logs):
+            try:
+                AuditLog.objects.bulk_create([log], ignore_conflicts=True)
+                written += 1
+            except DatabaseError as e:
+                _dead_letter(redis, message_id, fields_by_id[message_id], str(e))
+
+    # 저장(또는 dead letter) 후에만 ACK → 워커가 중간에 죽어도 유실 없음
+    message_ids = [message_id for message_id, _ in messages]
+    if not message_ids:
+        return written
+    redis.xack(AUDIT_STREAM_KEY, AUDIT_CONSUMER_GROUP, *message_ids)
+    redis.xdel(AUDIT_STREAM_KEY, *message_ids)
+    return written
+
+
+def flush_audit_events(
+    consumer: str,
+    batch_size: int = 500,
+    block_ms: int | None = None,
+) -> int:
+    """
+    스트림의 새 이벤트를 최대 batch_size개 읽어 audit_logs에 bulk_create.
+
+    Args:
+        consumer: 컨슈머 이름 (워커 식별자)
+        block_ms: 새 이벤트 대기 시간 (None이면 대기하지 않음)
+
+    Returns:
+        저장(또는 중복으로 무시)된 이벤트 수
+    """
+    redis = get_redis_connection("default")
+    response = redis.xreadgroup(
+        AUDIT_CONSUMER_GROUP,
+        consumer,
+        {AUDIT_STREAM_KEY: ">"},
+        count=batch_size,
+        block=block_ms,
+    )
+    if not response:
+        return 0
+
+    _, messages = response[0]
+    if not messages:
+        return 0
+    return _write_messages(redis, messages, batch_size)
+
+
+def claim_stale_events(
+    consumer: str, batch_size: int = 500, min_idle_ms: int = 60_000
+) -> int:
+    """
+    어느 컨슈머든 min_idle_ms 이상 ACK하지 못한 pending 항목을 XAUTOCLAIM으로
+    가져와 저장. 죽은 워커(이전 컨슈머 이름 포함)가 남긴 항목을 회수합니다.
+
+    Returns:
+        저장(또는 중복으로 무시)된 이벤트 수
+    """
+    redis = get_redis_connection("default")
+    cursor, total = "0-0", 0
+    while True:
+        response = redis.xautoclaim(
+            AUDIT_STREAM_KEY,
+            AUDIT_CONSUMER_GROUP,
+            consumer,
+            min_idle_ms,
+            start_id=cursor,
+            count=batch_size,
+        )
+        # Redis 7은 [다음 커서, 항목, 삭제된 ID], 6.2는 [다음 커서, 항목]
+        cursor, messages = response[0], response[1]
+        if messages:
+            total += _write_messages(redis, messages, batch_size)
+        if cursor in (b"0-0", "0-0"):
+            return total
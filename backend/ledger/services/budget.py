@@ -0,0 +1,129 @@
+"""예산 서비스 — 월별 카테고리 예산 + 지출 누계 (Django ORM)
+
+category_month_totals에 (사용자, 월, 카테고리)별 지출 누계를 두고
+TransactionCommandService의 쓰기와 같은 DB 트랜잭션 안에서 증분 갱신합니다.
+남은 예산은 누계 행과 예산 행 하나씩만 읽으므로 월 집계 쿼리가 필요 없습니다.
+
+수입 거래는 누계에 반영하지 않습니다.
+"""
+
+from datetime import date
+
+from ledger.models import Budget, CategoryMonthTotal
+
+
+def month_key(d: date) -> str:
+    return d.strftime("%Y-%m")
+
+
+def apply_spending(user_id: str, occurred_date: date, category: str, delta: int) -> int:
+    """
+    지출 누계에 delta를 더하고 갱신된 누계를 반환.
+    호출 측의 transaction.atomic() 안에서 실행되어야 하며,
+    행 잠금(select_for_update)으로 동시 생성/삭제 간 누계 유실을 막습니다.
+    """
+    total, _ = CategoryMonthTotal.objects.select_for_update().get_or_create(
+        user_id=user_id, month=month_key(occurred_date), category=category
+    )
+    total.spent += delta
+    total.save(update_fields=["spent"])
+    return total.spent
+
+
+def apply_spending_bulk(deltas: dict[tuple[str, str, str], int]) -> None:
+    """
+    {(user_id, "YYYY-MM", category): delta} 일괄 반영 (일괄 생성용).
+    기존 행은 한 번에 잠가 bulk_update, 없는 행은 bulk_create.
+    """
+    if not deltas:
+        return
+    user_ids = {user_id for user_id, _, _ in deltas}
+    months = {month for _, month, _ in deltas}
+    existing = {
+        (str(t.user_id), t.month, t.category): t
+        for t in CategoryMonthTotal.objects.select_for_update().filter(
+            user_id__in=user_ids, month__in=months
+        )
+        if (str(t.user_id), t.month, t.category) in deltas
+    }
+    for key, total in existing.items():
+        total.spent += deltas[key]
+    CategoryMonthTotal.objects.bulk_update(
+        existing.values(), ["spent"], batch_size=1000
+    )
+    CategoryMonthTotal.objects.bulk_create(
+        [
+            CategoryMonthTotal(
+                user_id=user_id, month=month, category=category, spent=delta
+            )
+            for (user_id, month, category), delta in deltas.items()
+            if (user_id, month, category) not in existing
+        ],
+        batch_size=1000,
+    )
+
+
+def revert_spending(user_id: str, txs) -> None:
+    """삭제/취소된 지출 거래들을 누계에서 차감."""
+    deltas: dict[tuple[date, str], int] = {}
+    for tx in txs:
+        if tx.type != "expense":
+            continue
+        key = (tx.occurred_date.replace(day=1), tx.category)
+        deltas[key] = deltas.get(key, 0) + tx.amount
+    for (month_start, category), amount in deltas.items():
+        apply_spending(user_id, month_start, category, -amount)
+
+
+def budget_status(user_id: str, month: str, category: str, spent: int) -> dict | None:
+    """예산이 설정된 경우 남은 예산 정보, 없으면 None."""
+    amount = (
+        Budget.objects.filter(user_id=user_id, month=month, category=category)
+        .values_list("amount", flat=True)
+        .first()
+    )
+    if amount is None:
+        return None
+    return {
+        "month": month,
+        "category": category,
+        "budget": amount,
+        "spent": spent,
+        "remaining": amount - spent,
+    }
+
+
+def set_budget(user_id: str, month: str, category: str, amount: int) -> dict:
+    """예산 설정 (있으면 금액 갱신)."""
+    Budget.objects.update_or_create(
+        user_id=user_id, month=month, category=category, defaults={"amount": amount}
+    )
+    spent = (
+        CategoryMonthTotal.objects.filter(
+            user_id=user_id, month=month, category=category
+        )
+        .values_list("spent", flat=True)
+        .first()
+    )
+    return budget_status(user_id, month, category, spent or 0)
+
+
+def list_budgets(user_id: str, month: str) -> list[dict]:
+    """해당 월에 설정된 예산별 지출/잔액."""
+    spent_by_category = dict(
+        CategoryMonthTotal.objects.filter(user_id=user_id, month=month).values_list(
+            "category", "spent"
+        )
+    )
+    return [
+        {
+            "month": month,
+            "category": category,
+            "budget": amount,
+            "spent": spent_by_category.get(category, 0),
+            "remaining": amount - spent_by_category.get(category, 0),
+        }
+        for category, amount in Budget.objects.filter(user_id=user_id, month=month)
+        .order_by("category")
+        .values_list("category", "amount")
+    ]
@@ -0,0 +1,218 @@
+"""Chat 비동기 작업 큐 — Redis 리스트 + 로컬 워커 (외부 브로커 없음)
+
+흐름:
+    ChatView(async_mode) → enqueue_chat_job() → 202 + job_id
+    run_chat_worker 명령 → run_next_chat_job() → run_agent_loop → 결과 저장
+    클라이언트 → GET /chat/jobs/<job_id>/ 폴링
+
+LLM 프로바이더별 동시 실행 수는 Redis sorted set 리스(lease)로 제한합니다.
+워커가 죽어도 리스가 만료되면 슬롯이 자동 반환됩니다.
+
+꺼낸 작업은 BLMOVE로 처리 중 리스트(chatjobs:processing)에 옮겨 두고
+끝나면 지웁니다. 워커가 중간에 죽어 남은 작업은 reap_stale_jobs()가 정리:
+    아직 실행 전(queued) → 큐로 되돌림
+    실행 중(running)     → failed (Agent가 이미 거래를 썼을 수 있어 재실행 안 함)
+"""
+
+import json
+import time
+import uuid
+
+from django.conf import settings
+from django_redis import get_redis_connection
+
+JOB_QUEUE_KEY = "chatjobs:queue"
+PROCESSING_KEY = "chatjobs:processing"
+JOB_KEY_PREFIX = "chatjob:"
+RUNNING_KEY_PREFIX = "chatjobs:running:"
+
+# 만료된 리스 정리 → 빈 슬롯이 있으면 점유 (원자적)
+_ACQUIRE_SLOT_LUA = """
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', ARGV[1])
+if redis.call('ZCARD', KEYS[1]) >= tonumber(ARGV[3]) then
+    return 0
+end
+redis.call('ZADD', KEYS[1], ARGV[2], ARGV[4])
+return 1
+"""
+
+# 처리 중 리스트의 작업 1개 점검 (원자적)
+#   claimed_at 없음 → 지금 시각을 찍고 다음 점검까지 유예 (BLMOVE 직후일 수 있음)
+#   claimed_at 이 리스 시간보다 오래됨 → 큐로 되돌리거나 failed 처리
+_REAP_JOB_LUA = """
+if redis.call('EXISTS', KEYS[3]) == 0 then
+    redis.call('LREM', KEYS[1], 0, ARGV[1])
+    return 'expired'
+end
+local claimed = redis.call('HGET', KEYS[3], 'claimed_at')
+if not claimed then
+    redis.call('HSET', KEYS[3], 'claimed_at', ARGV[2])
+    return 'stamped'
+end
+if tonumber(ARGV[2]) - tonumber(claimed) < tonumber(ARGV[3]) then
+    return 'alive'
+end
+redis.call('LREM', KEYS[1], 0, ARGV[1])
+if redis.call('HGET', KEYS[3], 'status') == 'running' then
+    redis.call('HSET', KEYS[3], 'status', 'failed', 'detail', ARGV[4])
+    return 'failed'
+end
+redis.call('HSET', KEYS[3], 'status', 'queued')
+redis.call('HDEL', KEYS[3], 'claimed_at')
+redis.call('LPUSH', KEYS[2], ARGV[1])
+return 'requeued'
+"""
+
+
+def _provider(llm_provider: str | None) -> str:
+    return (llm_provider or settings.LLM_PROVIDER or "groq").strip().lower()
+
+
+def build_chat_payload(result: dict) -> dict:
+    """run_agent_loop 결과 → POST /chat/ 응답 본문."""
+    # tx_id는 마지막 생성 건, undo_token은 이 메시지의 작업 그룹 전체 (생성 + 삭제)
+    created_txs = result.get("created_txs", [])
+    last_tx = created_txs[-1] if created_txs else {}
+    return {
+        "reply": result["reply"],
+        "tx_id": last_tx.get("tx_id"),
+        "undo_token": result.get("undo_token") or last_tx.get("undo_token"),
+        "needs_clarification": False,  # Agent가 알아서 질문함
+    }
+
+
+def enqueue_chat_job(user_id: str, message: str, llm_provider: str | None) -> str:
+    """작업을 큐에 넣고 job_id 반환."""
+    job_id = str(uuid.uuid4())
+    redis = get_redis_connection("default")
+    key = f"{JOB_KEY_PREFIX}{job_id}"
+    pipe = redis.pipeline()
+    pipe.hset(
+        key,
+        mapping={
+            "status": "queued",
+            "user_id": user_id,
+            "message": message,
+            "llm_provider": _provider(llm_provider),
+        },
+    )
+    pipe.expire(key, settings.CHAT_JOB_TTL_SECONDS)
+    pipe.lpush(JOB_QUEUE_KEY, job_id)
+    pipe.execute()
+    return job_id
+
+
+def get_chat_job(job_id: str, user_id: str) -> dict | None:
+    """작업 상태 조회. 없거나 다른 사용자의 작업이면 None."""
+    redis = get_redis_connection("default")
+    raw = redis.hgetall(f"{JOB_KEY_PREFIX}{job_id}")
+    job = {
+        (k.decode("utf-8") if isinstance(k, bytes) else k): (
+            v.decode("utf-8") if isinstance(v, bytes) else v
+        )
+        for k, v in raw.items()
+    }
+    if not job or job.get("user_id") != user_id:
+        return None
+
+    response = {"job_id": job_id, "status": job["status"]}
+    if job["status"] == "done":
+        response["result"] = json.loads(job["result"])
+    elif job["status"] == "failed":
+        response["detail"] = job.get("detail")
+    return response
+
+
+def _acquire_slot(redis, provider: str, job_id: str) -> bool:
+    now = time.time()
+    return bool(
+        redis.eval(
+            _ACQUIRE_SLOT_LUA,
+            1,
+            f"{RUNNING_KEY_PREFIX}{provider}",
+            now,
+            now + settings.CHAT_JOB_LEASE_SECONDS,
+            settings.CHAT_JOB_PROVIDER_CONCURRENCY,
+            job_id,
+        )
+    )
+
+
+def run_next_chat_job(timeout: int = 5) -> bool:
+    """
+    큐에서 작업 1개를 꺼내 실행. 처리(또는 재대기)했으면 True.
+
+    큐는 LPUSH로 넣고 오른쪽에서 꺼내므로, 프로바이더 슬롯이 가득 차면
+    작업을 LPUSH로 맨 뒤에 다시 세우고 잠시 쉽니다 (다른 프로바이더 작업이 먼저 실행됨).
+    """
+    from ledger.services.orchestrator import run_agent_loop
+
+    redis = get_redis_connection("default")
+    popped = redis.blmove(JOB_QUEUE_KEY, PROCESSING_KEY, timeout, "RIGHT", "LEFT")
+    if not popped:
+        return False
+
+    job_id = popped.decode("utf-8") if isinstance(popped, bytes) else popped
+    key = f"{JOB_KEY_PREFIX}{job_id}"
+    fields = redis.hmget(key, "user_id", "message", "llm_provider")
+    if fields[0] is None:
+        redis.lrem(PROCESSING_KEY, 0, job_id)  # TTL 만료된 작업
+        return True
+    redis.hset(key, "claimed_at", time.time())
+    user_id, message, provider = (
+        v.decode("utf-8") if isinstance(v, bytes) else v for v in fields
+    )
+
+    if not _acquire_slot(redis, provider, job_id):
+        pipe = redis.pipeline()
+        pipe.hdel(key, "claimed_at")
+        pipe.lrem(PROCESSING_KEY, 0, job_id)
+        pipe.lpush(JOB_QUEUE_KEY, job_id)  # 줄 맨 뒤로
+        pipe.execute()
+        time.sleep(settings.CHAT_JOB_RETRY_DELAY_SECONDS)
+        return True
+
+    redis.hset(key, "status", "running")
+    try:
+        result = run_agent_loop(user_id, message, provider_override=provider)
+        redis.hset(
+            key,
+            mapping={
+                "status": "done",
+                "result": json.dumps(build_chat_payload(result), ensure_ascii=False),
+            },
+        )
+    except Exception as e:
+        redis.hset(key, mapping={"status": "failed", "detail": f"Agent 오류: {str(e)}"})
+    finally:
+        redis.zrem(f"{RUNNING_KEY_PREFIX}{provider}", job_id)
+        redis.lrem(PROCESSING_KEY, 0, job_id)
+    return True
+
+
+def reap_stale_jobs() -> dict:
+    """
+    워커가 죽어 처리 중 리스트에 남은 작업 정리. 결과별 건수 반환.
+
+    claimed_at 이 CHAT_JOB_LEASE_SECONDS 보다 오래된 작업만 건드립니다
+    (Agent 루프는 AGENT_TIME_BUDGET_SECONDS 안에 끝나므로 살아 있는 작업은 해당 없음).
+    """
+    redis = get_redis_connection("default")
+    now = time.time()
+    counts = {}
+    for raw in redis.lrange(PROCESSING_KEY, 0, -1):
+        job_id = raw.decode("utf-8") if isinstance(raw, bytes) else raw
+        outcome = redis.eval(
+            _REAP_JOB_LUA,
+            3,
+            PROCESSING_KEY,
+            JOB_QUEUE_KEY,
+            f"{JOB_KEY_PREFIX}{job_id}",
+            job_id,
+            now,
+            settings.CHAT_JOB_LEASE_SECONDS,
+            "워커가 중단되어 작업을 완료하지 못했습니다. 다시 요청해주세요.",
+        )
+        outcome = outcome.decode("utf-8") if isinstance(outcome, bytes) else outcome
+        counts[outcome] = counts.get(outcome, 0) + 1
+    return counts
@@ -0,0 +1,289 @@
+"""Intent Pre-Router — LLM 없이 처리 가능한 조회/삭제/요약 요청을 규칙으로 처리
+
+"오늘 내역 삭제해줘", "23000원 삭제", "이번 달 얼마 썼어?" 처럼
+날짜/금액/카테고리와 의도 키워드만으로 이루어진 문장은 서비스 계층을 직접 호출합니다.
+해석되지 않는 단어가 하나라도 남거나 의도가 모호하면 None을 반환해 LLM에 맡깁니다.
+
+여러 건을 지우는 요청은 바로 삭제하지 않고 대상 목록을 보여준 뒤,
+"삭제 확인" 메시지가 오면 그때 저장해 둔 대상만 삭제합니다.
+"""
+
+import calendar
+import json
+import logging
+import re
+import threading
+import time
+from datetime import date, timedelta
+
+from django_redis import get_redis_connection
+
+from ledger.services.normalizer import (
+    CATEGORIES,
+    CATEGORY_ALIASES,
+    normalize_amount,
+    normalize_date,
+)
+from ledger.services.transaction_command import TransactionCommandService
+from ledger.services.transaction_query import TransactionQueryService
+
+logger = logging.getLogger(__name__)
+
+_INTENT_KEYWORDS = {
+    "delete": ("삭제", "지워", "지우"),
+    "summary": ("얼마 썼", "얼마썼", "얼마 나왔", "합계", "총 지출", "총지출", "요약"),
+    "search": ("보여", "조회", "검색", "찾아", "알려"),
+}
+
+_DATE_PATTERNS = (
+    re.compile(r"\d{4}-\d{1,2}-\d{1,2}"),
+    re.compile(r"\d{1,2}월\s*\d{1,2}일"),
+    re.compile(r"(?<![\d,])\d{1,2}/\d{1,2}(?!\d)"),
+)
+_AMOUNT_RE = re.compile(r"\d+(?:\.\d+)?\s*만\s*원?|\d{1,3}(?:,\d{3})+\s*원?|\d+\s*원")
+_FILLER_RE = re.compile(
+    r"내역|거래|기록|지출|전부|모두|모든|해\s*줘|해주세요|줘|주세요|좀|다|것|건|요|어|\?|!|\.|,"
+)
+
+_CONFIRM_RE = re.compile(r"^\s*삭제\s*확인\s*[.!]?\s*$")
+
+# 확인 대기 중인 일괄 삭제 대상 (tx_id JSON 목록)
+PENDING_DELETE_KEY_PREFIX = "intent:pending_delete:"
+PENDING_DELETE_TTL_SECONDS = 300
+
+_stats_lock = threading.Lock()
+_STATS: dict[str, dict] = {}
+
+
+def router_stats() -> dict:
+    """의도별 적중(hits)/LLM 위임(fallbacks) 수와 평균 처리 시간."""
+    with _stats_lock:
+        return {
+            intent: {
+                "hits": s["hits"],
+                "fallbacks": s["fallbacks"],
+                "hit_rate": round(s["hits"] / (s["hits"] + s["fallbacks"]), 3),
+                "avg_ms": round(s["total_ms"] / (s["hits"] + s["fallbacks"]), 3),
+            }
+            for intent, s in _STATS.items()
+        }
+
+
+def _record(intent: str, hit: bool, elapsed_ms: float) -> None:
+    with _stats_lock:
+        s = _STATS.setdefault(intent, {"hits": 0, "fallbacks": 0, "total_ms": 0.0})
+        s["hits" if hit else "fallbacks"] += 1
+        s["total_ms"] += elapsed_ms
+    logger.info(
+        "intent_router intent=%s hit=%s elapsed_ms=%.2f", intent, hit, elapsed_ms
+    )
+
+
+def _month_range(month_start: date) -> tuple[date, date]:
+    last_day = calendar.monthrange(month_start.year, month_start.month)[1]
+    return month_start, month_start.replace(day=last_day)
+
+
+def parse_message(message: str, today: date | None = None) -> dict | None:
+    """
+    문장 → {intent, from_date, to_date, amount, category}.
+    해석할 수 없는 단어가 남거나 의도가 하나로 정해지지 않으면 None.
+    """
+    today = today or date.today()
+    text = message.strip()
+    parsed = {
+        "from_date": None,
+        "to_date": None,
+        "month": None,
+        "amount": None,
+        "category": None,
+    }
+
+    # 1) 의도 키워드 (정확히 한 종류만)
+    intents = [
+        intent
+        for intent, words in _INTENT_KEYWORDS.items()
+        if any(word in text for word in words)
+    ]
+    if len(intents) != 1:
+        return None
+    parsed["intent"] = intents[0]
+    for word in _INTENT_KEYWORDS[parsed["intent"]]:
+        text = text.replace(word, " ")
+
+    # 2) 날짜 (상대 표현 → 절대 표현)
+    dates = []
+    relative_days = {"그저께": 2, "그제": 2, "어제": 1, "오늘": 0}
+    for word, days in relative_days.items():
+        if word in text:
+            dates.append(today - timedelta(days=days))
+            text = text.replace(word, " ")
+    for pattern in _DATE_PATTERNS:
+        for token in pattern.findall(text):
+            try:
+                dates.append(normalize_date(token.replace(" ", ""), reference=today))
+            except ValueError:
+                return None
+            text = text.replace(token, " ", 1)
+    months = {
+        r"이번\s*달": today.replace(day=1),
+        r"지난\s*달": (today.replace(day=1) - timedelta(days=1)).replace(day=1),
+    }
+    for pattern, month_start in months.items():
+        if re.search(pattern, text):
+            if parsed["month"]:
+                return None
+            parsed["month"] = month_start.strftime("%Y-%m")
+            parsed["from_date"], parsed["to_date"] = _month_range(month_start)
+            text = re.sub(pattern, " ", text)
+    if dates:
+        if len(dates) > 1 or parsed["from_date"]:
+            return None
+        parsed["from_date"] = parsed["to_date"] = dates[0]
+
+    # 3) 금액 (하나만)
+    amounts = _AMOUNT_RE.findall(text)
+    if len(amounts) > 1:
+        return None
+    if amounts:
+        try:
+            parsed["amount"] = normalize_amount(amounts[0])
+        except ValueError:
+            return None
+        text = text.replace(amounts[0], " ", 1)
+
+    # 4) 카테고리 (정확히 일치하는 단어만)
+    words = _FILLER_RE.sub(" ", text).split()
+    for word in list(words):
+        category = CATEGORY_ALIASES.get(word, word)
+        if category in CATEGORIES and category != "기타":
+            if parsed["category"]:
+                return None
+            parsed["category"] = category
+            words.remove(word)
+
+    # 해석하지 못한 단어(가맹점명 등)가 남으면 LLM에 위임
+    if words:
+        return None
+    return parsed
+
+
+def _format_rows(rows: list[dict]) -> str:
+    return "\n".join(
+        f"- {r['date']} {r['merchant'] or r['category']} {r['amount']:,}원"
+        for r in rows
+    )
+
+
+def _handle(user_id: str, p: dict) -> dict | None:
+    intent = p["intent"]
+
+    if intent == "summary":
+        if not p["from_date"] or p["amount"]:
+            return None
+        period = (
+            {"month": p["month"]}
+            if p["month"]
+            else {"from_date": p["from_date"], "to_date": p["to_date"]}
+        )
+        summary = TransactionQueryService.get_summary(
+            user_id, category=p["category"], **period
+        )
+        if p["category"]:
+            return {
+                "reply": f"{summary['label']} {p['category']} 지출은 {summary['total']:,}원이에요."
+            }
+        reply = f"{summary['label']} 지출 합계는 {summary['total']:,}원이에요."
+        top = list(summary["by_category"].items())[:3]
+        if top:
+            reply += "\n" + "\n".join(f"- {cat} {amt:,}원" for cat, amt in top)
+        return {"reply": reply}
+
+    if not (p["from_date"] or p["amount"] or p["category"]):
+        return None
+    rows = TransactionQueryService.search_transactions(
+        user_id=user_id,
+        start_date=p["from_date"],
+        end_date=p["to_date"],
+        min_amount=p["amount"],
+        max_amount=p["amount"],
+        category=p["category"],
+    )
+
+    if intent == "search":
+        if not rows:
+            return {"reply": "일치하는 거래 내역을 찾지 못했어요."}
+        return {"reply": f"{len(rows)}건을 찾았어요.\n{_format_rows(rows)}"}
+
+    # delete — 대상은 search 결과(최대 10건)가 아니라 조건에 맞는 전부
+    tx_ids = TransactionCommandService.match_transaction_ids(
+        user_id,
+        start_date=p["from_date"],
+        end_date=p["to_date"],
+        amount=p["amount"],
+        category=p["category"],
+    )
+    # 날짜 없이 금액/카테고리만으로는 정확히 1건일 때만 삭제
+    if not p["from_date"] and len(tx_ids) > 1:
+        return None
+    if not tx_ids:
+        return {"reply": "일치하는 거래 내역을 찾지 못했어요."}
+    if len(tx_ids) > 1:
+        return _ask_delete_confirmation(user_id, tx_ids, rows)
+    return _delete(user_id, tx_ids)
+
+
+def _delete(user_id: str, tx_ids: list[str]) -> dict | None:
+    result = TransactionCommandService.delete_transactions_by_ids(user_id, tx_ids)
+    if not result.get("success"):
+        return None
+    return {"reply": result["message"], "deleted_count": len(result["details"])}
+
+
+def _ask_delete_confirmation(user_id: str, tx_ids: list[str], rows: list[dict]) -> dict:
+    """일괄 삭제 대상을 저장해 두고 확인을 요청 (아직 삭제하지 않음)."""
+    get_redis_connection("default").set(
+        f"{PENDING_DELETE_KEY_PREFIX}{user_id}",
+        json.dumps(tx_ids),
+        ex=PENDING_DELETE_TTL_SECONDS,
+    )
+    reply = f"{len(tx_ids)}건이 삭제 대상이에요.\n{_format_rows(rows)}"
+    if len(tx_ids) > len(rows):
+        reply += f"\n- 외 {len(tx_ids) - len(rows)}건"
+    reply += "\n모두 지우려면 '삭제 확인'이라고 보내주세요."
+    return {"reply": reply}
+
+
+def _confirm_delete(user_id: str) -> dict:
+    """저장해 둔 일괄 삭제 대상을 삭제 (한 번만 사용)."""
+    raw = get_redis_connection("default").getdel(
+        f"{PENDING_DELETE_KEY_PREFIX}{user_id}"
+    )
+    if not raw:
+        return {"reply": "확인할 삭제 요청이 없어요. 지울 내역을 다시 말씀해주세요."}
+    return _delete(user_id, json.loads(raw)) or {
+        "reply": "삭제할 내역을 찾지 못했어요. 이미 삭제되었을 수 있어요."
+    }
+
+
+def route_intent(user_id: str, message: str) -> dict | None:
+    """
+    규칙으로 처리 가능하면 run_agent_loop와 같은 형태의 결과를, 아니면 None 반환.
+    """
+    started = time.perf_counter()
+    if _CONFIRM_RE.match(message):
+        intent, handled = "delete_confirm", _confirm_delete(user_id)
+    else:
+        parsed = parse_message(message)
+        intent = parsed["intent"] if parsed else "unknown"
+        handled = _handle(user_id, parsed) if parsed else None
+    _record(intent, handled is not None, (time.perf_counter() - started) * 1000)
+    if handled is None:
+        return None
+    return {
+        "reply": handled["reply"],
+        "created_txs": [],
+        "deleted_count": handled.get("deleted_count", 0),
+        "llm_calls": 0,
+        "stop_reason": "pre_router",
+    }
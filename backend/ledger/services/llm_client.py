@@ -5,11 +5,89 @@ Django 동기 뷰 기반이므로 async를 제거하고 직접 동기 호출합
 """
 
 import json
+import threading
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any
 
 from django.conf import settings
 
 
+@dataclass(frozen=True)
+class RequestTemplate:
+    """
+    프로바이더별로 한 번만 컴파일해 두는 요청 템플릿.
+
+    매 턴에는 메시지 조립만 하고 도구 변환/Config 생성은 재사용합니다.
+    """
+
+    style: str  # "gemini" | "openai"
+    tools: Any  # 프로바이더 형식 도구 목록 (없으면 None)
+    config: Any = None  # Gemini GenerateContentConfig
+
+
+# (style, id(tools)) → (tools 원본, RequestTemplate)
+# 원본 참조를 함께 보관해 id 재사용으로 인한 오매칭을 막습니다.
+_TEMPLATE_CACHE: dict[tuple[str, int], tuple[list | None, RequestTemplate]] = {}
+_TEMPLATE_LOCK = threading.Lock()
+
+
+def get_request_template(style: str, tools: list[dict] | None) -> RequestTemplate:
+    """style("gemini"/"openai") + 도구 목록에 대한 컴파일된 템플릿 (프로세스당 1회)."""
+    key = (style, id(tools))
+    cached = _TEMPLATE_CACHE.get(key)
+    if cached and cached[0] is tools:
+        return cached[1]
+    with _TEMPLATE_LOCK:
+        cached = _TEMPLATE_CACHE.get(key)
+        if cached and cached[0] is tools:
+            return cached[1]
+        template = _compile_template(style, tools)
+        _TEMPLATE_CACHE[key] = (tools, template)
+        return template
+
+
+def _compile_template(style: str, tools: list[dict] | None) -> RequestTemplate:
+    if style == "openai":
+        return RequestTemplate(
+            style=style,
+            tools=_gemini_style_to_openai_tools(tools) if tools else None,
+        )
+
+    from google.genai import types
+
+    config_kwargs: dict = {"temperature": 0}
+    tool_objs = None
+    if tools:
+        tool_objs = [types.Tool(function_declarations=tools)]
+        config_kwargs["tools"] = tool_objs
+        config_kwargs["automatic_function_calling"] = (
+            types.AutomaticFunctionCallingConfig(disable=True)
+        )
+    return RequestTemplate(
+        style=style,
+        tools=tool_objs,
+        config=types.GenerateContentConfig(**config_kwargs),
+    )
+
+
+@lru_cache(maxsize=8)
+def _gemini_client(api_key: str):
+    from google import genai
+
+    return genai.Client(api_key=api_key)
+
+
+@lru_cache(maxsize=8)
+def _openai_client(api_key: str, base_url: str | None):
+    from openai import OpenAI
+
+    kwargs = {"api_key": api_key}
+    if base_url:
+        kwargs["base_url"] = base_url
+    return OpenAI(**kwargs)
+
+
 def _gemini_style_to_openai_tools(tools: list[dict]) -> list[dict]:
     """Gemini 형식 도구 → OpenAI/Groq/Grok 형식."""
     out = []
@@ -29,41 +107,82 @@ def _gemini_style_to_openai_tools(tools: list[dict]) -> list[dict]:
     return out
 
 
-def _chat_gemini(messages: list[dict], tools: list[dict] | None) -> dict:
-    from google import genai
+def _gemini_contents(messages: list[dict]) -> tuple[str | None, list]:
+    """
+    대화 기록 → (system_instruction, contents).
+
+    도구 호출 턴은 function_call / function_response 파트로 보내 모델이
+    이전 검색 결과를 그대로 봅니다 (텍스트 기록은 OpenAI 형식 경로용).
+        {"role": "assistant", "function_call": {...}}    → model: function_call
+        {"role": "user", "function_response": {...}, "hint"} → user: function_response (+ 힌트)
+    """
     from google.genai import types
 
+    system = [m["content"] for m in messages if m.get("role") == "system"]
+    contents = []
+    for m in messages:
+        role = m.get("role", "user")
+        if role == "system":
+            continue
+        if m.get("function_call"):
+            fc = m["function_call"]
+            part = types.Part.from_function_call(name=fc["name"], args=fc["args"])
+            # 사고 모델은 서명을 함께 돌려받아야 함수 호출 맥락을 이어감
+            part.thought_signature = fc.get("thought_signature")
+            contents.append(types.Content(role="model", parts=[part]))
+        elif m.get("function_response"):
+            fr = m["function_response"]
+            parts = [
+                types.Part.from_function_response(
+                    name=fr["name"], response={"result": fr["response"]}
+                )
+            ]
+            if m.get("hint"):
+                parts.append(types.Part.from_text(text=m["hint"]))
+            contents.append(types.Content(role="user", parts=parts))
+        else:
+            contents.append(
+                types.Content(
+                    role="model" if role == "assistant" else "user",
+                    parts=[types.Part.from_text(text=m.get("content") or "")],
+                )
+            )
+    return ("\n\n".join(system) or None), contents
+
+
+def _chat_gemini(messages: list[dict], tools: list[dict] | None) -> dict:
     if not settings.GEMINI_API_KEY:
         raise ValueError("GEMINI_API_KEY가 설정되지 않았습니다. .env에 추가하세요.")
-    client = genai.Client(api_key=settings.GEMINI_API_KEY)
-    user_msg = next(
-        (m["content"] for m in reversed(messages) if m["role"] == "user"), ""
-    )
-
-    config_kwargs: dict = {"temperature": 0}
-    if tools:
-        tool_objs = [types.Tool(function_declarations=tools)]
-        config_kwargs["tools"] = tool_objs
-        config_kwargs["automatic_function_calling"] = (
-            types.AutomaticFunctionCallingConfig(disable=True)
-        )
-    config = types.GenerateContentConfig(**config_kwargs)
+    client = _gemini_client(settings.GEMINI_API_KEY)
+    template = get_request_template("gemini", tools)
+    system_instruction, contents = _gemini_contents(messages)
+    config = template.config
+    if system_instruction:
+        config = config.model_copy(update={"system_instruction": system_instruction})
 
     response = client.models.generate_content(
         model=settings.GEMINI_MODEL,
-        contents=user_msg,
+        contents=contents,
         config=config,
     )
 
     function_call = None
-    if response.candidates and response.candidates[0].content.parts:
-        part = response.candidates[0].content.parts[0]
-        if hasattr(part, "function_call") and part.function_call:
+    texts = []
+    candidate = response.candidates[0] if response.candidates else None
+    parts = candidate.content.parts if candidate and candidate.content else None
+    for part in parts or []:
+        if part.function_call and function_call is None:
             fc = part.function_call
             function_call = {"name": fc.name, "args": dict(fc.args) if fc.args else {}}
+            if part.thought_signature:
+                function_call["thought_signature"] = part.thought_signature
+        elif part.text and not part.thought:
+            texts.append(part.text)
+    usage = getattr(response, "usage_metadata", None)
     return {
-        "content": response.text if response.text else None,
+        "content": "".join(texts) or None,
         "function_call": function_call,
+        "total_tokens": getattr(usage, "total_token_count", None),
     }
 
 
@@ -76,17 +195,12 @@ def _chat_openai_style(
     tools: list[dict] | None,
 ) -> dict:
     """Ollama / Groq / Grok(OpenAI 호환) 공통."""
-    from openai import OpenAI
-
     if provider != "ollama" and not api_key:
         raise ValueError(
             f"{provider.upper()}_API_KEY가 설정되지 않았습니다. .env에 추가하세요."
         )
-    kwargs = {"api_key": api_key or "ollama"}
-    if base_url:
-        kwargs["base_url"] = base_url
-    client = OpenAI(**kwargs)
-    openai_tools = _gemini_style_to_openai_tools(tools) if tools else None
+    client = _openai_client(api_key or "ollama", base_url)
+    template = get_request_template("openai", tools)
 
     chat_messages: list[dict[str, Any]] = []
     for m in messages:
@@ -100,8 +214,8 @@ def _chat_openai_style(
         chat_messages.append({"role": "user", "content": ""})
 
     kwargs_create = {"model": model, "messages": chat_messages, "temperature": 0}
-    if openai_tools:
-        kwargs_create["tools"] = openai_tools
+    if template.tools:
+        kwargs_create["tools"] = template.tools
         kwargs_create["tool_choice"] = "auto"
 
     response = client.chat.completions.create(**kwargs_create)
@@ -125,7 +239,12 @@ def _chat_openai_style(
             except json.JSONDecodeError:
                 args = {}
             function_call = {"name": name, "args": args}
-    return {"content": content, "function_call": function_call}
+    usage = getattr(response, "usage", None)
+    return {
+        "content": content,
+        "function_call": function_call,
+        "total_tokens": getattr(usage, "total_tokens", None),
+    }
 
 
 def chat_completion(
@@ -136,6 +255,9 @@ def chat_completion(
     """
     LLM 호출 (provider: ollama 로컬 GPU | gemini | groq | grok).
     동기 함수 — Django 동기 뷰에서 직접 호출.
+
+    Returns:
+        dict with content, function_call, total_tokens (프로바이더가 보고하지 않으면 None)
     """
     provider = (provider_override or settings.LLM_PROVIDER or "groq").strip().lower()
     if provider == "ollama":
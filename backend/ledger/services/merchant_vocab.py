@@ -0,0 +1,226 @@
+"""가맹점 어휘 인덱스 — 사용자별 가맹점명 퍼지 매칭 ("스벅" → "스타벅스")
+
+- 저장: Redis SET merchant_vocab:{user_id} + 버전 카운터
+  (거래 생성이 커밋되면 SADD, 새 가맹점일 때만 버전 증가)
+- 조회: 프로세스 내 MerchantIndex(음절 역색인 + bigram 역색인)를
+  버전이 바뀔 때만 다시 구성하므로 매칭 자체는 메모리에서 끝납니다.
+- 인덱스가 없는 사용자는 첫 조회 시 DB의 DISTINCT merchant로 초기화
+
+Redis 장애 시에는 퍼지 확장 없이 기존 icontains 검색만 동작합니다.
+"""
+
+import logging
+import threading
+from collections import Counter, OrderedDict
+
+from django_redis import get_redis_connection
+from redis.exceptions import RedisError
+
+from core.db_router import read_db_for
+from ledger.models import Transaction
+
+logger = logging.getLogger(__name__)
+
+VOCAB_KEY_PREFIX = "merchant_vocab:"
+VERSION_KEY_PREFIX = "merchant_vocab_ver:"
+_MAX_CACHED_USERS = 256
+_REBUILD_CHUNK = 1000
+_TYPO_CANDIDATES = 32
+
+# 초기화된 사용자만 증분 추가 (미초기화 상태에서 추가하면 DB 초기화가 생략되므로)
+_ADD_SCRIPT = """
+if redis.call('EXISTS', KEYS[2]) == 0 then return 0 end
+if redis.call('SADD', KEYS[1], ARGV[1]) == 0 then return 0 end
+return redis.call('INCR', KEYS[2])
+"""
+
+_lock = threading.Lock()
+_INDEXES: "OrderedDict[str, MerchantIndex]" = OrderedDict()
+
+
+def _normalize(text: str) -> str:
+    return "".join(text.lower().split())
+
+
+def _bigrams(text: str) -> set[str]:
+    return {text[i : i + 2] for i in range(len(text) - 1)}
+
+
+def _is_subsequence(keyword: str, name: str) -> bool:
+    it = iter(name)
+    return all(ch in it for ch in keyword)
+
+
+def _within_distance(a: str, b: str, limit: int) -> bool:
+    """Levenshtein 거리 ≤ limit (행 최솟값이 limit을 넘으면 조기 종료)."""
+    if abs(len(a) - len(b)) > limit:
+        return False
+    prev = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        cur = [i]
+        for j, cb in enumerate(b, 1):
+            cur.append(min(prev[j] + 1, cur[j - 1] + 1, prev[j - 1] + (ca != cb)))
+        if min(cur) > limit:
+            return False
+        prev = cur
+    return prev[-1] <= limit
+
+
+class MerchantIndex:
+    """
+    한 사용자의 가맹점명 역색인.
+
+    1) 키워드의 모든 음절을 순서대로 포함하는 가맹점 (약어: 스벅 → 스타벅스)
+    2) 없으면 bigram이 충분히 겹치는 후보 중 편집거리 이내 (오타: 스타벅수)
+    """
+
+    __slots__ = ("version", "names", "_keys", "_positions", "_chars", "_grams")
+
+    def __init__(self, names=(), version: int = 0):
+        self.version = version
+        self.names: list[str] = []
+        self._keys: list[str] = []
+        self._positions: dict[str, int] = {}
+        self._chars: dict[str, set[int]] = {}
+        self._grams: dict[str, set[int]] = {}
+        for name in names:
+            self.add(name)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def add(self, name: str) -> bool:
+        key = _normalize(name)
+        if not key or name in self._positions:
+            return False
+        idx = len(self.names)
+        self._positions[name] = idx
+        self.names.append(name)
+        self._keys.append(key)
+        for ch in set(key):
+            self._chars.setdefault(ch, set()).add(idx)
+        for gram in _bigrams(key):
+            self._grams.setdefault(gram, set()).add(idx)
+        return True
+
+    def match(self, keyword: str, limit: int = 5) -> list[str]:
+        kw = _normalize(keyword)
+        if not kw:
+            return []
+
+        scores: dict[int, float] = {}
+        postings = [self._chars.get(ch) for ch in set(kw)]
+        if all(postings):
+            postings.sort(key=len)
+            for idx in set.intersection(*postings):
+                key = self._keys[idx]
+                if _is_subsequence(kw, key):
+                    # 연속 포함 > 같은 글자로 시작 > 짧은 이름 순
+                    scores[idx] = (
+                        (kw in key) * 2 + (key[0] == kw[0]) + len(kw) / len(key)
+                    )
+
+        if not scores and len(kw) >= 3:
+            max_dist = 1 if len(kw) < 6 else 2
+            # 짧은 키워드는 한 글자 오타로 bigram이 모두 깨지므로 음절 겹침으로 후보 선정
+            postings = self._grams if len(kw) >= 5 else self._chars
+            units = _bigrams(kw) if len(kw) >= 5 else set(kw)
+            lists = sorted((postings.get(unit, ()) for unit in units), key=len)
+            # "점", "강남"처럼 흔한 음절/bigram은 후보 선정에서 제외 (최소 2개 유지)
+            common = max(64, len(self.names) // 20)
+            lists = lists[:2] + [p for p in lists[2:] if len(p) <= common]
+            overlaps = Counter()
+            for posting in lists:
+                overlaps.update(posting)
+            needed = max(1, len(lists) - 2 * max_dist)
+            # 겹침이 많은 상위 후보만 편집거리 검증 (흔한 지점명 접미사 대비)
+            # 지점명이 붙은 이름("스타벅스 강남점")은 앞부분만 비교해도 매칭
+            for idx, shared in overlaps.most_common(_TYPO_CANDIDATES):
+                key = self._keys[idx]
+                if shared >= needed and (
+                    _within_distance(kw, key, max_dist)
+                    or _within_distance(kw, key[: len(kw)], max_dist)
+                ):
+                    scores[idx] = shared / len(lists)
+
+        ranked = sorted(scores, key=lambda idx: (-scores[idx], len(self._keys[idx])))
+        return [self.names[idx] for idx in ranked[:limit]]
+
+
+def _vocab_keys(user_id: str) -> tuple[str, str]:
+    return f"{VOCAB_KEY_PREFIX}{user_id}", f"{VERSION_KEY_PREFIX}{user_id}"
+
+
+def rebuild_vocabulary(user_id: str) -> int:
+    """DB의 가맹점 목록으로 어휘 SET을 다시 채우고 새 버전을 반환."""
+    vocab_key, version_key = _vocab_keys(user_id)
+    merchants = list(
+        Transaction.objects.using(read_db_for(user_id))
+        .filter(user_id=user_id, merchant__gt="")
+        .values_list("merchant", flat=True)
+        .order_by()  # Meta.ordering 컬럼이 DISTINCT에 섞이지 않도록
+        .distinct()
+    )
+    redis = get_redis_connection("default")
+    pipe = redis.pipeline()
+    pipe.delete(vocab_key)
+    for i in range(0, len(merchants), _REBUILD_CHUNK):
+        pipe.sadd(vocab_key, *merchants[i : i + _REBUILD_CHUNK])
+    pipe.incr(version_key)
+    return pipe.execute()[-1]
+
+
+def _load_index(user_id: str) -> MerchantIndex:
+    vocab_key, version_key = _vocab_keys(user_id)
+    redis = get_redis_connection("default")
+    version = redis.get(version_key)
+    version = int(version) if version is not None else rebuild_vocabulary(user_id)
+
+    with _lock:
+        index = _INDEXES.get(user_id)
+        if index is not None and index.version == version:
+            _INDEXES.move_to_end(user_id)
+            return index
+
+    names = sorted(m.decode() for m in redis.smembers(vocab_key))
+    index = MerchantIndex(names, version)
+    with _lock:
+        _INDEXES[user_id] = index
+        _INDEXES.move_to_end(user_id)
+        while len(_INDEXES) > _MAX_CACHED_USERS:
+            _INDEXES.popitem(last=False)
+    return index
+
+
+def add_merchant(user_id: str, merchant: str | None) -> None:
+    """거래 생성 커밋 후 호출 — 새 가맹점이면 어휘에 추가."""
+    if not merchant or not merchant.strip():
+        return
+    vocab_key, version_key = _vocab_keys(user_id)
+    try:
+        version = get_redis_connection("default").eval(
+            _ADD_SCRIPT, 2, vocab_key, version_key, merchant
+        )
+    except RedisError:
+        logger.warning("merchant_vocab add failed user=%s", user_id, exc_info=True)
+        return
+    if not version:
+        return
+    # 이 프로세스의 인덱스가 직전 버전이면 재구성 없이 증분 반영
+    with _lock:
+        index = _INDEXES.get(user_id)
+        if index is not None and index.version == version - 1:
+            index.add(merchant)
+            index.version = version
+
+
+def expand_merchant_keyword(user_id: str, keyword: str, limit: int = 5) -> list[str]:
+    """키워드가 가리킬 가능성이 높은 가맹점명 목록 (SQL merchant__in 용)."""
+    if not keyword or not keyword.strip():
+        return []
+    try:
+        index = _load_index(user_id)
+    except RedisError:
+        logger.warning("merchant_vocab lookup failed user=%s", user_id, exc_info=True)
+        return []
+    return index.match(keyword, limit=limit)
@@ -1,11 +1,22 @@
 """Orchestrator — Agentic LLM Logic"""
 
 import json
+import logging
+import re
+import threading
+import time
+import uuid
 from datetime import date
+from functools import lru_cache
 
+from django.conf import settings
+
+from ledger.services.intent_router import route_intent
 from ledger.services.llm_client import chat_completion
+from ledger.services.normalizer import normalize_date
 from ledger.services.transaction_command import TransactionCommandService
 from ledger.services.transaction_query import TransactionQueryService
+from ledger.services.undo import undo_group
 
 # ── 도구 정의 ──
 
@@ -64,21 +75,84 @@ DELETE_TRANSACTIONS_TOOL = {
     },
 }
 
-TOOLS = [CREATE_TRANSACTION_TOOL, SEARCH_TRANSACTIONS_TOOL, DELETE_TRANSACTIONS_TOOL]
+UPDATE_TRANSACTION_TOOL = {
+    "name": "update_transaction",
+    "description": "tx_id의 거래를 수정합니다. 바꿀 필드만 넘기세요. "
+    "search_transactions로 찾은 ID를 사용하고, 삭제 후 다시 생성하지 마세요.",
+    "parameters": {
+        "type": "object",
+        "properties": {
+            "tx_id": {"type": "string", "description": "수정할 거래의 tx_id"},
+            "occurred_date": {"type": "string", "description": "YYYY-MM-DD"},
+            "type": {"type": "string", "enum": ["expense", "income"]},
+            "amount": {"type": "integer"},
+            "category": {"type": "string"},
+            "subcategory": {"type": "string"},
+            "merchant": {"type": "string"},
+            "memo": {"type": "string"},
+        },
+        "required": ["tx_id"],
+    },
+}
+
+GET_SUMMARY_TOOL = {
+    "name": "get_summary",
+    "description": "기간별 카테고리 합계를 DB에서 집계합니다. '얼마 썼어', '지난달보다' 같은 합계/비교 질문에 사용하세요. "
+    "search_transactions 결과를 직접 더하지 마세요.",
+    "parameters": {
+        "type": "object",
+        "properties": {
+            "month": {
+                "type": "string",
+                "description": "YYYY-MM. 기간이 없으면 이번 달.",
+            },
+            "start_date": {"type": "string", "description": "YYYY-MM-DD"},
+            "end_date": {"type": "string", "description": "YYYY-MM-DD"},
+            "category": {
+                "type": "string",
+                "description": "식비, 교통 등 상위 카테고리",
+            },
+            "type": {"type": "string", "enum": ["expense", "income"]},
+            "compare_previous": {
+                "type": "boolean",
+                "description": "직전 기간(전월 등)과 비교",
+            },
+        },
+    },
+}
+
+TOOLS = [
+    CREATE_TRANSACTION_TOOL,
+    SEARCH_TRANSACTIONS_TOOL,
+    DELETE_TRANSACTIONS_TOOL,
+    UPDATE_TRANSACTION_TOOL,
+    GET_SUMMARY_TOOL,
+]
+TOOLS_JSON = json.dumps(TOOLS, ensure_ascii=False, separators=(",", ":"))
+
+logger = logging.getLogger(__name__)
 
 
 def _system_prompt() -> str:
-    today = date.today().isoformat()
+    # 날짜가 바뀌면 캐시 키가 달라져 자동으로 다시 렌더링됨
+    return _render_system_prompt(date.today().isoformat())
+
+
+@lru_cache(maxsize=2)
+def _render_system_prompt(today: str) -> str:
     return f"""당신은 유능한 가계부 AI 에이전트입니다.
 오늘 날짜: {today}
 
 **원칙**:
-1. 사용자의 요청을 **검색(Search) → 판단 → 실행(Create/Delete)** 순서로 처리하세요.
-2. **삭제 요청 시**: 무조건 `search_transactions`로 내역을 먼저 확인하고, **검색 결과가 있으면 즉시 `delete_transactions`로 ID를 넘겨 삭제하세요.** (다시 검색하지 마세요)
-3. "오늘 내역 삭제해줘" -> 오늘 날짜로 `search` -> 검색된 **모든** ID로 `delete`.
-4. "23000원 삭제" -> 금액으로 `search` -> 해당되는 것 `delete`.
-5. 검색 결과가 없으면 사용자에게 없다고 알리세요.
-6. **생성(Create)**: 명확하면 바로 생성하세요.
+1. 사용자의 요청을 **검색(Search) → 판단 → 실행(Create/Update/Delete)** 순서로 처리하세요.
+2. **최근 거래 표**: 요청 앞에 `최근 거래` 표가 있으면 먼저 보세요. 삭제/수정할 거래가 표에 있으면 **검색하지 말고** 그 handle(r1, r2 …)을 tx_id로 바로 넘기세요.
+3. **삭제 요청 시**: 표에서 찾지 못하면 `search_transactions`로 내역을 먼저 확인하고, **검색 결과가 있으면 즉시 `delete_transactions`로 ID를 넘겨 삭제하세요.** (다시 검색하지 마세요)
+4. "오늘 내역 삭제해줘" -> 오늘 날짜로 `search` -> 검색된 **모든** ID로 `delete`. (표는 최근 일부만 담으므로 기간 전체 삭제는 검색하세요)
+5. "23000원 삭제" -> 표 또는 금액 `search`에서 해당되는 것 `delete`.
+6. **수정 요청 시**("어제 커피 5천원으로 고쳐줘"): 표나 `search_transactions`로 찾은 ID로 `update_transaction`에 바꿀 필드만 넘기세요. 삭제 후 재생성하지 마세요.
+7. 검색 결과가 없으면 사용자에게 없다고 알리세요.
+8. **생성(Create)**: 명확하면 바로 생성하세요.
+9. **합계/통계 질문**("이번 달 식비 얼마 썼어?", "지난달보다 늘었어?"): `get_summary`로 집계하세요.
 
 **중요**: 도구를 사용할 때는 반드시 Function Calling 형식을 사용하세요. 텍스트로 함수 이름을 쓰지 마세요.
 """
@@ -152,33 +226,240 @@ def _parse_text_tool_call(content: str) -> tuple[str, dict] | None:
                 args["start_date"] = d
                 args["end_date"] = d
 
-        if name in ["create_transaction", "search_transactions", "delete_transactions"]:
+        if name in [
+            "create_transaction",
+            "search_transactions",
+            "delete_transactions",
+            "update_transaction",
+            "get_summary",
+        ]:
             return name, args
 
     return None
 
 
+# 도구 실행 후 LLM에게 줄 다음 행동 힌트 (terminal 도구는 힌트 없이 종료)
+_FOLLOW_UP_HINTS = {
+    "search_transactions": "삭제 요청이면 위 결과의 tx_id들로 delete_transactions를, "
+    "수정 요청이면 해당 tx_id로 update_transaction을 호출하고, "
+    "조회 요청이면 결과를 요약해 답하세요.",
+    "get_summary": "위 집계 결과의 금액을 그대로 사용해 답하세요.",
+}
+# 메시지 속 금액 언급 — "5만3천원", "1만2천500원"처럼 단위가 섞인 금액은 1건
+_AMOUNT_MENTION_RE = re.compile(
+    r"\d[\d,.]*\s*만(?:\s*\d[\d,.]*\s*천)?\d*\s*원?"
+    r"|\d[\d,.]*\s*천\d*\s*원?"
+    r"|\d[\d,.]*\s*원"
+)
+
+_stats_lock = threading.Lock()
+_STATS = {"requests": 0, "llm_calls": 0}
+
+
+def agent_stats() -> dict:
+    """프로세스 누적 통계 — 요청당 평균 LLM 호출 수."""
+    with _stats_lock:
+        requests, calls = _STATS["requests"], _STATS["llm_calls"]
+    return {
+        "requests": requests,
+        "llm_calls": calls,
+        "avg_llm_calls": round(calls / requests, 3) if requests else 0.0,
+    }
+
+
+RECENT_CONTEXT_HEADER = "최근 거래 (handle|날짜|금액, +는 수입|카테고리|가맹점|메모):"
+RECENT_MEMO_CHARS = 20
+
+
+def _cell(value) -> str:
+    return str(value or "").replace("|", "/").replace("\n", " ")
+
+
+def _recent_context(user_id: str) -> tuple[str, dict[str, str]]:
+    """
+    최근 거래 표 + {handle: tx_id}. 인덱스 순서 쿼리 1회.
+
+    토큰은 _estimate_tokens와 같은 규칙(글자당 1토큰)으로 세어
+    AGENT_RECENT_CONTEXT_TOKENS를 넘기 전까지의 행만 넣습니다.
+    """
+    limit = settings.AGENT_RECENT_CONTEXT_ROWS
+    if limit <= 0:
+        return "", {}
+
+    lines = [RECENT_CONTEXT_HEADER]
+    used = len(RECENT_CONTEXT_HEADER)
+    handles = {}
+    for row in TransactionQueryService.recent_transactions(user_id, limit):
+        handle = f"r{len(handles) + 1}"
+        amount = row["amount"] if row["type"] == "expense" else f"+{row['amount']}"
+        line = "|".join(
+            [
+                handle,
+                str(row["occurred_date"]),
+                str(amount),
+                _cell(row["category"]),
+                _cell(row["merchant"]),
+                _cell(row["memo"])[:RECENT_MEMO_CHARS],
+            ]
+        )
+        used += len(line) + 1
+        if used > settings.AGENT_RECENT_CONTEXT_TOKENS:
+            break
+        lines.append(line)
+        handles[handle] = str(row["tx_id"])
+
+    if not handles:
+        return "", {}
+    return "\n".join(lines), handles
+
+
+def _estimate_tokens(messages: list[dict]) -> int:
+    """프로바이더가 사용량을 주지 않을 때의 보수적 추정 (한글 ≈ 글자당 1토큰)."""
+    return sum(len(m.get("content") or "") for m in messages) + len(TOOLS_JSON) // 3
+
+
+def _terminal_reply(
+    tool_name: str,
+    tool_result,
+    message: str,
+    created_txs: list,
+) -> str | None:
+    """
+    도구 결과만으로 대화가 끝나는 경우 템플릿 응답 반환 (추가 LLM 호출 생략).
+    None이면 LLM에게 결과를 넘겨 다음 턴 진행.
+    """
+    if tool_name == "create_transaction":
+        if tool_result.get("status") != "success":
+            return None
+        # 한 메시지에 금액이 여러 개면 나머지 항목도 생성하도록 계속 진행
+        if len(_AMOUNT_MENTION_RE.findall(message)) > len(created_txs):
+            return None
+        return _created_reply(created_txs, tool_result["result"])
+
+    if tool_name == "delete_transactions":
+        if tool_result.get("success"):
+            return tool_result["message"]
+        return None
+
+    if tool_name == "update_transaction":
+        if tool_result.get("status") != "success":
+            return None
+        return _updated_reply(tool_result["result"])
+
+    if tool_name == "search_transactions" and not tool_result:
+        return "일치하는 거래 내역을 찾지 못했어요."
+
+    return None
+
+
+def _created_reply(created_txs: list, last_result: dict) -> str:
+    if len(created_txs) > 1:
+        return f"{len(created_txs)}건의 거래를 저장했어요."
+    if last_result.get("cached"):
+        return "이미 저장된 거래예요."
+    reply = (
+        f"{last_result['occurred_date']} {last_result['category']}"
+        f"({last_result['subcategory']}) {last_result['amount']:,}원을 저장했어요."
+    )
+    return reply + _budget_note(last_result.get("budget"))
+
+
+def _updated_reply(result: dict) -> str:
+    if not result["changed"]:
+        return "바뀐 내용이 없어요."
+    reply = (
+        f"{result['occurred_date']} {result['category']}"
+        f"({result['subcategory']}) {result['amount']:,}원으로 수정했어요."
+    )
+    return reply + _budget_note(result.get("budget"))
+
+
+def _budget_note(budget: dict | None) -> str:
+    if not budget:
+        return ""
+    label = f"{budget['month']} {budget['category']} 예산"
+    remaining = budget["remaining"]
+    if remaining >= 0:
+        return f" {label}이 {remaining:,}원 남았어요."
+    return f" {label}을 {-remaining:,}원 초과했어요."
+
+
 def run_agent_loop(
     user_id: str, message: str, provider_override: str | None = None
 ) -> dict:
     """
     Multi-turn Agent Loop.
-    Returns: { "reply": str, "tx_ids": list, "undo_tokens": list }
+
+    - 생성/삭제처럼 결과가 확정되는 도구는 템플릿 응답으로 즉시 종료
+    - AGENT_MAX_TURNS / AGENT_TIME_BUDGET_SECONDS / AGENT_TOKEN_BUDGET 중
+      하나라도 소진되면 지금까지의 결과로 종료
+
+    - AGENT_PRE_ROUTER가 켜져 있으면 규칙으로 처리 가능한 조회/삭제/요약은
+      LLM 없이 intent_router가 처리 (stop_reason="pre_router")
+
+    메시지 하나에서 일어난 생성/수정/삭제는 undo 스택의 한 그룹으로 묶여
+    undo_token 하나로 전부 되돌릴 수 있습니다.
+
+    Returns:
+        { "reply", "created_txs", "deleted_count", "updated_count", "llm_calls",
+          "stop_reason", "undo_token" }
     """
+    with undo_group(user_id) as group:
+        result = _run_agent_loop(user_id, message, provider_override)
+    wrote = (
+        result["created_txs"] or result["deleted_count"] or result.get("updated_count")
+    )
+    result["undo_token"] = group["group_id"] if wrote else None
+    return result
+
+
+def _run_agent_loop(
+    user_id: str, message: str, provider_override: str | None = None
+) -> dict:
+    if settings.AGENT_PRE_ROUTER:
+        routed = route_intent(user_id, message)
+        if routed:
+            with _stats_lock:
+                _STATS["requests"] += 1
+            return routed
+
+    # 최근 거래를 미리 넣어 삭제/수정 대상을 찾는 검색 턴을 생략
+    context, handles = _recent_context(user_id)
     messages = [
         {"role": "system", "content": _system_prompt()},
-        {"role": "user", "content": message},
+        {
+            "role": "user",
+            "content": f"{context}\n\n요청: {message}" if context else message,
+        },
     ]
 
     # 실행 결과 추적
     created_txs = []  # {tx_id, undo_token}
     deleted_count = 0
+    updated_count = 0
+
+    started = time.monotonic()
+    tokens_used = 0
+    llm_calls = 0
+    reply = None
+    stop_reason = "max_turns"
+
+    for _ in range(settings.AGENT_MAX_TURNS):
+        if time.monotonic() - started >= settings.AGENT_TIME_BUDGET_SECONDS:
+            stop_reason = "time_budget"
+            break
+        if tokens_used >= settings.AGENT_TOKEN_BUDGET:
+            stop_reason = "token_budget"
+            break
 
-    MAX_TURNS = 5
-    for _ in range(MAX_TURNS):
         response = chat_completion(
             messages, tools=TOOLS, provider_override=provider_override
         )
+        llm_calls += 1
+        reported = response.get("total_tokens")
+        tokens_used += (
+            reported if isinstance(reported, int) else _estimate_tokens(messages)
+        )
 
         fc = response.get("function_call")
         content = response.get("content")
@@ -197,49 +478,95 @@ def run_agent_loop(
             args = fc.get("args", {})
 
             # 도구 실행
-            tool_result = _execute_tool(user_id, tool_name, args, created_txs)
+            tool_result = _execute_tool(user_id, tool_name, args, created_txs, handles)
+
+            # 삭제 카운트 (결과 분석)
+            if tool_name == "delete_transactions" and tool_result.get("success"):
+                # "2건의 내역을 삭제했습니다" -> 2 추출
+                m = re.search(r"(\d+)건", tool_result["message"])
+                if m:
+                    deleted_count += int(m.group(1))
+            if tool_name == "update_transaction":
+                updated_count += tool_result.get("status") == "success"
+
+            # 결과가 확정된 도구는 LLM 재호출 없이 종료
+            reply = _terminal_reply(tool_name, tool_result, message, created_txs)
+            if reply:
+                stop_reason = "terminal_tool"
+                break
 
             # 결과 메시지에 추가
+            hint = _FOLLOW_UP_HINTS.get(tool_name)
+            # content는 텍스트 기록 (OpenAI 형식 · 로컬 모델 친화적),
+            # function_call / function_response는 Gemini 네이티브 파트용
             messages.append(
-                {"role": "assistant", "content": f"{tool_name}({args})"}
-            )  # FC 대신 텍스트로 기록 (로컬 모델 친화적)
+                {
+                    "role": "assistant",
+                    "content": f"{tool_name}({args})",
+                    "function_call": dict(fc, args=args),
+                }
+            )
             messages.append(
                 {
                     "role": "user",  # function role 대신 user role 사용 (로컬 모델 호환성)
-                    "content": f"Tool Result ({tool_name}): {json.dumps(tool_result, ensure_ascii=False)}\n\n이제 위 결과의 tx_id들을 사용하여 delete_transactions를 호출하세요.",
+                    "content": f"Tool Result ({tool_name}): {json.dumps(tool_result, ensure_ascii=False)}"
+                    + (f"\n\n{hint}" if hint else ""),
+                    "function_response": {"name": tool_name, "response": tool_result},
+                    "hint": hint,
                 }
             )
-            # 삭제 카운트 (결과 분석)
-            if tool_name == "delete_transactions" and tool_result.get("success"):
-                # "2건의 내역을 삭제했습니다" -> 2 추출하거나, 그냥 성공 여부만
-                import re
-
-                m = re.search(r"(\d+)건", tool_result["message"])
-                if m:
-                    deleted_count += int(m.group(1))
-
             continue  # 루프 계속 (LLM이 결과 보고 다음 행동 결정)
 
         # 2) 최종 응답 (텍스트)
         if content:
-            return {
-                "reply": content,
-                "created_txs": created_txs,
-                "deleted_count": deleted_count,
-            }
-
-        # 내용도 없고 도구도 없으면 종료
+            reply = content
+            stop_reason = "final_text"
+        else:
+            # 내용도 없고 도구도 없으면 종료
+            stop_reason = "empty_response"
         break
 
+    if not reply:
+        # 예산 소진 등으로 중단 — 이미 실행된 결과는 알려줌
+        if created_txs:
+            reply = f"{len(created_txs)}건의 거래를 저장했어요."
+        elif deleted_count:
+            reply = f"{deleted_count}건의 내역을 삭제했습니다."
+        elif updated_count:
+            reply = f"{updated_count}건의 내역을 수정했어요."
+        else:
+            reply = "처리 중 문제가 발생했습니다."
+
+    with _stats_lock:
+        _STATS["requests"] += 1
+        _STATS["llm_calls"] += llm_calls
+    logger.info(
+        "agent_loop llm_calls=%d stop=%s tokens=%d elapsed_ms=%d",
+        llm_calls,
+        stop_reason,
+        tokens_used,
+        (time.monotonic() - started) * 1000,
+    )
+
     return {
-        "reply": "처리 중 문제가 발생했습니다.",
-        "created_txs": [],
-        "deleted_count": 0,
+        "reply": reply,
+        "created_txs": created_txs,
+        "deleted_count": deleted_count,
+        "updated_count": updated_count,
+        "llm_calls": llm_calls,
+        "stop_reason": stop_reason,
     }
 
 
-def _execute_tool(user_id: str, name: str, args: dict, created_txs_acc: list) -> dict:
-    """실제 서비스 호출"""
+def _execute_tool(
+    user_id: str,
+    name: str,
+    args: dict,
+    created_txs_acc: list,
+    handles: dict[str, str] | None = None,
+) -> dict:
+    """실제 서비스 호출 (handles: 최근 거래 표의 r1.. → tx_id)"""
+    handles = handles or {}
     if name == "create_transaction":
         # TransactionService.create_transaction 호출
         # args에 user_id 주입 필요? 서비스 메서드는 user_id 별도 인자
@@ -263,6 +590,44 @@ def _execute_tool(user_id: str, name: str, args: dict, created_txs_acc: list) ->
             max_amount=args.get("max_amount"),
         )
 
+    elif name == "update_transaction":
+        fields = {key: value for key, value in args.items() if key != "tx_id"}
+        tx_id = args.get("tx_id")
+        try:
+            res = TransactionCommandService.update_transaction(
+                user_id, handles.get(tx_id, tx_id), fields
+            )
+            return {"status": "success", "result": res}
+        except Exception as e:
+            return {"status": "error", "message": str(e)}
+
+    elif name == "get_summary":
+        month = args.get("month")
+        start, end = args.get("start_date"), args.get("end_date")
+        try:
+            start = normalize_date(start) if start else None
+            end = normalize_date(end) if end else None
+            # 한쪽만 오면: "~부터" → 오늘까지, "~까지" → 그 달 1일부터
+            if start and not end:
+                end = date.today()
+            elif end and not start:
+                start = end.replace(day=1)
+            if start and start > end:
+                raise ValueError(f"start_date({start})가 end_date({end})보다 늦습니다")
+            if not (month or start):
+                month = date.today().strftime("%Y-%m")
+            return TransactionQueryService.get_summary(
+                user_id=user_id,
+                month=month,
+                from_date=start,
+                to_date=end,
+                category=args.get("category"),
+                tx_type=args.get("type") or "expense",
+                compare_previous=bool(args.get("compare_previous")),
+            )
+        except ValueError as e:
+            return {"status": "error", "message": str(e)}
+
     elif name == "delete_transactions":
         tx_ids = args.get("tx_ids", [])
 
@@ -280,6 +645,23 @@ def _execute_tool(user_id: str, name: str, args: dict, created_txs_acc: list) ->
                     inner = inner[1:-1]
                 tx_ids = [x.strip().strip("'\"") for x in inner.split(",") if x.strip()]
 
-        return TransactionCommandService.delete_transactions_by_ids(user_id, tx_ids)
+        # 표 핸들(r1..) → tx_id, 모르는 핸들이나 지어낸 ID는 UUID가 아니므로 제외
+        resolved, unknown = [], []
+        for tx_id in tx_ids if isinstance(tx_ids, list) else [tx_ids]:
+            try:
+                resolved.append(str(uuid.UUID(str(handles.get(tx_id, tx_id)))))
+            except (ValueError, TypeError):
+                unknown.append(str(tx_id))
+        if not resolved:
+            return {
+                "success": False,
+                "status": "error",
+                "message": f"알 수 없는 거래 ID입니다: {', '.join(unknown) or '(없음)'}. "
+                "search_transactions로 다시 찾은 tx_id를 사용하세요.",
+            }
+        result = TransactionCommandService.delete_transactions_by_ids(user_id, resolved)
+        if unknown:
+            result["message"] += f" (알 수 없는 ID {len(unknown)}개는 제외)"
+        return result
 
     return {"status": "error", "message": "Unknown tool"}
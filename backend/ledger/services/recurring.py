@@ -0,0 +1,165 @@
+"""반복 거래 서비스 — RecurringRule을 도래한 회차만큼 거래로 생성
+
+스케줄러(run_recurring_scheduler)가 next_run_date <= 오늘인 활성 규칙을 id 순으로
+chunk_size개씩 읽어 TransactionCommandService.create_transactions_bulk로 한 번에 만들고,
+같은 DB 트랜잭션에서 규칙의 next_run_date를 다음 회차로 전진시킵니다.
+
+멱등성 키는 (규칙, 회차)에서 결정적으로 만들어지므로("recurring:{id}:{YYYY-MM}")
+스케줄러가 중간에 죽거나 겹쳐 실행돼도 같은 회차 거래는 한 번만 생성됩니다.
+
+잘못된 규칙(금액 0 이하, 알 수 없는 주기 등) 하나가 청크 전체를 롤백시키지 않도록
+거래를 만들기 전에 규칙별로 검증하고, 실패한 규칙은 비활성화 + 로그만 남깁니다.
+"""
+
+import calendar
+import logging
+from datetime import date, timedelta
+
+from django.db import transaction
+
+from ledger.models import RecurringRule, Transaction
+from ledger.services.transaction_command import TransactionCommandService
+
+logger = logging.getLogger(__name__)
+
+
+def occurrence_key(rule: RecurringRule, occurred: date) -> str:
+    """(규칙, 회차) → 멱등성 키. 월간 규칙은 월, 주간 규칙은 날짜가 회차."""
+    if rule.frequency == "monthly":
+        period = occurred.strftime("%Y-%m")
+    else:
+        period = occurred.isoformat()
+    return f"recurring:{rule.id}:{period}"
+
+
+def _monthly_date(year: int, month: int, day: int) -> date:
+    # 31일 규칙은 짧은 달에 말일로
+    return date(year, month, min(day, calendar.monthrange(year, month)[1]))
+
+
+def first_run_date(rule: RecurringRule) -> date:
+    """start_date 이후 첫 회차."""
+    start = rule.start_date
+    if rule.frequency != "monthly":
+        return start
+    day = rule.day_of_month or start.day
+    candidate = _monthly_date(start.year, start.month, day)
+    if candidate < start:
+        return next_run_after(rule, candidate)
+    return candidate
+
+
+def next_run_after(rule: RecurringRule, current: date) -> date:
+    """current 회차의 다음 회차."""
+    if rule.frequency != "monthly":
+        return current + timedelta(days=7)
+    year, month = divmod(current.year * 12 + current.month, 12)
+    return _monthly_date(year, month + 1, rule.day_of_month or rule.start_date.day)
+
+
+def validate_rule(rule: RecurringRule) -> None:
+    """거래로 만들 수 없는 규칙이면 ValueError."""
+    if not isinstance(rule.amount, int) or rule.amount <= 0:
+        raise ValueError(f"금액은 0보다 커야 합니다: {rule.amount!r}")
+    if rule.type not in dict(Transaction.TYPE_CHOICES):
+        raise ValueError(f"알 수 없는 거래 유형: {rule.type!r}")
+    if rule.frequency not in dict(RecurringRule.FREQUENCY_CHOICES):
+        raise ValueError(f"알 수 없는 주기: {rule.frequency!r}")
+    if rule.day_of_month is not None and not 1 <= rule.day_of_month <= 31:
+        raise ValueError(f"day_of_month는 1~31: {rule.day_of_month!r}")
+    if not rule.category:
+        raise ValueError("카테고리가 비어 있습니다")
+
+
+def create_rule(user_id: str, **fields) -> RecurringRule:
+    """규칙 생성 — next_run_date는 start_date 이후 첫 회차로 설정."""
+    rule = RecurringRule(user_id=user_id, **fields)
+    validate_rule(rule)
+    rule.next_run_date = first_run_date(rule)
+    rule.save()
+    return rule
+
+
+def _transaction_args(rule: RecurringRule, occurred: date) -> dict:
+    return {
+        "occurred_date": occurred.isoformat(),
+        "type": rule.type,
+        "amount": rule.amount,
+        "currency": rule.currency,
+        "category": rule.category,
+        "subcategory": rule.subcategory,
+        "merchant": rule.merchant,
+        "memo": rule.memo,
+    }
+
+
+def materialize_rules(
+    rules: list[RecurringRule], today: date, max_catch_up: int = 12
+) -> dict:
+    """
+    규칙 목록의 도래한 회차를 거래로 생성하고 next_run_date 전진 (Atomic).
+
+    밀린 회차는 규칙당 최대 max_catch_up개까지 이번 실행에서 만들고,
+    나머지는 다음 실행으로 넘깁니다. end_date가 지난 규칙은 비활성화합니다.
+    검증에 실패한 규칙은 거래 없이 비활성화하고 "invalid"에 id를 담습니다.
+    """
+    entries, invalid = [], []
+    for rule in rules:
+        rule_entries = []
+        try:
+            validate_rule(rule)
+            occurred = rule.next_run_date
+            for _ in range(max_catch_up):
+                if occurred > today:
+                    break
+                if rule.end_date and occurred > rule.end_date:
+                    break
+                rule_entries.append(
+                    {
+                        "user_id": str(rule.user_id),
+                        "args": _transaction_args(rule, occurred),
+                        "idem_key": occurrence_key(rule, occurred),
+                    }
+                )
+                occurred = next_run_after(rule, occurred)
+        except (ValueError, TypeError) as e:
+            logger.warning("반복 거래 규칙 %s 비활성화: %s", rule.id, e)
+            rule.active = False
+            invalid.append(rule.id)
+            continue
+        entries.extend(rule_entries)
+        rule.next_run_date = occurred
+        if rule.end_date and occurred > rule.end_date:
+            rule.active = False
+
+    with transaction.atomic():
+        result = TransactionCommandService.create_transactions_bulk(entries)
+        RecurringRule.objects.bulk_update(
+            rules, ["next_run_date", "active"], batch_size=1000
+        )
+    return {**result, "invalid": invalid}
+
+
+def run_due_rules(
+    today: date | None = None, chunk_size: int = 1000, max_catch_up: int = 12
+):
+    """
+    도래한 활성 규칙을 chunk_size개씩 처리하며 청크별 결과를 yield.
+    청크마다 규칙 잠금 · 거래 생성 · next_run_date 전진이 한 DB 트랜잭션입니다.
+    id keyset 페이지네이션이라 규칙 수와 무관하게 메모리 사용량이 일정합니다.
+    """
+    today = today or date.today()
+    last_id = 0
+    while True:
+        with transaction.atomic():
+            # 겹쳐 실행된 스케줄러는 잠긴 규칙을 건너뛰고 다른 청크를 처리
+            rules = list(
+                RecurringRule.objects.select_for_update(skip_locked=True)
+                .filter(active=True, next_run_date__lte=today, id__gt=last_id)
+                .order_by("id")[:chunk_size]
+            )
+            if not rules:
+                return
+            last_id = rules[-1].id
+            result = materialize_rules(rules, today, max_catch_up=max_catch_up)
+        yield {"rules": len(rules), **result}
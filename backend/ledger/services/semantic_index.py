@@ -0,0 +1,199 @@
+"""거래 의미 검색 인덱스 (선택) — 로컬 CPU 임베딩으로 "회식" ↔ 메모 "팀 저녁" 매칭
+
+SEMANTIC_SEARCH_MODEL이 설정된 경우에만 동작합니다 (fastembed/ONNX, GPU 불필요).
+
+- 벡터: merchant/memo/source_text 임베딩을 L2 정규화한 float16
+- 저장: Redis HASH txvec:{user_id} (tx_id → 벡터 바이트) + 버전 카운터
+  (삭제 커밋 시 제거)
+- 색인: 임베딩은 CPU를 쓰므로 요청 스레드에서 하지 않습니다. 생성 커밋 시에는
+  tx_id만 txvec:pending 리스트에 넣고(LPUSH 1회), run_semantic_indexer 워커가
+  배치로 꺼내 임베딩합니다. 워커가 처리하기 전까지 새 거래는 키워드 검색으로만
+  찾을 수 있고, 워커가 꺼낸 뒤 죽으면 그 배치는 색인되지 않으므로
+  build_semantic_index로 다시 채우세요.
+- 조회: 프로세스 내 (tx_id 배열, float16 행렬)을 버전이 바뀔 때만 다시 로드하고
+  질의 벡터와의 내적(코사인 유사도)을 한 번의 행렬-벡터 곱으로 계산
+- 기존 데이터/일괄 입력: python manage.py build_semantic_index (배치 임베딩)
+
+Redis/임베딩 오류 시에는 의미 검색 없이 기존 키워드 검색만 동작합니다.
+"""
+
+import logging
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+
+import numpy as np
+from django.conf import settings
+from django.db import transaction
+from django_redis import get_redis_connection
+from redis.exceptions import RedisError
+
+logger = logging.getLogger(__name__)
+
+VECTOR_KEY_PREFIX = "txvec:"
+VERSION_KEY_PREFIX = "txvec_ver:"
+PENDING_KEY = "txvec:pending"
+_INDEX_FIELDS = ("tx_id", "user_id", "merchant", "memo", "source_text")
+_MAX_CACHED_USERS = 64
+
+_lock = threading.Lock()
+_MATRICES: "OrderedDict[str, tuple[int, np.ndarray, np.ndarray]]" = OrderedDict()
+
+
+def semantic_enabled() -> bool:
+    return bool(settings.SEMANTIC_SEARCH_MODEL)
+
+
+@lru_cache(maxsize=1)
+def _embedder():
+    # 선택 의존성: 의미 검색을 켤 때만 필요
+    from fastembed import TextEmbedding
+
+    return TextEmbedding(model_name=settings.SEMANTIC_SEARCH_MODEL)
+
+
+def embed_texts(texts: list[str]) -> np.ndarray:
+    """문장 목록 → (n, dim) float16, 행마다 L2 정규화."""
+    vectors = np.asarray(
+        list(_embedder().embed(texts, batch_size=settings.SEMANTIC_SEARCH_BATCH_SIZE)),
+        dtype=np.float32,
+    )
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True) + 1e-12
+    return vectors.astype(np.float16)
+
+
+def transaction_text(tx) -> str:
+    """임베딩 대상 문장 (가맹점 · 메모 · 원문)."""
+    return " ".join(part for part in (tx.merchant, tx.memo, tx.source_text) if part)
+
+
+def _keys(user_id: str) -> tuple[str, str]:
+    return f"{VECTOR_KEY_PREFIX}{user_id}", f"{VERSION_KEY_PREFIX}{user_id}"
+
+
+def index_transactions(transactions) -> int:
+    """거래들을 배치로 임베딩해 사용자별 HASH에 저장. 저장한 건수 반환."""
+    rows = [(tx, transaction_text(tx)) for tx in transactions]
+    rows = [(tx, text) for tx, text in rows if text]
+    if not rows:
+        return 0
+    vectors = embed_texts([text for _, text in rows])
+
+    redis = get_redis_connection("default")
+    pipe = redis.pipeline()
+    by_user: dict[str, dict[str, bytes]] = {}
+    for (tx, _), vector in zip(rows, vectors):
+        by_user.setdefault(tx.user_id, {})[str(tx.tx_id)] = vector.tobytes()
+    for user_id, mapping in by_user.items():
+        vector_key, version_key = _keys(user_id)
+        pipe.hset(vector_key, mapping=mapping)
+        pipe.incr(version_key)
+    pipe.execute()
+    return len(rows)
+
+
+def remove_transactions(user_id: str, tx_ids) -> None:
+    """삭제된 거래의 벡터 제거."""
+    tx_ids = [str(tx_id) for tx_id in tx_ids]
+    if not tx_ids:
+        return
+    vector_key, version_key = _keys(user_id)
+    try:
+        pipe = get_redis_connection("default").pipeline()
+        pipe.hdel(vector_key, *tx_ids)
+        pipe.incr(version_key)
+        pipe.execute()
+    except RedisError:
+        logger.warning("semantic_index remove failed user=%s", user_id, exc_info=True)
+
+
+def _enqueue(tx_ids: list[str]) -> None:
+    try:
+        get_redis_connection("default").lpush(PENDING_KEY, *tx_ids)
+    except RedisError:
+        logger.warning(
+            "semantic_index enqueue failed (%d건)", len(tx_ids), exc_info=True
+        )
+
+
+def schedule_index(transactions) -> None:
+    """커밋 후 색인 대기열에 추가 (롤백된 거래는 색인하지 않음, 임베딩은 워커가)."""
+    if semantic_enabled():
+        tx_ids = [str(tx.tx_id) for tx in transactions]
+        if tx_ids:
+            transaction.on_commit(lambda: _enqueue(tx_ids), robust=True)
+
+
+def index_pending(batch_size: int = 256, timeout: int = 5) -> int:
+    """
+    대기열에서 최대 batch_size개를 꺼내 임베딩. 꺼낸 항목 수 반환 (대기열이 비면 0).
+    꺼낸 사이 삭제된 거래는 건너뜁니다.
+    """
+    from ledger.models import Transaction
+
+    redis = get_redis_connection("default")
+    first = redis.brpop(PENDING_KEY, timeout=timeout)
+    if not first:
+        return 0
+    tx_ids = [first[1]] + (redis.rpop(PENDING_KEY, batch_size - 1) or [])
+    tx_ids = {t.decode() if isinstance(t, bytes) else t for t in tx_ids}
+    rows = Transaction.objects.filter(tx_id__in=tx_ids).only(*_INDEX_FIELDS)
+    index_transactions(list(rows))
+    return len(tx_ids)
+
+
+def schedule_remove(user_id: str, tx_ids) -> None:
+    """커밋 후 벡터 제거."""
+    if semantic_enabled():
+        tx_ids = list(tx_ids)
+        transaction.on_commit(lambda: remove_transactions(user_id, tx_ids))
+
+
+def _load_matrix(user_id: str) -> tuple[np.ndarray, np.ndarray]:
+    """(tx_id 배열, (n, dim) float16 행렬) — 버전이 같으면 프로세스 캐시 사용."""
+    vector_key, version_key = _keys(user_id)
+    redis = get_redis_connection("default")
+    version = int(redis.get(version_key) or 0)
+
+    with _lock:
+        cached = _MATRICES.get(user_id)
+        if cached is not None and cached[0] == version:
+            _MATRICES.move_to_end(user_id)
+            return cached[1], cached[2]
+
+    stored = redis.hgetall(vector_key)
+    ids = np.array([k.decode() for k in stored], dtype=object)
+    if stored:
+        matrix = np.frombuffer(b"".join(stored.values()), dtype=np.float16)
+        matrix = matrix.reshape(len(stored), -1)
+    else:
+        matrix = np.empty((0, 0), dtype=np.float16)
+
+    with _lock:
+        _MATRICES[user_id] = (version, ids, matrix)
+        _MATRICES.move_to_end(user_id)
+        while len(_MATRICES) > _MAX_CACHED_USERS:
+            _MATRICES.popitem(last=False)
+    return ids, matrix
+
+
+def semantic_search(user_id: str, query: str, limit: int = 50) -> list[str]:
+    """질의와 의미가 가까운 거래 tx_id (유사도 내림차순, SEMANTIC_SEARCH_MIN_SCORE 이상)."""
+    if not semantic_enabled() or not query or not query.strip():
+        return []
+    try:
+        ids, matrix = _load_matrix(user_id)
+        if not len(ids):
+            return []
+        q = embed_texts([query])[0].astype(np.float32)
+    except Exception:
+        logger.warning("semantic_index search failed user=%s", user_id, exc_info=True)
+        return []
+
+    # float16은 저장용 — 계산은 float32 BLAS로
+    scores = matrix.astype(np.float32) @ q
+    keep = np.flatnonzero(scores >= settings.SEMANTIC_SEARCH_MIN_SCORE)
+    if len(keep) > limit:
+        keep = keep[np.argpartition(-scores[keep], limit)[:limit]]
+    keep = keep[np.argsort(-scores[keep])]
+    return ids[keep].tolist()
@@ -0,0 +1,94 @@
+"""감사로그 스냅샷 코덱 — 생성 시 전체 이미지, 이후에는 필드 단위 delta
+
+저장 형식 (AuditLog.before_snapshot / after_snapshot):
+    create       after = 전체 이미지 (None 필드 생략)
+    update       before/after = 바뀐 필드의 이전/이후 값만
+    delete/undo  스냅샷 없음 — 삭제 직전 상태는 create + update 이벤트로 복원
+
+tx_id, user_id는 AuditLog 컬럼에 이미 있으므로 이미지에 넣지 않습니다.
+이벤트를 순서대로 접어(fold) 임의 시점의 거래 상태를 reconstruct_transaction()으로 복원합니다.
+(audit_logs 보존기간이 지나 create 이벤트가 정리되면 해당 거래는 복원할 수 없습니다)
+"""
+
+from datetime import datetime
+from uuid import UUID
+
+from ledger.models import AuditLog, Transaction
+
+SNAPSHOT_FIELDS = (
+    "occurred_date",
+    "type",
+    "amount",
+    "currency",
+    "category",
+    "subcategory",
+    "merchant",
+    "memo",
+    "source_text",
+)
+
+
+def transaction_image(tx: Transaction) -> dict:
+    """Transaction → JSON 직렬화 가능한 전체 이미지 (None 필드 생략)."""
+    image = {}
+    for field in SNAPSHOT_FIELDS:
+        value = getattr(tx, field)
+        if value is None:
+            continue
+        image[field] = str(value) if field == "occurred_date" else value
+    return image
+
+
+def encode_delta(before: dict, after: dict) -> tuple[dict, dict]:
+    """두 이미지의 차이 → (이전 값, 이후 값). 바뀐 필드만 포함."""
+    changed = [
+        field for field in SNAPSHOT_FIELDS if before.get(field) != after.get(field)
+    ]
+    return (
+        {field: before.get(field) for field in changed},
+        {field: after.get(field) for field in changed},
+    )
+
+
+def apply_event(state: dict | None, action: str, after: dict | None) -> dict | None:
+    """이벤트 하나를 상태에 적용. 삭제되었으면 None."""
+    if action == "create":
+        return dict(after or {})
+    if action == "update":
+        if state is None:
+            return None
+        state = dict(state)
+        for field, value in (after or {}).items():
+            if value is None:
+                state.pop(field, None)
+            else:
+                state[field] = value
+        return state
+    # delete / undo
+    return None
+
+
+def reconstruct_transaction(
+    tx_id: UUID | str, at: datetime | None = None
+) -> dict | None:
+    """
+    감사로그로 at 시점(기본: 현재)의 거래 이미지를 복원.
+
+    Returns:
+        이미지 dict (tx_id, user_id 포함). 그 시점에 존재하지 않았으면 None.
+    """
+    events = AuditLog.objects.filter(tx_id=tx_id)
+    if at is not None:
+        events = events.filter(created_at__lte=at)
+
+    state = None
+    user_id = None
+    for action, event_user_id, after in events.order_by("created_at").values_list(
+        "action", "user_id", "after_snapshot"
+    ):
+        state = apply_event(state, action, after)
+        user_id = event_user_id
+
+    if state is None:
+        return None
+    return {"tx_id": str(tx_id), "user_id": str(user_id), **state}
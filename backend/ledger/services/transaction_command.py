@@ -1,24 +1,139 @@
-"""TransactionCommandService — 거래 생성, 취소, 삭제 (Write)"""
+"""TransactionCommandService — 거래 생성, 수정, 취소, 삭제 (Write)"""
 
-import uuid
-from datetime import date
+import copy
+from collections.abc import Iterator
+from datetime import date, datetime
 
 from django.db import transaction
+from django.db.models import Case, DateTimeField, F, Q, Value, When
+from django.utils import timezone
 
-from ledger.exceptions import TransactionNotFoundError, UndoTokenExpiredError
-from ledger.models import Transaction
-from ledger.services.audit import log_audit
+from core.db_router import mark_recent_write
+from ledger.exceptions import (
+    TransactionConflictError,
+    TransactionNotFoundError,
+    UndoTokenExpiredError,
+)
+from ledger.models import IdempotencyKey, Transaction
+from ledger.services.audit import log_audit, log_audit_bulk
+from ledger.services.budget import (
+    apply_spending,
+    apply_spending_bulk,
+    budget_status,
+    month_key,
+    revert_spending,
+)
 from ledger.services.idempotency import get_cached_tx_id, save_idempotency
+from ledger.services.merchant_vocab import add_merchant, expand_merchant_keyword
 from ledger.services.normalizer import (
     normalize_amount,
     normalize_date,
     resolve_category_subcategory,
 )
-from ledger.services.undo import (
-    delete_undo_token,
-    get_tx_id_from_undo_token,
-    save_undo_token,
-)
+from ledger.services.semantic_index import schedule_index, schedule_remove
+from ledger.services.snapshot import encode_delta, transaction_image
+from ledger.services.undo import pop_undo_group, push_undo_group, record_undo
+
+
+def _build_transaction(user_id: str, args: dict) -> Transaction:
+    """입력 정규화 + 유효성 검증 → 저장 전 Transaction."""
+    raw_date = args.get("occurred_date") or ""
+    if not raw_date:
+        occurred_date = date.today()
+    else:
+        try:
+            occurred_date = normalize_date(raw_date)
+        except (ValueError, TypeError):
+            occurred_date = date.today()
+
+    amount = normalize_amount(args.get("amount", 0))
+    source_text = args.get("source_text")
+    merchant = args.get("merchant")
+    category, subcategory = resolve_category_subcategory(
+        args.get("category"),
+        args.get("subcategory"),
+        source_text=source_text,
+        merchant=merchant,
+    )
+
+    if amount <= 0:
+        raise ValueError("금액은 0보다 커야 합니다")
+
+    tx_type = args.get("type", "expense")
+    if tx_type not in ("expense", "income"):
+        tx_type = "expense"
+
+    return Transaction(
+        user_id=user_id,
+        occurred_date=occurred_date,
+        type=tx_type,
+        amount=amount,
+        currency=args.get("currency", "KRW"),
+        category=category,
+        subcategory=subcategory,
+        merchant=merchant,
+        memo=args.get("memo"),
+        source_text=source_text,
+    )
+
+
+# 바뀌면 예산 누계 / 의미 검색 색인을 다시 반영해야 하는 필드
+SPENDING_FIELDS = {"occurred_date", "type", "amount", "category"}
+INDEXED_FIELDS = {"merchant", "memo"}
+
+
+def _normalize_changes(tx: Transaction, args: dict) -> dict:
+    """수정 입력 정규화 → {필드: 값}. args에 있는 필드만 포함."""
+    changes = {}
+    if args.get("occurred_date"):
+        try:
+            changes["occurred_date"] = normalize_date(args["occurred_date"])
+        except (ValueError, TypeError):
+            raise ValueError(f"날짜 형식 인식 불가: {args['occurred_date']}")
+
+    if args.get("amount") is not None:
+        amount = normalize_amount(args["amount"])
+        if amount <= 0:
+            raise ValueError("금액은 0보다 커야 합니다")
+        changes["amount"] = amount
+
+    if args.get("type"):
+        if args["type"] not in ("expense", "income"):
+            raise ValueError("type은 expense 또는 income이어야 합니다")
+        changes["type"] = args["type"]
+
+    if args.get("currency"):
+        changes["currency"] = args["currency"]
+
+    # 빈 값이면 지움
+    for field in ("merchant", "memo"):
+        if field in args:
+            changes[field] = args[field] or None
+
+    if args.get("category") or args.get("subcategory"):
+        # 카테고리만 바뀌면 세부 카테고리는 새로 추론
+        subcategory = args.get("subcategory") or (
+            None if args.get("category") else tx.subcategory
+        )
+        changes["category"], changes["subcategory"] = resolve_category_subcategory(
+            args.get("category") or tx.category,
+            subcategory,
+            merchant=changes.get("merchant", tx.merchant),
+        )
+    return changes
+
+
+def _changed_copy(tx: Transaction, changes: dict) -> Transaction:
+    updated = copy.copy(tx)
+    for field, value in changes.items():
+        setattr(updated, field, value)
+    return updated
+
+
+def _add_spending(deltas: dict, user_id: str, tx: Transaction, sign: int) -> None:
+    if tx.type == "expense":
+        key = (user_id, month_key(tx.occurred_date), tx.category)
+        deltas[key] = deltas.get(key, 0) + sign * tx.amount
 
 
 class TransactionCommandService:
@@ -42,80 +157,54 @@ class TransactionCommandService:
             if cached_tx_id:
                 return {"tx_id": str(cached_tx_id), "cached": True}
 
-        # ── 2) 정규화 ──
-        raw_date = args.get("occurred_date") or ""
-        if not raw_date:
-            occurred_date = date.today()
-        else:
-            try:
-                occurred_date = normalize_date(raw_date)
-            except (ValueError, TypeError):
-                occurred_date = date.today()
-
-        amount = normalize_amount(args.get("amount", 0))
-        source_text = args.get("source_text")
-        merchant = args.get("merchant")
-        category, subcategory = resolve_category_subcategory(
-            args.get("category"),
-            args.get("subcategory"),
-            source_text=source_text,
-            merchant=merchant,
-        )
-
-        # ── 3) 유효성 검증 ──
-        if amount <= 0:
-            raise ValueError("금액은 0보다 커야 합니다")
-
-        tx_type = args.get("type", "expense")
-        if tx_type not in ("expense", "income"):
-            tx_type = "expense"
-        memo = args.get("memo")
+        # ── 2~3) 정규화 및 유효성 검증 ──
+        tx = _build_transaction(user_id, args)
+        occurred_date, tx_type = tx.occurred_date, tx.type
+        amount, category, subcategory = tx.amount, tx.category, tx.subcategory
+        merchant = tx.merchant
 
         # ── 4~7) Transaction 생성 및 후처리 (Atomic) ──
         try:
             with transaction.atomic():
                 # 4) Transaction 레코드 생성
-                tx = Transaction.objects.create(
-                    user_id=user_id,
-                    occurred_date=occurred_date,
-                    type=tx_type,
-                    amount=amount,
-                    currency=args.get("currency", "KRW"),
-                    category=category,
-                    subcategory=subcategory,
-                    merchant=merchant,
-                    memo=memo,
-                    source_text=source_text,
-                )
+                tx.save(force_insert=True)
 
                 # 5) 멱등성 키 저장
                 if idem_key:
                     save_idempotency(user_id, idem_key, tx.tx_id)
 
-                # 6) 감사로그
-                after_snapshot = {
-                    "tx_id": str(tx.tx_id),
-                    "user_id": user_id,
-                    "occurred_date": str(occurred_date),
-                    "type": tx_type,
-                    "amount": amount,
-                    "currency": args.get("currency", "KRW"),
-                    "category": category,
-                    "subcategory": subcategory,
-                    "merchant": merchant,
-                    "memo": memo,
-                    "source_text": source_text,
-                }
+                # 6) 감사로그 (생성 시에만 전체 이미지)
                 log_audit(
-                    user_id, "create", tx_id=tx.tx_id, after_snapshot=after_snapshot
+                    user_id,
+                    "create",
+                    tx_id=tx.tx_id,
+                    after_snapshot=transaction_image(tx),
                 )
 
-                # 7) undo 토큰
-                undo_token = str(uuid.uuid4())
-                save_undo_token(undo_token, tx.tx_id)
+                # 7) undo 스택 (요청 단위 그룹, 커밋 후 적재)
+                undo_token = record_undo(
+                    user_id, [{"op": "create", "tx_id": str(tx.tx_id)}]
+                )
+
+                # 8) 가맹점 어휘 (커밋된 거래만 반영)
+                if merchant:
+                    transaction.on_commit(
+                        lambda: add_merchant(user_id, merchant), robust=True
+                    )
+                schedule_index([tx])
+
+                # 9) 예산 누계 (지출만, 같은 트랜잭션에서 증분 갱신)
+                budget = None
+                if tx_type == "expense":
+                    spent = apply_spending(user_id, occurred_date, category, amount)
+                    budget = budget_status(
+                        user_id, month_key(occurred_date), category, spent
+                    )
         except Exception as e:
             raise e
 
+        mark_recent_write(user_id)
+
         return {
             "tx_id": str(tx.tx_id),
             "cached": False,
@@ -125,54 +214,354 @@ class TransactionCommandService:
             "amount": amount,
             "category": category,
             "subcategory": subcategory,
+            "budget": budget,
         }
 
     @staticmethod
-    def undo_transaction(undo_token: str) -> dict:
+    def create_transactions_bulk(entries: list[dict]) -> dict:
         """
-        거래 취소 (Atomic).
+        거래 일괄 생성 (Atomic) — 반복 거래 스케줄러 등 비대화형 입력용.
+
+        entries: {"user_id", "args", "idem_key"} 목록.
+        이미 저장된(또는 목록 안에서 중복된) idem_key는 건너뛰고,
+        거래 · 멱등성 키 · 감사로그 · 예산 누계를 각각 한 번에 씁니다.
+        undo 스택에는 기록하지 않습니다.
+
+        Returns:
+            {"created": [tx_id, ...], "skipped": 건너뛴 수}
         """
-        # ── 1) Redis 조회 ──
-        tx_id = get_tx_id_from_undo_token(undo_token)
-        if tx_id is None:
-            raise UndoTokenExpiredError()
+        keyed = [e for e in entries if e.get("idem_key")]
+        # (user_id, idem_key) 유니크 인덱스를 타도록 user_id도 함께 조건에 넣고,
+        # 교차 조합으로 더 읽힌 행은 아래 쌍 비교에서 걸러짐
+        # DB의 user_id는 정수 → 서비스 계층 표기(문자열)로 맞춰 비교
+        seen = set()
+        if keyed:
+            seen = {
+                (str(user_id), idem_key)
+                for user_id, idem_key in IdempotencyKey.objects.filter(
+                    user_id__in={e["user_id"] for e in keyed},
+                    idem_key__in={e["idem_key"] for e in keyed},
+                ).values_list("user_id", "idem_key")
+            }
 
-        # ── 2) Transaction 조회 ──
-        try:
-            tx = Transaction.objects.get(tx_id=tx_id)
-        except Transaction.DoesNotExist:
-            delete_undo_token(undo_token)
+        txs, idem_rows = [], []
+        for entry in entries:
+            user_id, idem_key = str(entry["user_id"]), entry.get("idem_key")
+            if idem_key:
+                if (user_id, idem_key) in seen:
+                    continue
+                seen.add((user_id, idem_key))
+            tx = _build_transaction(user_id, entry["args"])
+            txs.append(tx)
+            if idem_key:
+                idem_rows.append(
+                    IdempotencyKey(user_id=user_id, idem_key=idem_key, tx=tx)
+                )
+
+        if txs:
+            deltas: dict[tuple[str, str, str], int] = {}
+            for tx in txs:
+                if tx.type == "expense":
+                    key = (tx.user_id, month_key(tx.occurred_date), tx.category)
+                    deltas[key] = deltas.get(key, 0) + tx.amount
+            merchants = {(tx.user_id, tx.merchant) for tx in txs if tx.merchant}
+
+            with transaction.atomic():
+                Transaction.objects.bulk_create(txs, batch_size=1000)
+                IdempotencyKey.objects.bulk_create(idem_rows, batch_size=1000)
+                log_audit_bulk(
+                    [
+                        {
+                            "user_id": tx.user_id,
+                            "action": "create",
+                            "tx_id": tx.tx_id,
+                            "after_snapshot": transaction_image(tx),
+                        }
+                        for tx in txs
+                    ]
+                )
+                apply_spending_bulk(deltas)
+
+                for user_id, merchant in merchants:
+                    transaction.on_commit(
+                        lambda u=user_id, m=merchant: add_merchant(u, m), robust=True
+                    )
+                schedule_index(txs)
+
+        return {
+            "created": [str(tx.tx_id) for tx in txs],
+            "skipped": len(entries) - len(txs),
+        }
+
+    @staticmethod
+    def update_transaction(
+        user_id: str,
+        tx_id: str,
+        args: dict,
+        expected_version: int | None = None,
+    ) -> dict:
+        """
+        거래 수정 (Atomic) — 조건부 UPDATE 한 번.
+
+        UPDATE ... WHERE version = 읽은 값 이 0행이면 그 사이 다른 요청이 먼저
+        수정한 것이므로 TransactionConflictError (409). expected_version을 주면
+        클라이언트가 본 버전과도 비교합니다. tx_id · created_at 은 그대로입니다.
+        """
+        # ── 1) 대상 조회 + 입력 정규화 ──
+        tx = Transaction.objects.filter(user_id=user_id, tx_id=tx_id).first()
+        if tx is None:
             raise TransactionNotFoundError()
+        if expected_version is not None and expected_version != tx.version:
+            raise TransactionConflictError()
 
-        # ── 3~5) 감사로그 및 삭제 (Atomic) ──
+        updated = _changed_copy(tx, _normalize_changes(tx, args))
+        before, after = encode_delta(transaction_image(tx), transaction_image(updated))
+        result = {
+            "tx_id": str(tx.tx_id),
+            "version": tx.version,
+            "changed": list(after),
+            "undo_token": None,
+            "budget": None,
+            **transaction_image(updated),
+        }
+        if not after:
+            return result
+
+        # ── 2) 조건부 UPDATE · 감사로그 · undo · 예산 누계 (Atomic) ──
         with transaction.atomic():
-            before_snapshot = {
-                "tx_id": str(tx.tx_id),
-                "user_id": tx.user_id,
-                "occurred_date": str(tx.occurred_date),
-                "type": tx.type,
-                "amount": tx.amount,
-                "currency": tx.currency,
-                "category": tx.category,
-                "subcategory": tx.subcategory,
-                "merchant": tx.merchant,
-                "memo": tx.memo,
-                "source_text": tx.source_text,
-                "created_at": tx.created_at.isoformat() if tx.created_at else None,
-                "updated_at": tx.updated_at.isoformat() if tx.updated_at else None,
-            }
-            log_audit(tx.user_id, "undo", tx_id=tx_id, before_snapshot=before_snapshot)
+            # occurred_date로 파티션 한정 (날짜가 바뀌면 PostgreSQL이 행을 옮김)
+            rows = Transaction.objects.filter(
+                user_id=user_id,
+                tx_id=tx.tx_id,
+                occurred_date=tx.occurred_date,
+                version=tx.version,
+            ).update(
+                **{field: getattr(updated, field) for field in after},
+                version=F("version") + 1,
+                updated_at=timezone.now(),
+            )
+            if not rows:
+                raise TransactionConflictError()
+            updated.version = tx.version + 1
 
-            # 4) 삭제
-            tx.delete()
+            # 바뀐 필드만 (snapshot.apply_event 로 재구성 가능)
+            log_audit(
+                user_id,
+                "update",
+                tx_id=tx.tx_id,
+                before_snapshot=before,
+                after_snapshot=after,
+            )
+            result["undo_token"] = record_undo(
+                user_id,
+                [
+                    {
+                        "op": "update",
+                        "tx_id": str(tx.tx_id),
+                        "before": before,
+                        "version": updated.version,
+                    }
+                ],
+            )
+
+            if SPENDING_FIELDS & after.keys():
+                if tx.type == "expense":
+                    apply_spending(user_id, tx.occurred_date, tx.category, -tx.amount)
+                if updated.type == "expense":
+                    spent = apply_spending(
+                        user_id,
+                        updated.occurred_date,
+                        updated.category,
+                        updated.amount,
+                    )
+                    result["budget"] = budget_status(
+                        user_id,
+                        month_key(updated.occurred_date),
+                        updated.category,
+                        spent,
+                    )
+
+            merchant = updated.merchant
+            if "merchant" in after and merchant:
+                transaction.on_commit(
+                    lambda: add_merchant(user_id, merchant), robust=True
+                )
+            if INDEXED_FIELDS & after.keys():
+                schedule_index([updated])
+
+        mark_recent_write(user_id)
+
+        result["version"] = updated.version
+        return result
+
+    @staticmethod
+    def undo_transaction(user_id: str, undo_token: str | None = None) -> dict:
+        """
+        작업 그룹 되돌리기 (Atomic).
+
+        undo 스택에서 그룹 하나를 꺼내(Redis 1회) UPDATE 한 번으로 되돌립니다.
+        그룹 안의 생성은 삭제 표시하고, 삭제는 표시를 해제합니다 (tx_id · created_at 그대로).
+        수정은 수정 전 값을 필드별 CASE로 묶어 version 조건부 UPDATE 한 번으로
+        되돌리며, 그 뒤에 다시 수정된 거래(version 불일치)는 건너뜁니다.
+        undo_token이 없으면 가장 최근 그룹입니다.
+        """
+        # ── 1) Redis: 그룹 꺼내기 ──
+        group = pop_undo_group(user_id, undo_token)
+        if group is None:
+            raise UndoTokenExpiredError()
 
-            # 5) Redis 토큰 삭제
-            delete_undo_token(undo_token)
+        created_ids = {op["tx_id"] for op in group["ops"] if op["op"] == "create"}
+        deleted_ids = {op["tx_id"] for op in group["ops"] if op["op"] == "delete"}
+        # 거래별로 합침 — 필드마다 가장 먼저 기록된 수정 전 값, 마지막 수정 후 version
+        # (같은 그룹에서 생성된 거래는 생성 취소로 충분)
+        reverts: dict[str, tuple[dict, int]] = {}
+        for op in group["ops"]:
+            if op["op"] == "update" and op["tx_id"] not in created_ids:
+                fields, _ = reverts.get(op["tx_id"], ({}, 0))
+                reverts[op["tx_id"]] = ({**op["before"], **fields}, op["version"])
 
+        # ── 2) 대상 조회 (이미 지워졌거나 복원된 거래는 건너뜀) ──
+        rows = list(
+            Transaction.all_objects.filter(
+                user_id=user_id, tx_id__in=created_ids | deleted_ids | reverts.keys()
+            )
+        )
+        targets, restored, reverted = [], [], []
+        for tx in rows:
+            if str(tx.tx_id) in created_ids and tx.deleted_at is None:
+                targets.append(tx)
+            elif str(tx.tx_id) in deleted_ids and tx.deleted_at is not None:
+                restored.append(tx)
+        restored_ids = {str(tx.tx_id) for tx in restored}
+        for tx in rows:
+            fields, version = reverts.get(str(tx.tx_id), (None, None))
+            live = tx.deleted_at is None or str(tx.tx_id) in restored_ids
+            if fields is not None and live and tx.version == version:
+                changes = dict(fields)
+                if "occurred_date" in changes:
+                    changes["occurred_date"] = date.fromisoformat(
+                        changes["occurred_date"]
+                    )
+                reverted.append((tx, _changed_copy(tx, changes)))
+        if not targets and not restored and not reverted:
+            raise TransactionNotFoundError()
+        target_ids = [tx.tx_id for tx in targets]
+
+        # ── 3) 감사로그 · 삭제 표시 전환 · 예산 누계 (Atomic) ──
+        try:
+            with transaction.atomic():
+                log_audit_bulk(
+                    [
+                        {"user_id": user_id, "action": "undo", "tx_id": tx.tx_id}
+                        for tx in targets
+                    ]
+                    + [
+                        # 복원은 생성 이벤트 (스냅샷 복원 규칙과 동일)
+                        {
+                            "user_id": user_id,
+                            "action": "create",
+                            "tx_id": tx.tx_id,
+                            "after_snapshot": transaction_image(tx),
+                        }
+                        for tx in restored
+                    ]
+                )
+
+                Transaction.all_objects.filter(
+                    user_id=user_id,
+                    tx_id__in=target_ids + [tx.tx_id for tx in restored],
+                ).update(
+                    deleted_at=Case(
+                        When(tx_id__in=target_ids, then=Value(timezone.now())),
+                        default=None,
+                        output_field=DateTimeField(),
+                    )
+                )
+
+                revert_spending(user_id, targets)
+                deltas: dict[tuple[str, str, str], int] = {}
+                for tx in restored:
+                    _add_spending(deltas, user_id, tx, 1)
+
+                # 수정 되돌리기 — 필드별 CASE로 UPDATE 1회, version이 바뀐 거래가 있으면 충돌
+                revert_logs, values = [], {}
+                for tx, previous in reverted:
+                    before, after = encode_delta(
+                        transaction_image(tx), transaction_image(previous)
+                    )
+                    for field in after:
+                        values.setdefault(field, []).append(
+                            (tx.tx_id, getattr(previous, field))
+                        )
+                    revert_logs.append(
+                        {
+                            "user_id": user_id,
+                            "action": "update",
+                            "tx_id": tx.tx_id,
+                            "before_snapshot": before,
+                            "after_snapshot": after,
+                        }
+                    )
+                    _add_spending(deltas, user_id, tx, -1)
+                    _add_spending(deltas, user_id, previous, 1)
+                if reverted:
+                    cases = {}
+                    for field, pairs in values.items():
+                        model_field = Transaction._meta.get_field(field)
+                        cases[field] = Case(
+                            *[
+                                When(tx_id=tx_id, then=Value(value, model_field))
+                                for tx_id, value in pairs
+                            ],
+                            default=F(field),
+                            output_field=model_field,
+                        )
+                    matched = Q()
+                    for tx, _ in reverted:
+                        matched |= Q(
+                            tx_id=tx.tx_id,
+                            occurred_date=tx.occurred_date,
+                            version=tx.version,
+                        )
+                    updated = (
+                        Transaction.objects.filter(user_id=user_id)
+                        .filter(matched)
+                        .update(
+                            **cases,
+                            version=F("version") + 1,
+                            updated_at=timezone.now(),
+                        )
+                    )
+                    if updated != len(reverted):
+                        raise TransactionConflictError()
+                    log_audit_bulk(revert_logs)
+                apply_spending_bulk({key: d for key, d in deltas.items() if d})
+
+                if target_ids:
+                    schedule_remove(user_id, target_ids)
+                if restored or reverted:
+                    schedule_index(restored + [previous for _, previous in reverted])
+        except Exception:
+            # DB 반영 실패 → 그룹을 스택에 되돌려 다시 시도할 수 있게
+            push_undo_group(user_id, group)
+            raise
+
+        mark_recent_write(user_id)
+
+        undone = targets + restored + [tx for tx, _ in reverted]
         return {
             "success": True,
-            "tx_id": str(tx_id),
-            "message": "저장이 취소되었습니다.",
+            "undone": {
+                "created": len(targets),
+                "deleted": len(restored),
+                "updated": len(reverted),
+            },
+            "tx_ids": [str(tx.tx_id) for tx in undone],
+            "message": (
+                "저장이 취소되었습니다."
+                if len(undone) == len(targets)
+                else f"{len(undone)}건의 작업을 되돌렸습니다."
+            ),
         }
 
     @staticmethod
@@ -185,6 +574,10 @@ class TransactionCommandService:
     ) -> dict:
         """
         조건부 삭제 (Atomic).
+
+        merchant는 실제 가맹점명에 포함될 때만 삭제합니다. 퍼지 매칭 후보
+        ("스벅" → "스타벅스")로는 지우지 않고 candidates로 돌려주며,
+        호출자가 확인한 가맹점명으로 다시 요청해야 삭제됩니다.
         """
         qs = Transaction.objects.filter(
             user_id=user_id,
@@ -195,77 +588,149 @@ class TransactionCommandService:
 
         if category and category != "기타":
             qs = qs.filter(category=category)
-        if merchant:
-            qs = qs.filter(merchant__icontains=merchant)
 
-        target = qs.order_by("-created_at").first()
+        if merchant:
+            target = (
+                qs.filter(merchant__icontains=merchant).order_by("-created_at").first()
+            )
+            if not target:
+                # 표기가 다르면 후보만 안내 (퍼지 매칭 결과로 삭제하지 않음)
+                candidates = expand_merchant_keyword(user_id, merchant)
+                matched = []
+                if candidates:
+                    matched = sorted(
+                        set(
+                            qs.filter(merchant__in=candidates).values_list(
+                                "merchant", flat=True
+                            )
+                        )
+                    )
+                if matched:
+                    return {
+                        "success": False,
+                        "message": f"'{merchant}'과(와) 정확히 일치하는 내역이 없습니다. "
+                        f"{', '.join(matched)} 내역이 맞다면 가맹점명을 정확히 알려주세요.",
+                        "candidates": matched,
+                    }
+        else:
+            target = qs.order_by("-created_at").first()
         if not target:
             return {
                 "success": False,
                 "message": "일치하는 거래 내역을 찾을 수 없습니다.",
             }
 
+        deleted_tx = {
+            "tx_id": str(target.tx_id),
+            "user_id": user_id,
+            **transaction_image(target),
+        }
         with transaction.atomic():
-            before_snapshot = {
-                "tx_id": str(target.tx_id),
-                "user_id": target.user_id,
-                "occurred_date": str(target.occurred_date),
-                "type": target.type,
-                "amount": target.amount,
-                "category": target.category,
-                "subcategory": target.subcategory,
-                "merchant": target.merchant,
-            }
-            log_audit(
-                user_id, "delete", tx_id=target.tx_id, before_snapshot=before_snapshot
-            )
+            log_audit(user_id, "delete", tx_id=target.tx_id)
+            record_undo(user_id, [{"op": "delete", "tx_id": deleted_tx["tx_id"]}])
+
+            revert_spending(user_id, [target])
+            # 삭제 표시 (occurred_date로 파티션 한정)
+            Transaction.objects.filter(
+                tx_id=target.tx_id, occurred_date=target.occurred_date
+            ).update(deleted_at=timezone.now())
+            schedule_remove(user_id, [deleted_tx["tx_id"]])
 
-            target.delete()
+        mark_recent_write(user_id)
 
         return {
             "success": True,
             "message": f"{target.occurred_date} {target.category} {target.amount:,}원 내역을 삭제했습니다.",
-            "deleted_tx": before_snapshot,
+            "deleted_tx": deleted_tx,
         }
 
+    @staticmethod
+    def match_transaction_ids(
+        user_id: str,
+        start_date: date | None = None,
+        end_date: date | None = None,
+        amount: int | None = None,
+        category: str | None = None,
+    ) -> list[str]:
+        """
+        삭제 대상 조회 — 조건에 맞는 거래 ID 전부 (primary, 개수 제한 없음).
+        search_transactions는 LLM용이라 10건에서 잘리므로 일괄 삭제에는 이걸 씁니다.
+        """
+        qs = Transaction.objects.filter(user_id=user_id)
+        if start_date:
+            qs = qs.filter(occurred_date__gte=start_date)
+        if end_date:
+            qs = qs.filter(occurred_date__lte=end_date)
+        if amount is not None:
+            qs = qs.filter(amount=amount)
+        if category and category != "기타":
+            qs = qs.filter(category=category)
+        return [
+            str(tx_id)
+            for tx_id in qs.order_by("-occurred_date", "-created_at").values_list(
+                "tx_id", flat=True
+            )
+        ]
+
     @staticmethod
     def delete_transactions_by_ids(user_id: str, tx_ids: list[str]) -> dict:
         """
-        ID 일괄 삭제 (Atomic).
+        ID 일괄 삭제 (Atomic) — UPDATE 한 번으로 삭제 표시.
         """
-        targets = Transaction.objects.filter(user_id=user_id, tx_id__in=tx_ids)
-        if not targets.exists():
+        targets = list(Transaction.objects.filter(user_id=user_id, tx_id__in=tx_ids))
+        if not targets:
             return {"success": False, "message": "삭제할 내역을 찾지 못했어요."}
 
-        count = 0
-        deleted_details = []
+        deleted_ids = [target.tx_id for target in targets]
+        deleted_details = [
+            f"{target.occurred_date} {target.merchant or target.category} {target.amount}"
+            for target in targets
+        ]
 
         with transaction.atomic():
-            for target in targets:
-                before_snapshot = {
-                    "tx_id": str(target.tx_id),
-                    "user_id": target.user_id,
-                    "occurred_date": str(target.occurred_date),
-                    "type": target.type,
-                    "amount": target.amount,
-                    "category": target.category,
-                    "subcategory": target.subcategory,
-                    "merchant": target.merchant,
-                }
-                log_audit(
-                    user_id,
-                    "delete",
-                    tx_id=target.tx_id,
-                    before_snapshot=before_snapshot,
-                )
-                deleted_details.append(
-                    f"{target.occurred_date} {target.merchant or target.category} {target.amount}"
-                )
-                target.delete()
-                count += 1
+            log_audit_bulk(
+                [
+                    {"user_id": user_id, "action": "delete", "tx_id": tx_id}
+                    for tx_id in deleted_ids
+                ]
+            )
+            record_undo(
+                user_id,
+                [{"op": "delete", "tx_id": str(tx_id)} for tx_id in deleted_ids],
+            )
+            Transaction.objects.filter(user_id=user_id, tx_id__in=deleted_ids).update(
+                deleted_at=timezone.now()
+            )
+            revert_spending(user_id, targets)
+            schedule_remove(user_id, deleted_ids)
+
+        mark_recent_write(user_id)
 
         return {
             "success": True,
-            "message": f"{count}건의 내역을 삭제했습니다.",
+            "message": f"{len(targets)}건의 내역을 삭제했습니다.",
             "details": deleted_details,
         }
+
+    @staticmethod
+    def purge_deleted(before: datetime, batch_size: int = 1000) -> Iterator[int]:
+        """
+        before 이전에 삭제 표시된 거래를 batch_size개씩 실제 삭제 (배치마다 커밋).
+        멱등성 키는 ORM CASCADE로 함께 삭제되고, 감사로그는 남습니다.
+
+        Yields:
+            배치별 삭제한 거래 수
+        """
+        while True:
+            batch = list(
+                Transaction.all_objects.filter(deleted_at__lt=before)
+                .order_by("deleted_at")
+                .values_list("tx_id", flat=True)[:batch_size]
+            )
+            if not batch:
+                return
+            with transaction.atomic():
+                Transaction.all_objects.filter(
+                    tx_id__in=batch, deleted_at__lt=before
+                ).delete()
+            yield len(batch)
@@ -1,17 +1,24 @@
 """TransactionQueryService — 거래 조회, 검색, 통계 (Read)"""
 
 import calendar
-from datetime import date
+from datetime import date, timedelta
 
-from django.db.models import Sum
+from django.db.models import Q, Sum
 
+from core.db_router import read_db_for
 from ledger.models import Transaction
+from ledger.services.merchant_vocab import expand_merchant_keyword
+from ledger.services.semantic_index import semantic_search
+from ledger.services.normalizer import normalize_date
 
 
 class TransactionQueryService:
     """
     거래 조회(Read)를 담당하는 서비스.
     CQRS 패턴의 Query 역할.
+
+    읽기 복제본이 설정되어 있으면 replica에서 조회합니다.
+    (사용자의 최근 쓰기 직후에는 core.db_router가 primary로 고정)
     """
 
     @staticmethod
@@ -25,7 +32,7 @@ class TransactionQueryService:
         거래 목록 조회 (필터링 적용).
         Returns: QuerySet[Transaction]
         """
-        qs = Transaction.objects.filter(user_id=user_id)
+        qs = Transaction.objects.using(read_db_for(user_id)).filter(user_id=user_id)
         if from_date:
             qs = qs.filter(occurred_date__gte=from_date)
         if to_date:
@@ -40,37 +47,95 @@ class TransactionQueryService:
         month: str | None = None,
         from_date=None,
         to_date=None,
+        category: str | None = None,
+        tx_type: str = "expense",
+        compare_previous: bool = False,
     ) -> dict:
         """
-        기간별 카테고리별 지출 합계.
+        기간별 카테고리별 합계 (기본: 지출).
+
+        compare_previous=True면 직전 같은 길이의 기간(월 단위면 전월)도
+        같은 GROUP BY 쿼리의 조건부 SUM으로 함께 집계합니다.
         """
         if from_date and to_date:
+            from_date, to_date = normalize_date(from_date), normalize_date(to_date)
             label = f"{from_date} ~ {to_date}"
+            prev_to = from_date - timedelta(days=1)
+            prev_from = prev_to - (to_date - from_date)
+            prev_label = f"{prev_from} ~ {prev_to}"
         elif month:
             year, m = int(month[:4]), int(month[5:7])
             from_date = date(year, m, 1)
             last_day = calendar.monthrange(year, m)[1]
             to_date = date(year, m, last_day)
             label = month
+            prev_to = from_date - timedelta(days=1)
+            prev_from = prev_to.replace(day=1)
+            prev_label = prev_from.strftime("%Y-%m")
         else:
             raise ValueError("month 또는 from_date/to_date 필수")
 
-        qs = (
-            Transaction.objects.filter(
-                user_id=user_id,
-                type="expense",
-                occurred_date__gte=from_date,
-                occurred_date__lte=to_date,
-            )
-            .values("category")
-            .annotate(cat_total=Sum("amount"))
-            .order_by("-cat_total")
+        qs = Transaction.objects.using(read_db_for(user_id)).filter(
+            user_id=user_id,
+            type=tx_type,
+            occurred_date__gte=prev_from if compare_previous else from_date,
+            occurred_date__lte=to_date,
         )
+        if category:
+            qs = qs.filter(category=category)
+
+        aggregates = {
+            "cat_total": Sum("amount", filter=Q(occurred_date__gte=from_date))
+        }
+        if compare_previous:
+            aggregates["prev_total"] = Sum(
+                "amount", filter=Q(occurred_date__lte=prev_to)
+            )
+        rows = list(qs.values("category").annotate(**aggregates).order_by("-cat_total"))
 
-        by_category = {row["category"]: row["cat_total"] for row in qs}
+        by_category = {
+            row["category"]: row["cat_total"] for row in rows if row["cat_total"]
+        }
         total = sum(by_category.values())
+        result = {"label": label, "total": total, "by_category": by_category}
+        if category or tx_type != "expense":
+            result.update(category=category, type=tx_type)
 
-        return {"label": label, "total": total, "by_category": by_category}
+        if compare_previous:
+            prev_by_category = {
+                row["category"]: row["prev_total"]
+                for row in sorted(rows, key=lambda r: -(r["prev_total"] or 0))
+                if row["prev_total"]
+            }
+            prev_total = sum(prev_by_category.values())
+            result["previous"] = {
+                "label": prev_label,
+                "total": prev_total,
+                "by_category": prev_by_category,
+            }
+            result["change"] = total - prev_total
+
+        return result
+
+    @staticmethod
+    def recent_transactions(user_id: str, limit: int) -> list[dict]:
+        """
+        Agent 첫 프롬프트용 최근 거래 (idx_tx_user_date_created 순서 그대로 limit건).
+        """
+        return list(
+            Transaction.objects.using(read_db_for(user_id))
+            .filter(user_id=user_id)
+            .order_by("-occurred_date", "-created_at")
+            .values(
+                "tx_id",
+                "occurred_date",
+                "type",
+                "amount",
+                "category",
+                "merchant",
+                "memo",
+            )[:limit]
+        )
 
     @staticmethod
     def search_transactions(
@@ -87,7 +152,7 @@ class TransactionQueryService:
         Returns:
             list[dict]: 검색된 거래 내역 (최대 20개)
         """
-        qs = Transaction.objects.filter(user_id=user_id)
+        qs = Transaction.objects.using(read_db_for(user_id)).filter(user_id=user_id)
 
         if start_date:
             qs = qs.filter(occurred_date__gte=start_date)
@@ -102,15 +167,22 @@ class TransactionQueryService:
 
         if keyword:
             # merchant, category, subcategory, memo, source_text 에서 검색
-            from django.db.models import Q
-
-            qs = qs.filter(
+            # + 가맹점 어휘 퍼지 매칭 ("스벅" → "스타벅스")
+            matches = (
                 Q(merchant__icontains=keyword)
                 | Q(category__icontains=keyword)
                 | Q(subcategory__icontains=keyword)
                 | Q(memo__icontains=keyword)
                 | Q(source_text__icontains=keyword)
             )
+            merchants = expand_merchant_keyword(user_id, keyword)
+            if merchants:
+                matches |= Q(merchant__in=merchants)
+            # + 의미 검색 (SEMANTIC_SEARCH_MODEL 설정 시, 위 SQL 필터와 함께 적용)
+            similar = semantic_search(user_id, keyword)
+            if similar:
+                matches |= Q(tx_id__in=similar)
+            qs = qs.filter(matches)
 
         # 최신순, 최대 10개만 반환 (LLM 컨텍스트 절약)
         results = []
@@ -1,38 +1,113 @@
-"""Undo 토큰 서비스 - Redis TTL 저장/조회"""
+"""Undo 스택 서비스 — 사용자별 작업 그룹 (Redis 리스트)
 
-from uuid import UUID
+    undo:stack:{user_id}   최근 그룹이 맨 앞 (LPUSH + LTRIM UNDO_STACK_SIZE)
+    그룹 = {"group_id", "created_at", "ops": [...]}
+        {"op": "create", "tx_id"} → 되돌리면 삭제 표시
+        {"op": "delete", "tx_id"} → 되돌리면 삭제 표시 해제 (행이 남아 있으므로 id만)
+        {"op": "update", "tx_id", "before", "version"} → 수정 후 version이 그대로면
+                                                        before(수정 전 값)로 되돌림
+
+요청 하나(거래 생성/수정 API 1회, chat 메시지 1회)의 쓰기를 한 그룹으로 묶어
+POST /undo/ 한 번으로 전부 되돌립니다. group_id가 응답의 undo_token 입니다.
+ops는 DB 커밋 후에만 그룹에 들어가므로 롤백된 쓰기는 스택에 남지 않습니다.
+UNDO_TTL_SECONDS가 지난 그룹은 되돌릴 수 없습니다.
+"""
+
+import json
+import time
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
 
 from django.conf import settings
+from django.db import transaction
 from django_redis import get_redis_connection
 
-REDIS_KEY_PREFIX = "undo:"
+STACK_KEY_PREFIX = "undo:stack:"
+
+# group_id가 비어 있으면 맨 위 그룹, 아니면 해당 그룹을 꺼냄 (LRANGE + LREM 원자적)
+_POP_GROUP_LUA = """
+local items = redis.call('LRANGE', KEYS[1], 0, -1)
+for _, item in ipairs(items) do
+    if ARGV[1] == '' or cjson.decode(item)['group_id'] == ARGV[1] then
+        redis.call('LREM', KEYS[1], 1, item)
+        return item
+    end
+end
+return false
+"""
+
+_current_group: ContextVar[dict | None] = ContextVar("undo_group", default=None)
+
+
+def _stack_key(user_id: str) -> str:
+    return f"{STACK_KEY_PREFIX}{user_id}"
+
 
+def _new_group() -> dict:
+    return {"group_id": str(uuid.uuid4()), "created_at": time.time(), "ops": []}
 
-def save_undo_token(
-    undo_token: str, tx_id: UUID, ttl_seconds: int | None = None
-) -> None:
-    """Redis에 undo_token → tx_id 저장 (TTL 적용)."""
-    ttl = ttl_seconds or settings.UNDO_TTL_SECONDS
-    redis = get_redis_connection("default")
-    key = f"{REDIS_KEY_PREFIX}{undo_token}"
-    redis.set(key, str(tx_id), ex=ttl)
 
+def push_undo_group(user_id: str, group: dict) -> None:
+    """그룹을 스택 맨 위에 추가하고 UNDO_STACK_SIZE개만 유지."""
+    key = _stack_key(user_id)
+    pipe = get_redis_connection("default").pipeline()
+    pipe.lpush(key, json.dumps(group, ensure_ascii=False))
+    pipe.ltrim(key, 0, settings.UNDO_STACK_SIZE - 1)
+    pipe.expire(key, settings.UNDO_TTL_SECONDS)
+    pipe.execute()
 
-def get_tx_id_from_undo_token(undo_token: str) -> UUID | None:
-    """Redis에서 undo_token으로 tx_id 조회."""
-    redis = get_redis_connection("default")
-    key = f"{REDIS_KEY_PREFIX}{undo_token}"
-    value = redis.get(key)
-    if value is None:
+
+def pop_undo_group(user_id: str, group_id: str | None = None) -> dict | None:
+    """
+    스택에서 그룹 하나를 꺼냄 (Redis 1회).
+    group_id가 없으면 가장 최근 그룹. 없거나 만료됐으면 None.
+    """
+    raw = get_redis_connection("default").eval(
+        _POP_GROUP_LUA, 1, _stack_key(user_id), group_id or ""
+    )
+    if raw is None:
+        return None
+    group = json.loads(raw)
+    if time.time() - group["created_at"] > settings.UNDO_TTL_SECONDS:
         return None
-    # django-redis returns bytes by default
-    if isinstance(value, bytes):
-        value = value.decode("utf-8")
-    return UUID(value)
+    return group
+
+
+@contextmanager
+def undo_group(user_id: str):
+    """블록 안의 쓰기를 한 그룹으로 묶음 (중첩되면 바깥 그룹에 합쳐짐)."""
+    group = _current_group.get()
+    if group is not None:
+        yield group
+        return
+
+    group = _new_group()
+    token = _current_group.set(group)
+    try:
+        yield group
+    finally:
+        _current_group.reset(token)
+        recorded = group.pop("recorded", False)
+        if recorded:
+            # 블록 안 ops 추가(on_commit)보다 뒤에 등록되므로 그 다음에 실행됨
+            transaction.on_commit(
+                lambda: group["ops"] and push_undo_group(user_id, group), robust=True
+            )
+
 
+def record_undo(user_id: str, ops: list[dict]) -> str:
+    """
+    쓰기 결과를 현재 그룹에 기록 (커밋 후 반영). group_id(undo_token) 반환.
+    undo_group 밖이면 ops만으로 된 그룹을 커밋 후 바로 쌓습니다.
+    """
+    group = _current_group.get()
+    if group is not None:
+        group["recorded"] = True
+        transaction.on_commit(lambda: group["ops"].extend(ops))
+        return group["group_id"]
 
-def delete_undo_token(undo_token: str) -> None:
-    """Redis에서 undo_token 삭제 (1회용, 재사용 방지)."""
-    redis = get_redis_connection("default")
-    key = f"{REDIS_KEY_PREFIX}{undo_token}"
-    redis.delete(key)
+    group = _new_group()
+    group["ops"] = list(ops)
+    transaction.on_commit(lambda: push_undo_group(user_id, group), robust=True)
+    return group["group_id"]
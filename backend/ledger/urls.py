@@ -3,8 +3,12 @@
 from django.urls import path
 
 from ledger.views import (
+    BudgetView,
+    ChatJobView,
     ChatView,
+    InsightsView,
     SummaryView,
+    TransactionDetailView,
     TransactionListCreateView,
     UndoView,
 )
@@ -13,7 +17,15 @@ app_name = "ledger"
 
 urlpatterns = [
     path("chat/", ChatView.as_view(), name="chat"),
+    path("chat/jobs/<uuid:job_id>/", ChatJobView.as_view(), name="chat-job"),
     path("transactions/", TransactionListCreateView.as_view(), name="transactions"),
+    path(
+        "transactions/<uuid:tx_id>/",
+        TransactionDetailView.as_view(),
+        name="transaction-detail",
+    ),
     path("undo/", UndoView.as_view(), name="undo"),
     path("summary/", SummaryView.as_view(), name="summary"),
+    path("insights/", InsightsView.as_view(), name="insights"),
+    path("budgets/", BudgetView.as_view(), name="budgets"),
 ]
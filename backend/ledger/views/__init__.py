@@ -1,17 +1,23 @@
 """views 패키지 - 기존 import 호환"""
 
 from ledger.views.health import HealthDBView, HealthView, RootView
-from ledger.views.chat import ChatView
-from ledger.views.transactions import TransactionListCreateView
+from ledger.views.chat import ChatJobView, ChatView
+from ledger.views.transactions import TransactionDetailView, TransactionListCreateView
 from ledger.views.undo import UndoView
 from ledger.views.summary import SummaryView
+from ledger.views.insights import InsightsView
+from ledger.views.budgets import BudgetView
 
 __all__ = [
     "RootView",
     "HealthView",
     "HealthDBView",
     "ChatView",
+    "ChatJobView",
     "TransactionListCreateView",
+    "TransactionDetailView",
     "UndoView",
     "SummaryView",
+    "InsightsView",
+    "BudgetView",
 ]
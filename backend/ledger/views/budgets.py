@@ -0,0 +1,40 @@
+"""GET/POST /budgets — 월별 카테고리 예산 (Thin View)"""
+
+from datetime import date
+
+from rest_framework import status
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from ledger.serializers import BudgetQuerySerializer, BudgetRequestSerializer
+from ledger.services.budget import list_budgets, month_key, set_budget
+
+
+class BudgetView(APIView):
+    """
+    GET  /budgets/?month=YYYY-MM — 예산별 지출/잔액
+    POST /budgets/               — 예산 설정 (있으면 갱신)
+    """
+
+    def get(self, request):
+        query_serializer = BudgetQuerySerializer(data=request.query_params)
+        query_serializer.is_valid(raise_exception=True)
+        month = query_serializer.validated_data["month"] or month_key(date.today())
+
+        budgets = list_budgets(str(request.user.id), month)
+
+        return Response({"month": month, "budgets": budgets})
+
+    def post(self, request):
+        serializer = BudgetRequestSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+
+        result = set_budget(
+            user_id=str(request.user.id),
+            month=data["month"],
+            category=data["category"],
+            amount=data["amount"],
+        )
+
+        return Response(result, status=status.HTTP_201_CREATED)
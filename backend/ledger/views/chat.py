@@ -4,7 +4,13 @@ from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from ledger.exceptions import ChatJobNotFoundError
 from ledger.serializers import ChatRequestSerializer
+from ledger.services.chat_jobs import (
+    build_chat_payload,
+    enqueue_chat_job,
+    get_chat_job,
+)
 
 
 class ChatView(APIView):
@@ -20,6 +26,14 @@ class ChatView(APIView):
         idem_key = data.get("idem_key")
         llm_provider = data.get("llm_provider")
 
+        # ── 0) 비동기 모드: 큐에 넣고 즉시 반환 ──
+        if data.get("async_mode"):
+            job_id = enqueue_chat_job(user_id, message, llm_provider)
+            return Response(
+                {"job_id": job_id, "status": "queued"},
+                status=status.HTTP_202_ACCEPTED,
+            )
+
         # ── 1) Agent Logic ──
         try:
             result = self._run_agent(user_id, message, llm_provider)
@@ -31,27 +45,7 @@ class ChatView(APIView):
             )
 
         # ── 2) Response 구성 ──
-        # Agent가 최종적으로 생성한 거래 중 첫 번째 것의 undo_token만 반환 (UI 제약)
-        # 여러 개 생성되어도 일단 하나만 취소 가능하게 하거나, UI 스펙에 따라 다름.
-        # 여기서는 가장 마지막 생성된 건의 토큰을 반환.
-
-        created_txs = result.get("created_txs", [])
-        tx_id = None
-        undo_token = None
-
-        if created_txs:
-            last_tx = created_txs[-1]
-            tx_id = last_tx["tx_id"]
-            undo_token = last_tx["undo_token"]
-
-        return Response(
-            {
-                "reply": result["reply"],
-                "tx_id": tx_id,
-                "undo_token": undo_token,
-                "needs_clarification": False,  # Agent가 알아서 질문함
-            }
-        )
+        return Response(build_chat_payload(result))
 
     # ── Private ──
 
@@ -59,3 +53,13 @@ class ChatView(APIView):
         from ledger.services.orchestrator import run_agent_loop
 
         return run_agent_loop(user_id, message, provider_override=llm_provider)
+
+
+class ChatJobView(APIView):
+    """GET /chat/jobs/<job_id>/ — 비동기 chat 작업 상태/결과 조회"""
+
+    def get(self, request, job_id):
+        job = get_chat_job(str(job_id), str(request.user.id))
+        if job is None:
+            raise ChatJobNotFoundError()
+        return Response(job)
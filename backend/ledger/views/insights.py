@@ -0,0 +1,24 @@
+"""GET /insights — 소비 추이/패턴 인사이트 (Thin View)"""
+
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from ledger.serializers import InsightsQuerySerializer
+from ledger.services.analytics import InsightsService
+
+
+class InsightsView(APIView):
+    """GET /insights/ — 월별 추이, 이동평균, 요일별 패턴, 상위 가맹점, 전월 대비"""
+
+    def get(self, request):
+        query_serializer = InsightsQuerySerializer(data=request.query_params)
+        query_serializer.is_valid(raise_exception=True)
+        params = query_serializer.validated_data
+
+        result = InsightsService.get_insights(
+            user_id=str(request.user.id),
+            months=params["months"],
+            window=params["window"],
+        )
+
+        return Response(result)
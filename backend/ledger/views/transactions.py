@@ -1,4 +1,4 @@
-"""POST/GET /transactions — 거래 CRUD (Thin View)"""
+"""POST/GET /transactions, PATCH /transactions/<tx_id> — 거래 CRUD (Thin View)"""
 
 from rest_framework import status
 from rest_framework.response import Response
@@ -6,10 +6,11 @@ from rest_framework.views import APIView
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.throttling import ScopedRateThrottle
 
+from ledger.renderers import ORJSONRenderer, transaction_rows
 from ledger.serializers import (
     CreateTransactionSerializer,
     TransactionListQuerySerializer,
-    TransactionResponseSerializer,
+    UpdateTransactionSerializer,
 )
 from ledger.services.transaction_command import TransactionCommandService
 from ledger.services.transaction_query import TransactionQueryService
@@ -22,6 +23,7 @@ class TransactionListCreateView(APIView):
     """POST /transactions/ — 거래 생성, GET /transactions/ — 거래 조회"""
 
     permission_classes = [IsAuthenticated, IsOwner]
+    renderer_classes = [ORJSONRenderer]
     throttle_classes = [ScopedRateThrottle]
     throttle_scope = "transactions.create"
 
@@ -52,6 +54,7 @@ class TransactionListCreateView(APIView):
                 "tx_id": result["tx_id"],
                 "cached": False,
                 "undo_token": result["undo_token"],
+                "budget": result["budget"],
             }
         )
 
@@ -70,5 +73,32 @@ class TransactionListCreateView(APIView):
             category=params.get("category"),
         )
 
-        response_serializer = TransactionResponseSerializer(transactions, many=True)
-        return Response({"transactions": response_serializer.data})
+        # Serializer 대신 values_list → dict (인코딩은 ORJSONRenderer)
+        return Response({"transactions": transaction_rows(transactions)})
+
+
+class TransactionDetailView(APIView):
+    """PATCH /transactions/<tx_id>/ — 거래 수정 (version으로 동시 수정 충돌 감지)"""
+
+    permission_classes = [IsAuthenticated, IsOwner]
+    throttle_classes = [ScopedRateThrottle]
+    throttle_scope = "transactions.update"
+
+    def patch(self, request, tx_id):
+        """거래 수정"""
+        serializer = UpdateTransactionSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = dict(serializer.validated_data)
+        version = data.pop("version", None)
+
+        try:
+            result = TransactionCommandService.update_transaction(
+                user_id=str(request.user.id),  # ← JWT 토큰에서 추출
+                tx_id=tx_id,
+                args=data,
+                expected_version=version,
+            )
+        except ValueError as e:
+            raise TransactionValueError(detail=str(e))
+
+        return Response(result)
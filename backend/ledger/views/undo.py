@@ -1,4 +1,4 @@
-"""POST /undo — 마지막 저장 취소 (Thin View)"""
+"""POST /undo — 최근 작업 그룹 되돌리기 (Thin View)"""
 
 from rest_framework.response import Response
 from rest_framework.views import APIView
@@ -8,13 +8,14 @@ from ledger.services.transaction_command import TransactionCommandService
 
 
 class UndoView(APIView):
-    """POST /undo/ — undo_token으로 거래 취소"""
+    """POST /undo/ — 사용자 undo 스택의 그룹(생성/삭제 여러 건)을 한 번에 되돌림"""
 
     def post(self, request):
         serializer = UndoRequestSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
 
         result = TransactionCommandService.undo_transaction(
+            user_id=str(request.user.id),  # ← JWT 토큰에서 추출
             undo_token=serializer.validated_data["undo_token"],
         )
 
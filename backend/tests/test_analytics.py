@@ -0,0 +1,147 @@
+"""
+test_analytics.py — 컬럼형 인사이트 계산 + GET /api/v1/insights/ 테스트
+
+실행: pytest tests/test_analytics.py -v
+"""
+
+from datetime import date
+
+import numpy as np
+import pytest
+from rest_framework import status
+
+from ledger.models import Transaction
+from ledger.services.analytics import (
+    TransactionColumns,
+    compute_insights,
+    load_columns,
+)
+
+TODAY = date(2026, 2, 13)  # 금요일
+
+
+def _columns(rows):
+    """rows: (date, amount, type, category, merchant)"""
+    categories = sorted({r[3] for r in rows})
+    merchants = sorted({r[4] for r in rows if r[4]})
+    return TransactionColumns(
+        dates=np.array([r[0].toordinal() for r in rows], np.int32),
+        amounts=np.array([r[1] for r in rows], np.int64),
+        is_expense=np.array([r[2] == "expense" for r in rows], bool),
+        categories=np.array([categories.index(r[3]) for r in rows], np.int16),
+        category_labels=tuple(categories),
+        merchants=np.array(
+            [merchants.index(r[4]) if r[4] else -1 for r in rows], np.int32
+        ),
+        merchant_labels=tuple(merchants),
+    )
+
+
+ROWS = [
+    (date(2026, 2, 13), 8000, "expense", "식비", "김밥천국"),
+    (date(2026, 2, 10), 12000, "expense", "식비", "스타벅스"),
+    (date(2026, 2, 9), 30000, "expense", "쇼핑", None),
+    (date(2026, 2, 1), 3000000, "income", "급여", None),
+    (date(2026, 1, 12), 4500, "expense", "식비", "스타벅스"),
+    (date(2026, 1, 20), 99000, "expense", "쇼핑", None),  # 전월 비교 구간 밖
+    (date(2025, 6, 1), 50000, "expense", "식비", "스타벅스"),  # 기간 밖
+]
+
+
+class TestComputeInsights:
+    def test_월별_추이(self):
+        result = compute_insights(_columns(ROWS), today=TODAY, months=2)
+
+        assert result["period"] == {"from": "2026-01-01", "to": "2026-02-13"}
+        assert result["monthly"] == [
+            {"month": "2026-01", "expense": 103500, "income": 0},
+            {"month": "2026-02", "expense": 50000, "income": 3000000},
+        ]
+
+    def test_이동평균(self):
+        result = compute_insights(_columns(ROWS), today=TODAY, window=7)
+
+        last = result["daily"][-1]
+        assert last == {
+            "date": "2026-02-13",
+            "expense": 8000,
+            "rolling_avg": round((8000 + 12000 + 30000) / 7, 1),
+        }
+        assert len(result["daily"]) == 30
+
+    def test_요일별_패턴(self):
+        result = compute_insights(_columns(ROWS), today=TODAY, months=1)
+
+        friday = result["weekday"][4]
+        assert friday["weekday"] == "금"
+        assert friday["total"] == 8000
+        assert friday["avg"] == 4000.0  # 2/6, 2/13 두 번
+
+    def test_상위_가맹점(self):
+        result = compute_insights(_columns(ROWS), today=TODAY, months=2)
+
+        assert result["top_merchants"] == [
+            {"merchant": "스타벅스", "total": 16500, "count": 2},
+            {"merchant": "김밥천국", "total": 8000, "count": 1},
+        ]
+
+    def test_전월_같은_기간_대비(self):
+        pop = compute_insights(_columns(ROWS), today=TODAY)["period_over_period"]
+
+        assert pop["previous"] == {
+            "from": "2026-01-01",
+            "to": "2026-01-13",
+            "total": 4500,
+        }
+        assert pop["current"]["total"] == 50000
+        assert pop["change"] == 45500
+        assert pop["by_category"][0] == {
+            "category": "쇼핑",
+            "current": 30000,
+            "previous": 0,
+            "change": 30000,
+        }
+
+    def test_빈_데이터(self):
+        result = compute_insights(_columns([]), today=TODAY)
+        assert result["top_merchants"] == []
+        assert result["period_over_period"]["change_rate"] is None
+
+
+@pytest.mark.django_db
+class TestInsightsAPI:
+    URL = "/api/v1/insights/"
+
+    def test_컬럼_로드(self, user, multiple_transactions):
+        cols = load_columns(str(user.id))
+
+        assert len(cols) == 4
+        assert cols.dates.dtype == np.int32
+        assert cols.amounts.dtype == np.int64
+        assert set(cols.category_labels) == {"식비", "교통", "쇼핑", "급여"}
+        assert (cols.merchants == -1).all()
+
+    def test_인사이트_조회(self, api_client, user):
+        Transaction.objects.create(
+            user_id=str(user.id),
+            occurred_date=date.today(),
+            type="expense",
+            amount=8000,
+            category="식비",
+            merchant="김밥천국",
+        )
+
+        response = api_client.get(self.URL, {"months": 3})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.data["monthly"]) == 3
+        assert response.data["monthly"][-1]["expense"] == 8000
+        assert response.data["top_merchants"][0]["merchant"] == "김밥천국"
+
+    def test_잘못된_개월수는_400(self, api_client):
+        response = api_client.get(self.URL, {"months": 0})
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_인증_필수(self, unauthenticated_client):
+        response = unauthenticated_client.get(self.URL)
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
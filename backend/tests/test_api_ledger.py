@@ -68,10 +68,9 @@ class TestTransactionCreateAPI:
 
     URL = "/api/v1/transactions/"
 
-    @patch("ledger.services.transaction_command.save_undo_token")
     @patch("ledger.services.transaction_command.log_audit")
     @patch("ledger.services.transaction_command.get_cached_tx_id", return_value=None)
-    def test_정상_거래_생성(self, mock_cache, mock_audit, mock_undo, api_client):
+    def test_정상_거래_생성(self, mock_cache, mock_audit, api_client):
         response = api_client.post(
             self.URL,
             {
@@ -113,3 +112,64 @@ class TestTransactionListAPI:
         assert response.status_code == status.HTTP_200_OK
         assert len(response.data["transactions"]) == 1
         assert response.data["transactions"][0]["amount"] == 8000
+
+    def test_Response_data와_본문이_같음(self, api_client, sample_transaction):
+        # 고속 경로도 Response를 거치므로 response.data 사용 가능
+        response = api_client.get(self.URL)
+        assert response.data["transactions"][0]["tx_id"] == str(
+            sample_transaction.tx_id
+        )
+        assert response.data == response.json()
+
+    def test_indent_요청은_들여쓰기_출력(self, api_client, sample_transaction):
+        response = api_client.get(self.URL, HTTP_ACCEPT="application/json; indent=2")
+        assert response.status_code == status.HTTP_200_OK
+        assert response.content.startswith(b'{\n  "transactions"')
+
+
+# ══════════════════════════════════════════
+# 거래 수정 API
+# ══════════════════════════════════════════
+
+
+@pytest.mark.django_db
+@patch("ledger.services.transaction_command.record_undo", return_value="undo-1")
+class TestTransactionUpdateAPI:
+    """PATCH /api/v1/transactions/<tx_id>/ — 거래 수정."""
+
+    def test_정상_수정(self, mock_undo, api_client, sample_transaction):
+        response = api_client.patch(
+            f"/api/v1/transactions/{sample_transaction.tx_id}/",
+            {"amount": "5000", "version": 1},
+            format="json",
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["changed"] == ["amount"]
+        assert response.data["version"] == 2
+        assert response.data["undo_token"] == "undo-1"
+
+    def test_버전_충돌_409(self, mock_undo, api_client, sample_transaction):
+        response = api_client.patch(
+            f"/api/v1/transactions/{sample_transaction.tx_id}/",
+            {"amount": "5000", "version": 2},
+            format="json",
+        )
+
+        assert response.status_code == status.HTTP_409_CONFLICT
+        assert response.data["code"] == "TRANSACTION_CONFLICT"
+
+    def test_다른_사용자_거래는_404(self, mock_undo, other_user, api_client):
+        from ledger.models import Transaction
+
+        tx = Transaction.objects.create(
+            user_id=other_user.id,
+            occurred_date="2026-02-13",
+            type="expense",
+            amount=8000,
+            category="식비",
+        )
+        response = api_client.patch(
+            f"/api/v1/transactions/{tx.tx_id}/", {"amount": "1"}, format="json"
+        )
+        assert response.status_code == status.HTTP_404_NOT_FOUND
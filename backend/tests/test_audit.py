@@ -0,0 +1,190 @@
+"""
+test_audit.py — 감사로그 기록 방식(sync / stream) 테스트 (Redis Mock)
+
+실행: pytest tests/test_audit.py -v
+"""
+
+import uuid
+from unittest.mock import MagicMock, patch
+
+import pytest
+from django.db import DatabaseError
+from django.test import override_settings
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from ledger.models import AuditLog
+from ledger.services.audit import (
+    claim_stale_events,
+    flush_audit_events,
+    log_audit,
+    log_audit_bulk,
+)
+
+
+@pytest.mark.django_db
+class TestLogAudit:
+    def test_sync_모드는_즉시_INSERT(self, user):
+        log_audit(str(user.id), "create", after_snapshot={"amount": 8000})
+        assert AuditLog.objects.filter(user_id=str(user.id)).count() == 1
+
+    @override_settings(AUDIT_WRITER="stream")
+    @patch("ledger.services.audit.get_redis_connection")
+    def test_stream_모드는_커밋_후_XADD만(
+        self, mock_conn, user, django_capture_on_commit_callbacks
+    ):
+        redis = mock_conn.return_value
+
+        with django_capture_on_commit_callbacks(execute=True):
+            log_audit(str(user.id), "create", after_snapshot={"amount": 8000})
+            # 커밋 전에는 Redis에 쓰지 않음
+            redis.xadd.assert_not_called()
+
+        assert AuditLog.objects.count() == 0
+        stream_key, event = redis.xadd.call_args.args
+        assert stream_key == "audit:events"
+        assert event["action"] == "create"
+        assert event["user_id"] == str(user.id)
+
+    @override_settings(AUDIT_WRITER="stream")
+    @patch("ledger.services.audit.get_redis_connection")
+    def test_stream_XADD_실패하면_직접_INSERT(
+        self, mock_conn, user, django_capture_on_commit_callbacks
+    ):
+        mock_conn.return_value.xadd.side_effect = RedisConnectionError("down")
+
+        with django_capture_on_commit_callbacks(execute=True):
+            log_audit(str(user.id), "create", after_snapshot={"amount": 8000})
+
+        log = AuditLog.objects.get(user_id=str(user.id))
+        assert log.after_snapshot == {"amount": 8000}
+
+    @override_settings(AUDIT_WRITER="stream")
+    @patch("ledger.services.audit.get_redis_connection")
+    def test_stream_일괄_XADD_실패해도_전부_저장(
+        self, mock_conn, user, django_capture_on_commit_callbacks
+    ):
+        pipe = mock_conn.return_value.pipeline.return_value
+        pipe.execute.side_effect = RedisConnectionError("down")
+        entries = [
+            {"user_id": str(user.id), "action": "delete", "tx_id": None}
+            for _ in range(3)
+        ]
+
+        with django_capture_on_commit_callbacks(execute=True):
+            log_audit_bulk(entries)
+
+        assert AuditLog.objects.filter(user_id=str(user.id)).count() == 3
+
+
+@pytest.mark.django_db
+class TestFlushAuditEvents:
+    def _message(self, user_id, event_id):
+        return {
+            b"event_id": event_id.encode(),
+            b"user_id": user_id.encode(),
+            b"action": b"delete",
+            b"tx_id": b"",
+            b"before_snapshot": '{"amount": 8000}'.encode(),
+            b"after_snapshot": b"null",
+            b"created_at": b"2026-02-13T12:00:00+00:00",
+        }
+
+    @patch("ledger.services.audit.get_redis_connection")
+    def test_일괄_저장_후_ACK(self, mock_conn, user):
+        redis = MagicMock()
+        mock_conn.return_value = redis
+        event_ids = [str(uuid.uuid4()) for _ in range(3)]
+        redis.xreadgroup.return_value = [
+            (
+                b"audit:events",
+                [
+                    (f"1-{i}".encode(), self._message(str(user.id), e))
+                    for i, e in enumerate(event_ids)
+                ],
+            )
+        ]
+
+        assert flush_audit_events("worker-1") == 3
+
+        logs = AuditLog.objects.filter(user_id=str(user.id))
+        assert logs.count() == 3
+        assert logs.first().created_at.isoformat() == "2026-02-13T12:00:00+00:00"
+        redis.xack.assert_called_once()
+        assert len(redis.xack.call_args.args) == 2 + 3
+
+    @patch("ledger.services.audit.get_redis_connection")
+    def test_재전송된_이벤트는_중복_저장되지_않음(self, mock_conn, user):
+        """at-least-once: 같은 event_id가 다시 와도 한 번만 저장."""
+        redis = MagicMock()
+        mock_conn.return_value = redis
+        event_id = str(uuid.uuid4())
+        redis.xreadgroup.return_value = [
+            (b"audit:events", [(b"1-0", self._message(str(user.id), event_id))])
+        ]
+
+        flush_audit_events("worker-1")
+        # 재시작으로 컨슈머 이름이 바뀌어도 XAUTOCLAIM으로 회수
+        redis.xautoclaim.return_value = [
+            b"0-0",
+            [(b"1-0", self._message(str(user.id), event_id))],
+            [],
+        ]
+        assert claim_stale_events("worker-2", min_idle_ms=1000) == 1
+
+        assert AuditLog.objects.filter(event_id=event_id).count() == 1
+        assert redis.xautoclaim.call_args.args[2:4] == ("worker-2", 1000)
+
+    @patch("ledger.services.audit.get_redis_connection")
+    def test_빈_항목과_깨진_항목은_ACK하고_넘어감(self, mock_conn, user):
+        redis = MagicMock()
+        mock_conn.return_value = redis
+        good = str(uuid.uuid4())
+        broken = self._message(str(user.id), "not-a-uuid")
+        redis.xautoclaim.return_value = [
+            b"0-0",
+            [
+                (b"1-0", None),  # 이미 XDEL된 항목
+                (b"1-1", broken),
+                (b"1-2", self._message(str(user.id), good)),
+            ],
+        ]
+
+        assert claim_stale_events("worker-1") == 1
+
+        assert AuditLog.objects.filter(event_id=good).exists()
+        dead_key, dead = redis.xadd.call_args.args
+        assert dead_key == "audit:events:dead" and dead["message_id"] == b"1-1"
+        assert redis.xack.call_args.args[2:] == (b"1-0", b"1-1", b"1-2")
+
+    @patch("ledger.services.audit.get_redis_connection")
+    def test_저장_실패한_건만_dead_letter(self, mock_conn, user):
+        redis = MagicMock()
+        mock_conn.return_value = redis
+        event_ids = [str(uuid.uuid4()) for _ in range(2)]
+        redis.xreadgroup.return_value = [
+            (
+                b"audit:events",
+                [
+                    (f"1-{i}".encode(), self._message(str(user.id), e))
+                    for i, e in enumerate(event_ids)
+                ],
+            )
+        ]
+        real_bulk_create = AuditLog.objects.bulk_create
+
+        def bulk_create(logs, **kwargs):
+            if len(logs) > 1 or str(logs[0].event_id) == event_ids[0]:
+                raise DatabaseError("boom")
+            return real_bulk_create(logs, **kwargs)
+
+        with patch.object(AuditLog.objects, "bulk_create", side_effect=bulk_create):
+            assert flush_audit_events("worker-1") == 1
+
+        assert AuditLog.objects.filter(event_id=event_ids[1]).exists()
+        assert redis.xadd.call_args.args[1]["message_id"] == b"1-0"
+        assert len(redis.xack.call_args.args) == 2 + 2
+
+    @patch("ledger.services.audit.get_redis_connection")
+    def test_새_이벤트_없으면_0(self, mock_conn):
+        mock_conn.return_value.xreadgroup.return_value = []
+        assert flush_audit_events("worker-1", block_ms=10) == 0
@@ -0,0 +1,83 @@
+"""
+test_authentication.py — 토큰 클레임 기반 JWT 인증 + 활성 사용자 캐시 테스트
+
+실행: pytest tests/test_authentication.py -v
+"""
+
+from unittest.mock import patch
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIRequestFactory
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.models import TokenUser
+from rest_framework_simplejwt.tokens import AccessToken
+
+from core import authentication
+from core.authentication import CachedJWTAuthentication
+
+
+@pytest.fixture(autouse=True)
+def _fresh_local_cache():
+    authentication._local.clear()
+    # Redis 없이: 캐시 미스(None) → DB 조회 경로
+    with patch.object(authentication, "cache") as mock_cache:
+        mock_cache.get.return_value = None
+        yield mock_cache
+    authentication._local.clear()
+
+
+def _authenticate(user):
+    token = AccessToken.for_user(user)
+    request = APIRequestFactory().get(
+        "/api/v1/summary/", HTTP_AUTHORIZATION=f"Bearer {token}"
+    )
+    return CachedJWTAuthentication().authenticate(request)
+
+
+@pytest.mark.django_db
+class TestCachedJWTAuthentication:
+    def test_토큰_사용자_반환(self, user):
+        request_user, _ = _authenticate(user)
+
+        assert isinstance(request_user, TokenUser)
+        assert str(request_user.id) == str(user.id)
+
+    def test_캐시되면_DB_조회_없음(self, user):
+        authentication._local.clear()
+        _authenticate(user)
+
+        with CaptureQueriesContext(connection) as ctx:
+            _authenticate(user)
+
+        assert ctx.captured_queries == []
+
+    def test_Redis_값_사용(self, user, _fresh_local_cache):
+        authentication._local.clear()
+        _fresh_local_cache.get.return_value = 1
+
+        with CaptureQueriesContext(connection) as ctx:
+            _authenticate(user)
+
+        assert ctx.captured_queries == []
+        _fresh_local_cache.get.assert_called_with(f"auth:active:{user.id}")
+
+    def test_비활성화하면_즉시_거부(self, user, _fresh_local_cache):
+        _authenticate(user)
+
+        user.is_active = False
+        user.save()
+
+        _fresh_local_cache.set.assert_called_with(
+            f"auth:active:{user.id}", 0, timeout=300
+        )
+        with pytest.raises(AuthenticationFailed):
+            _authenticate(user)
+
+    def test_삭제된_사용자_거부(self, user):
+        token = AccessToken.for_user(user)
+        user.delete()
+
+        with pytest.raises(AuthenticationFailed):
+            CachedJWTAuthentication().get_user(token)
@@ -0,0 +1,157 @@
+"""
+test_budget.py — 예산 + 지출 누계 증분 갱신 테스트 (DB 사용, Redis Mock)
+
+실행: pytest tests/test_budget.py -v
+"""
+
+from unittest.mock import patch
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+
+from ledger.models import Budget, CategoryMonthTotal
+from ledger.services.budget import list_budgets, set_budget
+from ledger.services.orchestrator import _created_reply
+from ledger.services.transaction_command import TransactionCommandService
+
+
+def _spent(user, month="2026-02", category="식비"):
+    return CategoryMonthTotal.objects.get(
+        user_id=str(user.id), month=month, category=category
+    ).spent
+
+
+@pytest.fixture
+def no_redis():
+    with patch("ledger.services.transaction_command.log_audit"), patch(
+        "ledger.services.transaction_command.get_cached_tx_id", return_value=None
+    ):
+        yield
+
+
+def _create(user, amount, category="식비", tx_type="expense", day="2026-02-13"):
+    return TransactionCommandService.create_transaction(
+        user_id=str(user.id),
+        args={
+            "occurred_date": day,
+            "type": tx_type,
+            "amount": str(amount),
+            "category": category,
+        },
+    )
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("no_redis")
+class TestRunningTotals:
+    def test_생성시_누계_증가와_잔액(self, user):
+        set_budget(str(user.id), "2026-02", "식비", 300000)
+
+        _create(user, 8000)
+        result = _create(user, 12000)
+
+        assert _spent(user) == 20000
+        assert result["budget"] == {
+            "month": "2026-02",
+            "category": "식비",
+            "budget": 300000,
+            "spent": 20000,
+            "remaining": 280000,
+        }
+
+    def test_잔액_계산에_월_집계_쿼리_없음(self, user):
+        set_budget(str(user.id), "2026-02", "식비", 300000)
+        _create(user, 8000)
+
+        with CaptureQueriesContext(connection) as ctx:
+            _create(user, 12000)
+
+        sqls = [q["sql"].upper() for q in ctx.captured_queries]
+        assert not any("SUM(" in sql for sql in sqls)
+
+    def test_수입은_누계_제외_예산없으면_None(self, user):
+        result = _create(user, 100000, category="급여", tx_type="income")
+
+        assert result["budget"] is None
+        assert not CategoryMonthTotal.objects.filter(user_id=str(user.id)).exists()
+
+    def test_취소와_삭제시_누계_차감(self, user):
+        first = _create(user, 8000)
+        _create(user, 12000)
+        _create(user, 5000)
+
+        with patch(
+            "ledger.services.transaction_command.pop_undo_group",
+            return_value={"ops": [{"op": "create", "tx_id": first["tx_id"]}]},
+        ):
+            TransactionCommandService.undo_transaction(str(user.id))
+        assert _spent(user) == 17000
+
+        TransactionCommandService.delete_transaction_by_query(
+            str(user.id), None, 12000, category="식비"
+        )
+        assert _spent(user) == 5000
+
+        tx_ids = [_create(user, 3000)["tx_id"], _create(user, 2000)["tx_id"]]
+        assert _spent(user) == 10000
+        TransactionCommandService.delete_transactions_by_ids(str(user.id), tx_ids)
+        assert _spent(user) == 5000
+
+
+@pytest.mark.django_db
+class TestBudget:
+    def test_예산_갱신과_월별_목록(self, user):
+        uid = str(user.id)
+        set_budget(uid, "2026-02", "식비", 200000)
+        set_budget(uid, "2026-02", "식비", 300000)
+        set_budget(uid, "2026-02", "교통", 50000)
+        CategoryMonthTotal.objects.create(
+            user_id=uid, month="2026-02", category="교통", spent=62000
+        )
+
+        assert Budget.objects.filter(user_id=uid).count() == 2
+        assert list_budgets(uid, "2026-02") == [
+            {
+                "month": "2026-02",
+                "category": "교통",
+                "budget": 50000,
+                "spent": 62000,
+                "remaining": -12000,
+            },
+            {
+                "month": "2026-02",
+                "category": "식비",
+                "budget": 300000,
+                "spent": 0,
+                "remaining": 300000,
+            },
+        ]
+
+    def test_에이전트_응답에_잔액_포함(self):
+        reply = _created_reply(
+            [{}],
+            {
+                "occurred_date": "2026-02-13",
+                "category": "식비",
+                "subcategory": "식사",
+                "amount": 8000,
+                "budget": {
+                    "month": "2026-02",
+                    "category": "식비",
+                    "budget": 300000,
+                    "spent": 20000,
+                    "remaining": 280000,
+                },
+            },
+        )
+        assert reply.endswith("2026-02 식비 예산이 280,000원 남았어요.")
+
+    def test_예산_설정_API_검증(self, api_client):
+        response = api_client.post(
+            "/api/v1/budgets/",
+            {"month": "2026/02", "category": "식비", "amount": 300000},
+            format="json",
+        )
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
@@ -0,0 +1,157 @@
+"""
+test_chat_jobs.py — Chat 비동기 작업 큐 테스트 (Redis / LLM Mock)
+
+실행: pytest tests/test_chat_jobs.py -v
+"""
+
+import json
+from unittest.mock import MagicMock, patch
+
+from ledger.services.chat_jobs import (
+    JOB_QUEUE_KEY,
+    PROCESSING_KEY,
+    build_chat_payload,
+    enqueue_chat_job,
+    get_chat_job,
+    reap_stale_jobs,
+    run_next_chat_job,
+)
+
+
+def _fake_redis(job_fields=None):
+    redis = MagicMock()
+    redis.blmove.return_value = b"job-1"
+    redis.hmget.return_value = job_fields or [b"1", "점심 8000원".encode(), b"groq"]
+    return redis
+
+
+class TestBuildChatPayload:
+    def test_마지막_생성건의_토큰만_반환(self):
+        payload = build_chat_payload(
+            {
+                "reply": "저장했어요",
+                "created_txs": [
+                    {"tx_id": "a", "undo_token": "ua"},
+                    {"tx_id": "b", "undo_token": "ub"},
+                ],
+            }
+        )
+        assert payload["tx_id"] == "b"
+        assert payload["undo_token"] == "ub"
+
+    def test_메시지_그룹_토큰_우선(self):
+        # 삭제만 한 메시지도 그룹 토큰으로 되돌릴 수 있음
+        payload = build_chat_payload(
+            {"reply": "삭제했어요", "created_txs": [], "undo_token": "group-1"}
+        )
+        assert payload["tx_id"] is None
+        assert payload["undo_token"] == "group-1"
+
+    def test_생성건_없으면_None(self):
+        payload = build_chat_payload({"reply": "없어요", "created_txs": []})
+        assert payload["tx_id"] is None and payload["undo_token"] is None
+
+
+class TestEnqueueAndStatus:
+    @patch("ledger.services.chat_jobs.get_redis_connection")
+    def test_큐에_넣고_job_id_반환(self, mock_conn):
+        pipe = mock_conn.return_value.pipeline.return_value
+        job_id = enqueue_chat_job("1", "점심 8000원", None)
+
+        pipe.lpush.assert_called_once_with(JOB_QUEUE_KEY, job_id)
+        mapping = pipe.hset.call_args.kwargs["mapping"]
+        assert mapping["status"] == "queued"
+        assert mapping["llm_provider"] == "groq"
+
+    @patch("ledger.services.chat_jobs.get_redis_connection")
+    def test_다른_사용자의_작업은_조회_불가(self, mock_conn):
+        mock_conn.return_value.hgetall.return_value = {
+            b"status": b"queued",
+            b"user_id": b"1",
+        }
+        assert get_chat_job("job-1", "2") is None
+        assert get_chat_job("job-1", "1")["status"] == "queued"
+
+
+class TestRunNextChatJob:
+    @patch("ledger.services.orchestrator.run_agent_loop")
+    @patch("ledger.services.chat_jobs.get_redis_connection")
+    def test_실행_후_결과_저장과_슬롯_반환(self, mock_conn, mock_loop):
+        redis = _fake_redis()
+        redis.eval.return_value = 1
+        mock_conn.return_value = redis
+        mock_loop.return_value = {
+            "reply": "저장했어요",
+            "created_txs": [{"tx_id": "a", "undo_token": "ua"}],
+        }
+
+        assert run_next_chat_job(timeout=1) is True
+
+        mock_loop.assert_called_once_with("1", "점심 8000원", provider_override="groq")
+        mapping = redis.hset.call_args.kwargs["mapping"]
+        assert mapping["status"] == "done"
+        assert json.loads(mapping["result"])["tx_id"] == "a"
+        redis.zrem.assert_called_once_with("chatjobs:running:groq", "job-1")
+        redis.blmove.assert_called_once_with(
+            JOB_QUEUE_KEY, PROCESSING_KEY, 1, "RIGHT", "LEFT"
+        )
+        redis.lrem.assert_called_once_with(PROCESSING_KEY, 0, "job-1")
+
+    @patch("ledger.services.chat_jobs.time.sleep")
+    @patch("ledger.services.orchestrator.run_agent_loop")
+    @patch("ledger.services.chat_jobs.get_redis_connection")
+    def test_프로바이더_슬롯_가득이면_재대기(self, mock_conn, mock_loop, mock_sleep):
+        redis = _fake_redis()
+        redis.eval.return_value = 0
+        mock_conn.return_value = redis
+
+        assert run_next_chat_job(timeout=1) is True
+
+        mock_loop.assert_not_called()
+        # 꺼내는 쪽(오른쪽)이 아닌 왼쪽으로 되돌려야 다른 프로바이더 작업이 먼저 실행됨
+        pipe = redis.pipeline.return_value
+        pipe.lpush.assert_called_once_with(JOB_QUEUE_KEY, "job-1")
+        pipe.lrem.assert_called_once_with(PROCESSING_KEY, 0, "job-1")
+        redis.rpush.assert_not_called()
+
+    @patch(
+        "ledger.services.orchestrator.run_agent_loop",
+        side_effect=RuntimeError("timeout"),
+    )
+    @patch("ledger.services.chat_jobs.get_redis_connection")
+    def test_에이전트_오류는_failed(self, mock_conn, mock_loop):
+        redis = _fake_redis()
+        redis.eval.return_value = 1
+        mock_conn.return_value = redis
+
+        run_next_chat_job(timeout=1)
+
+        mapping = redis.hset.call_args.kwargs["mapping"]
+        assert mapping["status"] == "failed"
+        assert "timeout" in mapping["detail"]
+        redis.zrem.assert_called_once()
+
+    @patch("ledger.services.chat_jobs.get_redis_connection")
+    def test_큐가_비면_False(self, mock_conn):
+        mock_conn.return_value.blmove.return_value = None
+        assert run_next_chat_job(timeout=1) is False
+
+
+class TestReapStaleJobs:
+    @patch("ledger.services.chat_jobs.get_redis_connection")
+    def test_처리중_작업마다_점검하고_결과_집계(self, mock_conn):
+        redis = mock_conn.return_value
+        redis.lrange.return_value = [b"job-1", b"job-2", b"job-3"]
+        redis.eval.side_effect = [b"requeued", b"failed", b"alive"]
+
+        counts = reap_stale_jobs()
+
+        assert counts == {"requeued": 1, "failed": 1, "alive": 1}
+        keys = [c.args[2:5] for c in redis.eval.call_args_list]
+        assert keys[0] == (PROCESSING_KEY, JOB_QUEUE_KEY, "chatjob:job-1")
+
+    @patch("ledger.services.chat_jobs.get_redis_connection")
+    def test_처리중_리스트가_비면_아무것도_안함(self, mock_conn):
+        mock_conn.return_value.lrange.return_value = []
+        assert reap_stale_jobs() == {}
+        mock_conn.return_value.eval.assert_not_called()
@@ -0,0 +1,49 @@
+"""
+test_db_router.py — primary/replica 라우팅 테스트 (Redis Mock)
+
+실행: pytest tests/test_db_router.py -v
+"""
+
+from unittest.mock import patch
+
+from core.db_router import (
+    PrimaryReplicaRouter,
+    mark_recent_write,
+    read_db_for,
+)
+from ledger.models import Transaction
+
+
+class TestReadDbFor:
+    def test_replica_미설정이면_primary(self):
+        """DATABASE_REPLICA_URL이 없으면 항상 default, 캐시도 조회하지 않음."""
+        with patch("core.db_router.cache") as mock_cache:
+            assert read_db_for("1") == "default"
+            mark_recent_write("1")
+        mock_cache.get.assert_not_called()
+        mock_cache.set.assert_not_called()
+
+    @patch("core.db_router.replica_enabled", return_value=True)
+    @patch("core.db_router.cache")
+    def test_최근_쓰기_없으면_replica(self, mock_cache, mock_enabled):
+        mock_cache.get.return_value = None
+        assert read_db_for("1") == "replica"
+
+    @patch("core.db_router.replica_enabled", return_value=True)
+    @patch("core.db_router.cache")
+    def test_최근_쓰기_직후는_primary(self, mock_cache, mock_enabled):
+        """쓰기 직후 sticky 키가 있으면 primary에서 읽어야 합니다."""
+        mark_recent_write("1")
+        key, _ = mock_cache.set.call_args.args
+        mock_cache.get.side_effect = lambda k: 1 if k == key else None
+
+        assert read_db_for("1") == "default"
+        assert read_db_for("2") == "replica"
+
+
+class TestPrimaryReplicaRouter:
+    def test_쓰기와_마이그레이션은_primary만(self):
+        router = PrimaryReplicaRouter()
+        assert router.db_for_write(Transaction) == "default"
+        assert router.allow_migrate("default", "ledger") is True
+        assert router.allow_migrate("replica", "ledger") is False
@@ -0,0 +1,45 @@
+"""
+test_ids.py — UUIDv7 생성기 테스트
+
+실행: pytest tests/test_ids.py -v
+"""
+
+import time
+
+import pytest
+
+from core.ids import uuid7, uuid7_time
+from ledger.models import AuditLog, Transaction
+
+
+def test_버전과_변형_비트():
+    value = uuid7()
+    assert value.version == 7
+    assert value.variant == "specified in RFC 4122"
+
+
+def test_프로세스_내_단조_증가와_유일성():
+    values = [uuid7() for _ in range(20_000)]  # 같은 ms 안의 seq 증가 포함
+    assert values == sorted(values)
+    assert len(set(values)) == len(values)
+
+
+def test_타임스탬프():
+    before = time.time()
+    value = uuid7()
+    assert before - 0.01 <= uuid7_time(value) <= time.time() + 0.01
+
+
+@pytest.mark.django_db
+def test_새_거래와_감사로그는_v7(user):
+    tx = Transaction.objects.create(
+        user_id=str(user.id),
+        occurred_date="2026-02-13",
+        type="expense",
+        amount=8000,
+        category="식비",
+    )
+    log = AuditLog.objects.create(user_id=str(user.id), action="create", tx=tx)
+
+    assert tx.tx_id.version == 7
+    assert log.event_id.version == 7
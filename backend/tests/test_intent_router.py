@@ -0,0 +1,141 @@
+"""
+test_intent_router.py — 규칙 기반 사전 라우팅 테스트 (DB 사용, Redis / LLM Mock)
+
+실행: pytest tests/test_intent_router.py -v
+"""
+
+import json
+from datetime import date
+from unittest.mock import patch
+
+import pytest
+
+from ledger.models import Transaction
+from ledger.services.intent_router import parse_message, route_intent, router_stats
+from ledger.services.orchestrator import run_agent_loop
+
+TODAY = date(2026, 2, 13)
+
+
+class TestParseMessage:
+    def test_오늘_내역_삭제(self):
+        parsed = parse_message("오늘 내역 삭제해줘", today=TODAY)
+        assert parsed["intent"] == "delete"
+        assert parsed["from_date"] == parsed["to_date"] == TODAY
+
+    def test_금액만으로_삭제(self):
+        parsed = parse_message("2.3만원 지워줘", today=TODAY)
+        assert parsed["intent"] == "delete"
+        assert parsed["amount"] == 23000
+        assert parsed["from_date"] is None
+
+    def test_이번_달_요약(self):
+        parsed = parse_message("이번 달 얼마 썼어?", today=TODAY)
+        assert parsed["intent"] == "summary"
+        assert parsed["month"] == "2026-02"
+        assert parsed["to_date"] == date(2026, 2, 28)
+
+    def test_지난달_카테고리_조회(self):
+        parsed = parse_message("지난달 카페 내역 보여줘", today=TODAY)
+        assert parsed["intent"] == "search"
+        assert parsed["month"] == "2026-01"
+        assert parsed["category"] == "식비"
+
+    @pytest.mark.parametrize(
+        "message",
+        [
+            "스타벅스 내역 삭제해줘",  # 가맹점명은 LLM이 판단
+            "점심 김치찌개 8000원",  # 의도 키워드 없음 (생성)
+            "오늘 내역 보여주고 삭제해줘",  # 의도 두 가지
+            "어제랑 오늘 내역 삭제해줘",  # 날짜 두 개
+        ],
+    )
+    def test_모호하면_None(self, message):
+        assert parse_message(message, today=TODAY) is None
+
+
+@pytest.mark.django_db
+class TestRouteIntent:
+    @patch("ledger.services.transaction_command.log_audit")
+    def test_날짜_삭제는_LLM_없이_처리(self, mock_audit, user, multiple_transactions):
+        result = route_intent(str(user.id), "2026-02-10 내역 삭제해줘")
+
+        assert result["stop_reason"] == "pre_router"
+        assert result["llm_calls"] == 0
+        assert result["deleted_count"] == 1
+        assert not Transaction.objects.filter(occurred_date=date(2026, 2, 10)).exists()
+
+    @patch("ledger.services.transaction_command.log_audit")
+    def test_금액만으로_여러건이면_LLM에_위임(
+        self, mock_audit, user, multiple_transactions
+    ):
+        Transaction.objects.create(
+            user_id=str(user.id),
+            occurred_date=date(2026, 2, 1),
+            type="expense",
+            amount=5000,
+            category="식비",
+        )
+
+        assert route_intent(str(user.id), "5000원 삭제") is None
+        assert Transaction.objects.filter(amount=5000).count() == 2
+
+    @patch("ledger.services.transaction_command.log_audit_bulk")
+    @patch("ledger.services.intent_router.get_redis_connection")
+    def test_여러건_삭제는_확인_후_전부_삭제(self, mock_conn, mock_audit, user):
+        # search 결과 상한(10건)보다 많아도 전부 삭제 대상
+        Transaction.objects.bulk_create(
+            Transaction(
+                user_id=str(user.id),
+                occurred_date=date(2026, 2, 20),
+                type="expense",
+                amount=1000 * (i + 1),
+                category="식비",
+            )
+            for i in range(12)
+        )
+        redis = mock_conn.return_value
+
+        result = route_intent(str(user.id), "2026-02-20 내역 삭제해줘")
+
+        assert result["deleted_count"] == 0
+        assert "12건이 삭제 대상" in result["reply"] and "외 2건" in result["reply"]
+        assert Transaction.objects.filter(occurred_date=date(2026, 2, 20)).count() == 12
+        pending = redis.set.call_args.args[1]
+        assert len(json.loads(pending)) == 12
+
+        redis.getdel.return_value = pending.encode()
+        result = route_intent(str(user.id), "삭제 확인")
+
+        assert result["deleted_count"] == 12
+        assert not Transaction.objects.filter(occurred_date=date(2026, 2, 20)).exists()
+
+    @patch("ledger.services.intent_router.get_redis_connection")
+    def test_대기중인_삭제가_없으면_확인해도_삭제_안함(
+        self, mock_conn, user, multiple_transactions
+    ):
+        mock_conn.return_value.getdel.return_value = None
+
+        result = route_intent(str(user.id), "삭제 확인")
+
+        assert result["deleted_count"] == 0
+        assert Transaction.objects.count() == 4
+
+    def test_기간_요약(self, user, multiple_transactions):
+        result = route_intent(str(user.id), "2026-02-12 얼마 썼어?")
+        assert "30,000원" in result["reply"]
+
+    def test_적중률_집계(self, user, multiple_transactions):
+        route_intent(str(user.id), "2026-02-11 교통 내역 보여줘")
+        route_intent(str(user.id), "스타벅스 내역 보여줘")
+
+        stats = router_stats()
+        assert stats["search"]["hits"] >= 1
+        assert stats["unknown"]["fallbacks"] >= 1
+
+    @patch("ledger.services.orchestrator.chat_completion")
+    def test_run_agent_loop_앞단에서_처리(self, mock_llm, user, multiple_transactions):
+        result = run_agent_loop(str(user.id), "2026-02-11 내역 보여줘")
+
+        mock_llm.assert_not_called()
+        assert "1건을 찾았어요" in result["reply"]
@@ -0,0 +1,209 @@
+"""
+test_llm_client.py — 프로바이더별 요청 템플릿 캐시 테스트 (LLM API Mock)
+
+실행: pytest tests/test_llm_client.py -v
+"""
+
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+from django.test import override_settings
+from google.genai import types
+
+from ledger.models import Transaction
+from ledger.services import llm_client
+from ledger.services.llm_client import (
+    _gemini_contents,
+    chat_completion,
+    get_request_template,
+)
+from ledger.services.orchestrator import (
+    TOOLS,
+    _render_system_prompt,
+    _system_prompt,
+    run_agent_loop,
+)
+
+
+def _openai_response(content="완료"):
+    message = SimpleNamespace(content=content, tool_calls=None)
+    return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+
+class TestRequestTemplate:
+    def test_같은_도구목록은_한번만_컴파일(self):
+        first = get_request_template("openai", TOOLS)
+        second = get_request_template("openai", TOOLS)
+        assert first is second
+        assert first.tools[0]["function"]["name"] == "create_transaction"
+
+    def test_다른_도구목록은_별도_템플릿(self):
+        custom = [{"name": "ping", "parameters": {"type": "object"}}]
+        assert get_request_template("openai", custom) is not get_request_template(
+            "openai", TOOLS
+        )
+
+    def test_gemini_템플릿은_config_포함(self):
+        template = get_request_template("gemini", TOOLS)
+        assert template.config is not None
+        assert template.config.temperature == 0
+        assert get_request_template("gemini", TOOLS) is template
+
+    @override_settings(LLM_PROVIDER="groq", GROQ_API_KEY="test-key")
+    @patch("ledger.services.llm_client._compile_template")
+    @patch("ledger.services.llm_client._openai_client")
+    def test_매_턴_재변환하지_않음(self, mock_client, mock_compile):
+        mock_compile.side_effect = lambda style, tools: llm_client.RequestTemplate(
+            style=style, tools=[{"type": "function"}]
+        )
+        mock_client.return_value.chat.completions.create.return_value = (
+            _openai_response()
+        )
+        tools = [{"name": "ping"}]
+
+        for _ in range(3):
+            chat_completion([{"role": "user", "content": "hi"}], tools=tools)
+
+        assert mock_compile.call_count == 1
+        sent = mock_client.return_value.chat.completions.create.call_args.kwargs
+        assert sent["tools"] == [{"type": "function"}]
+
+
+def _gemini_response(*parts):
+    return SimpleNamespace(
+        candidates=[
+            SimpleNamespace(content=types.Content(role="model", parts=list(parts)))
+        ],
+        usage_metadata=SimpleNamespace(total_token_count=100),
+    )
+
+
+class ScriptedGemini:
+    """
+    로컬 Gemini 대역 — 매 호출마다 받은 contents만 보고 다음 행동을 정함.
+    검색 결과(function_response)가 안 보이면 다시 검색하므로
+    기록이 빠지면 실제 모델처럼 AGENT_MAX_TURNS까지 반복합니다.
+    """
+
+    def __init__(self):
+        self.models = self
+        self.calls = []
+
+    def generate_content(self, model, contents, config):
+        self.calls.append((contents, config))
+        results = [
+            part.function_response.response["result"]
+            for content in contents
+            for part in content.parts
+            if part.function_response
+        ]
+        if not results:
+            return _gemini_response(
+                types.Part.from_function_call(
+                    name="search_transactions",
+                    args={"start_date": "2026-02-12", "end_date": "2026-02-12"},
+                )
+            )
+        return _gemini_response(
+            types.Part.from_function_call(
+                name="delete_transactions",
+                args={"tx_ids": [row["tx_id"] for row in results[-1]]},
+            )
+        )
+
+
+class TestGeminiContents:
+    def test_도구_턴은_네이티브_파트로(self):
+        system, contents = _gemini_contents(
+            [
+                {"role": "system", "content": "시스템"},
+                {"role": "user", "content": "커피 지워줘"},
+                {
+                    "role": "assistant",
+                    "content": "search_transactions({})",
+                    "function_call": {
+                        "name": "search_transactions",
+                        "args": {"keyword": "커피"},
+                        "thought_signature": b"sig",
+                    },
+                },
+                {
+                    "role": "user",
+                    "content": "Tool Result ...",
+                    "function_response": {
+                        "name": "search_transactions",
+                        "response": [{"tx_id": "tx-1"}],
+                    },
+                    "hint": "삭제 요청이면",
+                },
+            ]
+        )
+
+        assert system == "시스템"
+        assert [c.role for c in contents] == ["user", "model", "user"]
+        call = contents[1].parts[0]
+        assert call.function_call.args == {"keyword": "커피"}
+        assert call.thought_signature == b"sig"
+        response, hint = contents[2].parts
+        assert response.function_response.response == {"result": [{"tx_id": "tx-1"}]}
+        assert hint.text == "삭제 요청이면"
+
+    @override_settings(GEMINI_API_KEY="test-key")
+    @patch("ledger.services.llm_client._gemini_client")
+    def test_사고_파트와_서명_처리(self, mock_client):
+        call = types.Part.from_function_call(name="get_summary", args={})
+        call.thought_signature = b"sig"
+        mock_client.return_value.models.generate_content.return_value = (
+            _gemini_response(types.Part(text="생각 중", thought=True), call)
+        )
+
+        result = chat_completion(
+            [{"role": "user", "content": "이번 달 얼마"}],
+            tools=TOOLS,
+            provider_override="gemini",
+        )
+
+        assert result["content"] is None
+        assert result["function_call"] == {
+            "name": "get_summary",
+            "args": {},
+            "thought_signature": b"sig",
+        }
+        assert result["total_tokens"] == 100
+
+    @pytest.mark.django_db
+    @override_settings(
+        GEMINI_API_KEY="test-key",
+        AGENT_PRE_ROUTER=False,
+        AGENT_RECENT_CONTEXT_ROWS=0,
+    )
+    @patch("ledger.services.llm_client._gemini_client")
+    def test_검색_후_삭제를_두_턴에_끝냄(
+        self, mock_client, user, multiple_transactions
+    ):
+        gemini = ScriptedGemini()
+        mock_client.return_value = gemini
+
+        result = run_agent_loop(str(user.id), "어제 쇼핑 지워줘", "gemini")
+
+        assert result["llm_calls"] == 2
+        assert result["deleted_count"] == 1
+        assert not Transaction.objects.filter(
+            tx_id=multiple_transactions[2].tx_id
+        ).exists()
+        contents, config = gemini.calls[-1]
+        assert "가계부" in config.system_instruction
+        assert [c.role for c in contents] == ["user", "model", "user"]
+
+
+class TestSystemPrompt:
+    def test_날짜별로_캐시(self):
+        _render_system_prompt.cache_clear()
+        _system_prompt()
+        _system_prompt()
+        assert _render_system_prompt.cache_info().hits == 1
+
+    def test_날짜가_바뀌면_다시_렌더링(self):
+        assert "2026-02-13" in _render_system_prompt("2026-02-13")
+        assert "2026-02-14" in _render_system_prompt("2026-02-14")
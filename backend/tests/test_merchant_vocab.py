@@ -0,0 +1,179 @@
+"""
+test_merchant_vocab.py — 가맹점 어휘 퍼지 매칭 테스트 (Redis Mock)
+
+실행: pytest tests/test_merchant_vocab.py -v
+"""
+
+from datetime import date
+from unittest.mock import patch
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from ledger.models import Transaction
+from ledger.services import merchant_vocab
+from ledger.services.merchant_vocab import (
+    MerchantIndex,
+    add_merchant,
+    expand_merchant_keyword,
+    rebuild_vocabulary,
+)
+from ledger.services.transaction_command import TransactionCommandService
+from ledger.services.transaction_query import TransactionQueryService
+
+NAMES = [
+    "스타벅스",
+    "스타벅스 강남점",
+    "투썸플레이스",
+    "이디야커피",
+    "맥도날드",
+    "버거킹",
+]
+
+
+class TestMerchantIndex:
+    @pytest.mark.parametrize(
+        "keyword, expected",
+        [
+            ("스벅", "스타벅스"),  # 약어
+            ("맥날", "맥도날드"),
+            ("투썸", "투썸플레이스"),
+            ("스타벅수", "스타벅스"),  # 오타
+            ("버커킹", "버거킹"),
+            ("이디아 커피", "이디야커피"),  # 공백 무시
+        ],
+    )
+    def test_약어와_오타(self, keyword, expected):
+        assert MerchantIndex(NAMES).match(keyword)[0] == expected
+
+    def test_없는_이름은_빈_목록(self):
+        assert MerchantIndex(NAMES).match("김밥천국") == []
+
+    def test_증분_추가(self):
+        index = MerchantIndex(NAMES)
+        assert index.add("김밥천국") is True
+        assert index.add("김밥천국") is False
+        assert index.match("김천") == ["김밥천국"]
+
+
+@pytest.fixture(autouse=True)
+def _clear_indexes():
+    merchant_vocab._INDEXES.clear()
+    yield
+    merchant_vocab._INDEXES.clear()
+
+
+class TestVocabularyStore:
+    @patch("ledger.services.merchant_vocab.get_redis_connection")
+    def test_버전이_같으면_인덱스_재사용(self, mock_conn):
+        redis = mock_conn.return_value
+        redis.get.return_value = b"3"
+        redis.smembers.return_value = {n.encode() for n in NAMES}
+
+        assert expand_merchant_keyword("1", "스벅")[0] == "스타벅스"
+        assert expand_merchant_keyword("1", "맥날") == ["맥도날드"]
+        redis.smembers.assert_called_once()
+
+    @patch("ledger.services.merchant_vocab.get_redis_connection")
+    def test_새_가맹점은_재구성_없이_반영(self, mock_conn):
+        redis = mock_conn.return_value
+        redis.get.return_value = b"3"
+        redis.smembers.return_value = {n.encode() for n in NAMES}
+        expand_merchant_keyword("1", "스벅")
+
+        redis.eval.return_value = 4
+        add_merchant("1", "김밥천국")
+        redis.get.return_value = b"4"
+
+        assert expand_merchant_keyword("1", "김천") == ["김밥천국"]
+        redis.smembers.assert_called_once()
+
+    @pytest.mark.django_db
+    @patch("ledger.services.merchant_vocab.get_redis_connection")
+    def test_재구성은_가맹점당_한_행만_읽음(self, mock_conn, user):
+        for day in (10, 11, 12):
+            Transaction.objects.create(
+                user_id=str(user.id),
+                occurred_date=date(2026, 2, day),
+                type="expense",
+                amount=5600,
+                category="식비",
+                merchant="스타벅스",
+            )
+
+        with CaptureQueriesContext(connection) as ctx:
+            rebuild_vocabulary(str(user.id))
+
+        assert "ORDER BY" not in ctx.captured_queries[0]["sql"]
+        pipe = mock_conn.return_value.pipeline.return_value
+        pipe.sadd.assert_called_once_with(f"merchant_vocab:{user.id}", "스타벅스")
+
+    @patch("ledger.services.merchant_vocab.get_redis_connection")
+    def test_Redis_장애시_확장_없음(self, mock_conn):
+        mock_conn.return_value.get.side_effect = RedisConnectionError()
+        assert expand_merchant_keyword("1", "스벅") == []
+
+
+@pytest.mark.django_db
+class TestSearchWithVocabulary:
+    @patch(
+        "ledger.services.transaction_query.expand_merchant_keyword",
+        return_value=["스타벅스 강남점"],
+    )
+    def test_약어로_검색(self, mock_expand, user):
+        Transaction.objects.create(
+            user_id=str(user.id),
+            occurred_date=date(2026, 2, 13),
+            type="expense",
+            amount=5600,
+            category="식비",
+            merchant="스타벅스 강남점",
+        )
+
+        rows = TransactionQueryService.search_transactions(str(user.id), keyword="스벅")
+
+        assert [r["merchant"] for r in rows] == ["스타벅스 강남점"]
+        mock_expand.assert_called_once_with(str(user.id), "스벅")
+
+
+@pytest.mark.django_db
+@patch(
+    "ledger.services.transaction_command.expand_merchant_keyword",
+    return_value=["스타벅스 강남점"],
+)
+class TestDeleteWithVocabulary:
+    def _create(self, user):
+        return Transaction.objects.create(
+            user_id=str(user.id),
+            occurred_date=date(2026, 2, 13),
+            type="expense",
+            amount=5600,
+            category="식비",
+            merchant="스타벅스 강남점",
+        )
+
+    def test_퍼지_후보로는_삭제하지_않음(self, mock_expand, user):
+        tx = self._create(user)
+
+        result = TransactionCommandService.delete_transaction_by_query(
+            str(user.id), date(2026, 2, 13), 5600, merchant="스벅"
+        )
+
+        assert result["success"] is False
+        assert result["candidates"] == ["스타벅스 강남점"]
+        assert Transaction.objects.filter(tx_id=tx.tx_id).exists()
+
+    @patch("ledger.services.transaction_command.record_undo")
+    @patch("ledger.services.transaction_command.log_audit")
+    def test_확인한_가맹점명으로는_삭제(self, mock_audit, mock_undo, mock_expand, user):
+        tx = self._create(user)
+
+        result = TransactionCommandService.delete_transaction_by_query(
+            str(user.id), date(2026, 2, 13), 5600, merchant="스타벅스"
+        )
+
+        assert result["success"] is True
+        assert not Transaction.objects.filter(tx_id=tx.tx_id).exists()
+        mock_expand.assert_not_called()
@@ -0,0 +1,323 @@
+"""
+test_orchestrator.py — Agent 루프 턴 계획/예산 테스트 (LLM · 서비스 Mock)
+
+실행: pytest tests/test_orchestrator.py -v
+"""
+
+from datetime import date
+from unittest.mock import patch
+
+import pytest
+from django.test import override_settings
+
+from ledger.models import Transaction
+from ledger.services.orchestrator import (
+    _AMOUNT_MENTION_RE,
+    _execute_tool,
+    _parse_text_tool_call,
+    _recent_context,
+    agent_stats,
+    run_agent_loop,
+)
+
+TX_ID = "0195f3a2-7c1e-7d40-8a3b-2f6c9e1d4b57"
+
+CREATE_RESULT = {
+    "tx_id": "tx-1",
+    "cached": False,
+    "undo_token": "undo-1",
+    "occurred_date": "2026-02-13",
+    "type": "expense",
+    "amount": 8000,
+    "category": "식비",
+    "subcategory": "식사",
+}
+
+
+@pytest.fixture(autouse=True)
+def _llm_only(settings):
+    # 규칙 기반 사전 라우팅은 test_intent_router.py에서 검증
+    settings.AGENT_PRE_ROUTER = False
+    # 최근 거래 표는 TestRecentContext에서 검증 (DB 사용)
+    settings.AGENT_RECENT_CONTEXT_ROWS = 0
+
+
+def _call(name, **args):
+    return {"content": None, "function_call": {"name": name, "args": args}}
+
+
+def _text(content):
+    return {"content": content, "function_call": None}
+
+
+@patch("ledger.services.orchestrator.TransactionCommandService")
+@patch("ledger.services.orchestrator.chat_completion")
+class TestTurnPlanner:
+    def test_생성_성공하면_LLM_재호출_없이_종료(self, mock_llm, mock_cmd):
+        mock_llm.return_value = _call(
+            "create_transaction", amount=8000, type="expense", category="식비"
+        )
+        mock_cmd.create_transaction.return_value = CREATE_RESULT
+
+        result = run_agent_loop("1", "점심 김치찌개 8000원")
+
+        assert mock_llm.call_count == 1
+        assert result["llm_calls"] == 1
+        assert result["stop_reason"] == "terminal_tool"
+        assert "8,000원" in result["reply"]
+        assert result["created_txs"] == [{"tx_id": "tx-1", "undo_token": "undo-1"}]
+
+    def test_금액이_여러_개면_계속_생성(self, mock_llm, mock_cmd):
+        mock_llm.side_effect = [
+            _call("create_transaction", amount=8000),
+            _call("create_transaction", amount=4500),
+        ]
+        mock_cmd.create_transaction.side_effect = [
+            CREATE_RESULT,
+            dict(CREATE_RESULT, tx_id="tx-2", undo_token="undo-2"),
+        ]
+
+        result = run_agent_loop("1", "점심 8000원, 커피 4500원")
+
+        assert mock_llm.call_count == 2
+        assert result["reply"] == "2건의 거래를 저장했어요."
+
+    @patch("ledger.services.orchestrator.TransactionQueryService")
+    def test_검색_후_삭제는_두_번으로_끝남(self, mock_query, mock_llm, mock_cmd):
+        mock_llm.side_effect = [
+            _call("search_transactions", start_date="2026-02-13"),
+            _call("delete_transactions", tx_ids=[TX_ID]),
+        ]
+        mock_query.search_transactions.return_value = [{"tx_id": TX_ID}]
+        mock_cmd.delete_transactions_by_ids.return_value = {
+            "success": True,
+            "message": "1건의 내역을 삭제했습니다.",
+        }
+
+        result = run_agent_loop("1", "오늘 내역 삭제해줘")
+
+        assert mock_llm.call_count == 2
+        assert result["deleted_count"] == 1
+        assert result["reply"] == "1건의 내역을 삭제했습니다."
+        # 검색 결과에는 하드코딩된 삭제 지시가 아니라 상황별 힌트가 붙음
+        follow_up = mock_llm.call_args.args[0][-1]["content"]
+        assert "조회 요청이면" in follow_up
+
+    def test_모르는_핸들이나_지어낸_ID는_삭제하지_않음(self, mock_llm, mock_cmd):
+        mock_llm.side_effect = [
+            _call("delete_transactions", tx_ids=["r25", "tx-1"]),
+            _text("삭제할 내역을 찾지 못했어요."),
+        ]
+
+        result = run_agent_loop("1", "그거 지워줘")
+
+        mock_cmd.delete_transactions_by_ids.assert_not_called()
+        assert mock_llm.call_count == 2
+        assert result["reply"] == "삭제할 내역을 찾지 못했어요."
+
+    def test_유효한_ID만_삭제(self, mock_llm, mock_cmd):
+        mock_llm.return_value = _call("delete_transactions", tx_ids=[TX_ID, "r25"])
+        mock_cmd.delete_transactions_by_ids.return_value = {
+            "success": True,
+            "message": "1건의 내역을 삭제했습니다.",
+        }
+
+        result = run_agent_loop("1", "지워줘")
+
+        mock_cmd.delete_transactions_by_ids.assert_called_once_with("1", [TX_ID])
+        assert "알 수 없는 ID 1개는 제외" in result["reply"]
+
+    @patch("ledger.services.orchestrator.TransactionQueryService")
+    def test_검색_후_수정은_두_번으로_끝남(self, mock_query, mock_llm, mock_cmd):
+        mock_llm.side_effect = [
+            _call("search_transactions", keyword="커피"),
+            _call("update_transaction", tx_id="tx-1", amount=5000),
+        ]
+        mock_query.search_transactions.return_value = [{"tx_id": "tx-1"}]
+        mock_cmd.update_transaction.return_value = dict(
+            CREATE_RESULT, amount=5000, version=2, changed=["amount"], budget=None
+        )
+
+        result = run_agent_loop("1", "커피 5천원으로 고쳐줘")
+
+        assert mock_llm.call_count == 2
+        mock_cmd.update_transaction.assert_called_once_with(
+            "1", "tx-1", {"amount": 5000}
+        )
+        mock_cmd.delete_transactions_by_ids.assert_not_called()
+        assert result["updated_count"] == 1
+        assert result["reply"] == "2026-02-13 식비(식사) 5,000원으로 수정했어요."
+
+    def test_단위가_섞인_금액은_한_건으로_보고_종료(self, mock_llm, mock_cmd):
+        mock_llm.return_value = _call(
+            "create_transaction", amount=53000, type="expense", category="교통"
+        )
+        mock_cmd.create_transaction.return_value = CREATE_RESULT
+
+        result = run_agent_loop("1", "택시 5만3천원")
+
+        assert mock_llm.call_count == 1
+        assert result["stop_reason"] == "terminal_tool"
+
+    @patch("ledger.services.orchestrator.TransactionQueryService")
+    def test_검색_결과_없으면_즉시_종료(self, mock_query, mock_llm, mock_cmd):
+        mock_llm.return_value = _call("search_transactions", keyword="없는가게")
+        mock_query.search_transactions.return_value = []
+
+        result = run_agent_loop("1", "없는가게 내역 삭제해줘")
+
+        assert mock_llm.call_count == 1
+        assert "찾지 못했어요" in result["reply"]
+
+    @patch("ledger.services.orchestrator.TransactionQueryService")
+    def test_합계_질문은_get_summary로_집계(self, mock_query, mock_llm, mock_cmd):
+        mock_llm.side_effect = [
+            _call("get_summary", category="식비", compare_previous=True),
+            _text("이번 달 식비는 5,000원이에요."),
+        ]
+        mock_query.get_summary.return_value = {
+            "label": "2026-02",
+            "total": 5000,
+            "by_category": {"식비": 5000},
+        }
+
+        result = run_agent_loop("1", "이번 달 식비 얼마 썼어?")
+
+        kwargs = mock_query.get_summary.call_args.kwargs
+        assert kwargs["category"] == "식비"
+        assert kwargs["tx_type"] == "expense"
+        assert kwargs["compare_previous"] is True
+        assert kwargs["month"]  # 기간 미지정 → 이번 달
+        assert result["reply"] == "이번 달 식비는 5,000원이에요."
+
+
+@pytest.mark.parametrize(
+    "message, count",
+    [
+        ("택시 5만3천원", 1),
+        ("5만 3천원", 1),
+        ("1만2천500원", 1),
+        ("택시 5만 커피 3천", 2),
+        ("점심 8000원 커피 4,500원", 2),
+    ],
+)
+def test_금액_언급_수(message, count):
+    assert len(_AMOUNT_MENTION_RE.findall(message)) == count
+
+
+@patch("ledger.services.orchestrator.date")
+@patch("ledger.services.orchestrator.TransactionQueryService")
+class TestGetSummaryTool:
+    def test_시작일만_오면_오늘까지(self, mock_query, mock_date):
+        mock_date.today.return_value = date(2026, 2, 20)
+
+        _execute_tool("1", "get_summary", {"start_date": "2026-02-10"}, [])
+
+        kwargs = mock_query.get_summary.call_args.kwargs
+        assert kwargs["month"] is None
+        assert (kwargs["from_date"], kwargs["to_date"]) == (
+            date(2026, 2, 10),
+            date(2026, 2, 20),
+        )
+
+    def test_종료일만_오면_그_달_1일부터(self, mock_query, mock_date):
+        _execute_tool("1", "get_summary", {"end_date": "2026-01-15"}, [])
+
+        kwargs = mock_query.get_summary.call_args.kwargs
+        assert (kwargs["from_date"], kwargs["to_date"]) == (
+            date(2026, 1, 1),
+            date(2026, 1, 15),
+        )
+
+    def test_시작일이_종료일보다_늦으면_오류(self, mock_query, mock_date):
+        result = _execute_tool(
+            "1",
+            "get_summary",
+            {"start_date": "2026-02-10", "end_date": "2026-02-01"},
+            [],
+        )
+
+        assert result["status"] == "error"
+        mock_query.get_summary.assert_not_called()
+
+    def test_텍스트_호출도_get_summary_허용(self, mock_query, mock_date):
+        parsed = _parse_text_tool_call('get_summary(month="2026-02", category="식비")')
+        assert parsed == ("get_summary", {"month": "2026-02", "category": "식비"})
+
+
+@patch("ledger.services.orchestrator.TransactionQueryService")
+@patch("ledger.services.orchestrator.chat_completion")
+class TestBudgets:
+    @override_settings(AGENT_TOKEN_BUDGET=1000)
+    def test_토큰_예산_소진시_중단(self, mock_llm, mock_query):
+        mock_llm.return_value = dict(
+            _call("search_transactions", keyword="커피"), total_tokens=800
+        )
+        mock_query.search_transactions.return_value = [{"tx_id": "tx-1"}]
+
+        result = run_agent_loop("1", "커피 내역 보여줘")
+
+        assert mock_llm.call_count == 2
+        assert result["stop_reason"] == "token_budget"
+
+    @override_settings(AGENT_TIME_BUDGET_SECONDS=0)
+    def test_시간_예산_소진시_LLM_호출_안함(self, mock_llm, mock_query):
+        result = run_agent_loop("1", "커피 내역 보여줘")
+
+        mock_llm.assert_not_called()
+        assert result["stop_reason"] == "time_budget"
+        assert result["reply"] == "처리 중 문제가 발생했습니다."
+
+    def test_요청당_평균_LLM_호출_집계(self, mock_llm, mock_query):
+        before = agent_stats()
+        mock_llm.return_value = _text("이번 달은 아직 내역이 없어요.")
+
+        run_agent_loop("1", "안녕")
+
+        after = agent_stats()
+        assert after["requests"] == before["requests"] + 1
+        assert after["llm_calls"] == before["llm_calls"] + 1
+        assert after["avg_llm_calls"] > 0
+
+
+@pytest.mark.django_db
+class TestRecentContext:
+    @pytest.fixture(autouse=True)
+    def _context_on(self, settings):
+        settings.AGENT_RECENT_CONTEXT_ROWS = 20
+        settings.AGENT_RECENT_CONTEXT_TOKENS = 600
+
+    def test_최신순_표와_핸들(self, user, multiple_transactions):
+        context, handles = _recent_context(str(user.id))
+
+        lines = context.splitlines()
+        assert lines[0].startswith("최근 거래")
+        # 2/13 수입이 가장 최근 → r1, 수입은 + 표시
+        assert lines[1].startswith("r1|2026-02-13|+")
+        assert lines[2] == "r2|2026-02-12|30000|쇼핑||"
+        assert handles["r2"] == str(multiple_transactions[2].tx_id)
+
+    def test_토큰_예산을_넘는_행은_제외(self, user, multiple_transactions, settings):
+        settings.AGENT_RECENT_CONTEXT_TOKENS = 80
+
+        context, handles = _recent_context(str(user.id))
+
+        assert 0 < len(handles) < len(multiple_transactions)
+        assert len(context) <= 80
+
+    @patch("ledger.services.orchestrator.chat_completion")
+    @patch("ledger.services.transaction_command.record_undo")
+    def test_핸들로_검색_없이_삭제(
+        self, mock_undo, mock_llm, user, multiple_transactions
+    ):
+        mock_llm.return_value = _call("delete_transactions", tx_ids=["r2"])
+
+        result = run_agent_loop(str(user.id), "어제 쇼핑 30000원 지워줘")
+
+        assert mock_llm.call_count == 1
+        prompt = mock_llm.call_args.args[0][1]["content"]
+        assert prompt.endswith("요청: 어제 쇼핑 30000원 지워줘")
+        assert result["deleted_count"] == 1
+        assert not Transaction.objects.filter(
+            tx_id=multiple_transactions[2].tx_id
+        ).exists()
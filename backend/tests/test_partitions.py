@@ -0,0 +1,74 @@
+"""
+test_partitions.py — 월 파티션 유틸 + manage_partitions 명령 테스트
+
+실제 파티션 DDL은 PostgreSQL 전용이므로, SQLite 테스트에서는
+이름/월 계산과 SQL 생성 여부만 검증합니다.
+
+실행: pytest tests/test_partitions.py -v
+"""
+
+from datetime import date
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+
+from ledger.partitions import (
+    add_months,
+    detach_partitions_before,
+    parse_partition_month,
+    partition_name,
+)
+
+
+class FakeCursor:
+    """실행된 SQL을 기록하고, 파티션 목록 조회에는 고정 목록을 반환."""
+
+    def __init__(self, partitions):
+        self.partitions = partitions
+        self.executed = []
+
+    def execute(self, sql, params=None):
+        self.executed.append(sql)
+
+    def fetchall(self):
+        return [(name,) for name in self.partitions]
+
+
+class TestPartitionNaming:
+    def test_월_더하기_연도_경계(self):
+        assert add_months(date(2026, 11, 1), 3) == date(2027, 2, 1)
+        assert add_months(date(2026, 1, 1), -1) == date(2025, 12, 1)
+
+    def test_이름_왕복(self):
+        name = partition_name("audit_logs", date(2026, 2, 1))
+        assert name == "audit_logs_p202602"
+        assert parse_partition_month("audit_logs", name) == date(2026, 2, 1)
+
+    def test_default_파티션은_월_없음(self):
+        assert parse_partition_month("audit_logs", "audit_logs_default") is None
+        assert parse_partition_month("audit_logs", "transactions_p202602") is None
+
+
+class TestDetachPartitions:
+    def test_보존기간_이전만_분리(self):
+        cursor = FakeCursor(
+            ["audit_logs_default", "audit_logs_p202512", "audit_logs_p202601"]
+        )
+        handled = detach_partitions_before(cursor, "audit_logs", date(2026, 1, 1))
+
+        assert handled == ["audit_logs_p202512"]
+        assert any("DETACH PARTITION audit_logs_p202512" in s for s in cursor.executed)
+        assert not any("DROP TABLE" in s for s in cursor.executed)
+
+    def test_drop_옵션이면_삭제(self):
+        cursor = FakeCursor(["audit_logs_p202512"])
+        detach_partitions_before(cursor, "audit_logs", date(2026, 1, 1), drop=True)
+        assert "DROP TABLE audit_logs_p202512" in cursor.executed
+
+
+@pytest.mark.django_db
+def test_postgresql이_아니면_건너뜀():
+    out = StringIO()
+    call_command("manage_partitions", stdout=out)
+    assert "건너뜁니다" in out.getvalue()
@@ -0,0 +1,165 @@
+"""
+test_recurring.py — 반복 거래 규칙 + 스케줄러 테스트 (DB 사용)
+
+실행: pytest tests/test_recurring.py -v
+"""
+
+from datetime import date
+
+import pytest
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from ledger.models import AuditLog, CategoryMonthTotal, RecurringRule, Transaction
+from ledger.services.recurring import (
+    create_rule,
+    first_run_date,
+    next_run_after,
+    occurrence_key,
+    run_due_rules,
+)
+from ledger.services.transaction_command import TransactionCommandService
+
+
+def _rule(user, **fields):
+    defaults = {
+        "amount": 17000,
+        "category": "구독",
+        "merchant": "넷플릭스",
+        "day_of_month": 31,
+        "start_date": date(2026, 1, 10),
+    }
+    return create_rule(str(user.id), **{**defaults, **fields})
+
+
+@pytest.mark.django_db
+class TestSchedule:
+    def test_말일_보정과_다음_회차(self, user):
+        rule = _rule(user)
+
+        assert rule.next_run_date == date(2026, 1, 31)
+        assert next_run_after(rule, date(2026, 1, 31)) == date(2026, 2, 28)
+        assert next_run_after(rule, date(2026, 2, 28)) == date(2026, 3, 31)
+        assert next_run_after(rule, date(2026, 12, 31)) == date(2027, 1, 31)
+
+    def test_시작일이_지난_날짜면_다음_달부터(self, user):
+        rule = _rule(user, day_of_month=5)
+        assert first_run_date(rule) == date(2026, 2, 5)
+
+    def test_주간_규칙(self, user):
+        rule = _rule(user, frequency="weekly", day_of_month=None)
+        assert rule.next_run_date == date(2026, 1, 10)
+        assert next_run_after(rule, date(2026, 1, 10)) == date(2026, 1, 17)
+
+    def test_멱등성_키는_규칙과_회차로_결정(self, user):
+        rule = _rule(user)
+        assert occurrence_key(rule, date(2026, 2, 28)) == f"recurring:{rule.id}:2026-02"
+
+
+@pytest.mark.django_db
+class TestScheduler:
+    def test_밀린_회차까지_생성하고_전진(self, user, other_user):
+        netflix = _rule(user)
+        phone = _rule(other_user, amount=55000, category="통신", merchant=None)
+
+        chunks = list(run_due_rules(today=date(2026, 3, 31), chunk_size=1))
+
+        assert [c["rules"] for c in chunks] == [1, 1]
+        assert Transaction.objects.filter(user_id=str(user.id)).count() == 3
+        assert AuditLog.objects.filter(action="create").count() == 6
+        netflix.refresh_from_db()
+        phone.refresh_from_db()
+        assert netflix.next_run_date == date(2026, 4, 30)
+        assert phone.next_run_date == date(2026, 4, 30)
+        assert (
+            CategoryMonthTotal.objects.get(
+                user_id=str(other_user.id), month="2026-02", category="통신"
+            ).spent
+            == 55000
+        )
+
+    def test_재실행해도_중복_생성_안함(self, user):
+        rule = _rule(user)
+        list(run_due_rules(today=date(2026, 2, 28)))
+
+        # 스케줄러가 전진을 저장하지 못한 채 재실행된 상황
+        RecurringRule.objects.filter(id=rule.id).update(next_run_date=date(2026, 1, 31))
+        chunks = list(run_due_rules(today=date(2026, 2, 28)))
+
+        assert chunks[0]["created"] == []
+        assert chunks[0]["skipped"] == 2
+        assert Transaction.objects.filter(user_id=str(user.id)).count() == 2
+
+    def test_종료일이_지나면_비활성화(self, user):
+        rule = _rule(user, end_date=date(2026, 2, 15))
+        list(run_due_rules(today=date(2026, 3, 31)))
+
+        rule.refresh_from_db()
+        assert rule.active is False
+        assert Transaction.objects.filter(user_id=str(user.id)).count() == 1
+
+    def test_잘못된_규칙은_비활성화하고_나머지는_생성(self, user, other_user):
+        bad = _rule(user)
+        good = _rule(other_user)
+        # 생성 이후 데이터가 깨진 경우 (기존에는 다음 회차 계산에서 청크 전체가 롤백)
+        RecurringRule.objects.filter(id=bad.id).update(day_of_month=0)
+
+        chunks = list(run_due_rules(today=date(2026, 1, 31)))
+
+        assert chunks[0]["invalid"] == [bad.id]
+        assert len(chunks[0]["created"]) == 1
+        assert Transaction.objects.filter(user_id=str(other_user.id)).count() == 1
+        bad.refresh_from_db()
+        good.refresh_from_db()
+        assert bad.active is False
+        assert bad.next_run_date == date(2026, 1, 31)
+        assert good.next_run_date == date(2026, 2, 28)
+        # 비활성화됐으므로 다음 실행에서 다시 걸리지 않음
+        assert list(run_due_rules(today=date(2026, 1, 31))) == []
+
+    def test_생성_시_검증(self, user):
+        with pytest.raises(ValueError):
+            _rule(user, frequency="daily")
+
+    def test_관리_커맨드(self, user):
+        _rule(user)
+        call_command("run_recurring_scheduler", "--date", "2026-01-31")
+        assert Transaction.objects.filter(merchant="넷플릭스").count() == 1
+
+
+@pytest.mark.django_db
+class TestCreateTransactionsBulk:
+    def test_목록_내_중복_키는_한_번만(self, user):
+        args = {"occurred_date": "2026-02-13", "amount": 8000, "category": "식비"}
+        entries = [
+            {"user_id": str(user.id), "args": args, "idem_key": "k1"},
+            {"user_id": str(user.id), "args": args, "idem_key": "k1"},
+            {"user_id": str(user.id), "args": args, "idem_key": None},
+        ]
+
+        result = TransactionCommandService.create_transactions_bulk(entries)
+
+        assert len(result["created"]) == 2
+        assert result["skipped"] == 1
+
+    def test_기존_키_조회는_사용자_조건_포함(self, user, other_user):
+        args = {"occurred_date": "2026-02-13", "amount": 8000, "category": "식비"}
+        TransactionCommandService.create_transactions_bulk(
+            [{"user_id": str(user.id), "args": args, "idem_key": "k1"}]
+        )
+        entries = [
+            {"user_id": str(user.id), "args": args, "idem_key": "k1"},
+            # 다른 사용자의 같은 키는 별개
+            {"user_id": str(other_user.id), "args": args, "idem_key": "k1"},
+        ]
+
+        with CaptureQueriesContext(connection) as ctx:
+            result = TransactionCommandService.create_transactions_bulk(entries)
+
+        lookup = next(
+            q["sql"] for q in ctx.captured_queries if "idempotency" in q["sql"]
+        )
+        assert '"user_id" IN' in lookup
+        assert len(result["created"]) == 1
+        assert result["skipped"] == 1
@@ -0,0 +1,90 @@
+"""
+test_renderers.py — 거래 목록 고속 렌더링이 Serializer + JSONRenderer와 바이트 단위로 같은지
+
+실행: pytest tests/test_renderers.py -v
+"""
+
+from datetime import date, datetime, timezone
+from decimal import Decimal
+
+import pytest
+from django.test import override_settings
+from rest_framework.renderers import JSONRenderer
+
+from ledger.models import Transaction
+from ledger.renderers import ORJSONRenderer, render_transaction_list
+from ledger.serializers import TransactionResponseSerializer
+
+
+def _slow_path(queryset) -> bytes:
+    data = TransactionResponseSerializer(queryset, many=True).data
+    return JSONRenderer().render({"transactions": data})
+
+
+@pytest.fixture
+def tricky_transactions(user):
+    uid = str(user.id)
+    rows = [
+        Transaction(
+            user_id=uid,
+            occurred_date=date(2026, 2, 13),
+            type="expense",
+            amount=8000,
+            category="식비",
+            merchant='김밥 "천국"\\',
+            memo="줄\n바꿈\t탭\x01\u2028\u2029☕️",
+            source_text="점심 8000원",
+        ),
+        Transaction(
+            user_id=uid,
+            occurred_date=date(2025, 12, 31),
+            type="income",
+            amount=2_000_000_000,
+            category="급여",
+        ),
+    ]
+    Transaction.objects.bulk_create(rows)
+    # 마이크로초 0 / 0 아님 둘 다
+    Transaction.objects.filter(tx_id=rows[1].tx_id).update(
+        created_at=datetime(2026, 1, 1, 15, 0, tzinfo=timezone.utc)
+    )
+    return Transaction.objects.filter(user_id=uid).order_by("-occurred_date")
+
+
+@pytest.mark.django_db
+class TestRenderTransactionList:
+    def test_기존_경로와_바이트_동일(self, tricky_transactions):
+        assert render_transaction_list(tricky_transactions) == _slow_path(
+            tricky_transactions
+        )
+
+    @override_settings(TIME_ZONE="UTC")
+    def test_UTC면_Z_표기도_동일(self, tricky_transactions):
+        body = render_transaction_list(tricky_transactions)
+
+        assert b'"created_at":"2026-01-01T15:00:00Z"' in body
+        assert body == _slow_path(tricky_transactions)
+
+    def test_user_id는_문자열로_응답(self, user, tricky_transactions):
+        # 컬럼은 bigint지만 응답 스키마는 기존 문자열 유지
+        body = render_transaction_list(tricky_transactions)
+
+        assert f'"user_id":"{user.id}"'.encode() in body
+        assert body == _slow_path(tricky_transactions)
+
+    def test_빈_목록(self, user):
+        qs = Transaction.objects.filter(user_id=str(user.id))
+        assert render_transaction_list(qs) == b'{"transactions":[]}' == _slow_path(qs)
+
+
+class TestORJSONRenderer:
+    def test_JSONRenderer와_같은_출력(self):
+        data = {"budget": {"limit": 300000, "used": None}, "message": "저장\u2028완료"}
+        assert ORJSONRenderer().render(data) == JSONRenderer().render(data)
+
+    def test_orjson이_모르는_타입은_DRF_인코더로(self):
+        assert ORJSONRenderer().render({"ratio": Decimal("0.5")}) == b'{"ratio":0.5}'
+
+    def test_indent_요청은_JSONRenderer로_위임(self):
+        body = ORJSONRenderer().render({"a": 1}, "application/json; indent=2")
+        assert body == b'{\n  "a": 1\n}'
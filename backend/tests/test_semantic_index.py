@@ -0,0 +1,168 @@
+"""
+test_semantic_index.py — 의미 검색 인덱스 테스트 (임베딩 모델 / Redis Mock)
+
+실행: pytest tests/test_semantic_index.py -v
+"""
+
+from datetime import date
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+from django.test import override_settings
+
+from ledger.models import Transaction
+from ledger.services import semantic_index
+from ledger.services.semantic_index import (
+    PENDING_KEY,
+    index_pending,
+    index_transactions,
+    schedule_index,
+    semantic_search,
+    transaction_text,
+)
+from ledger.services.transaction_query import TransactionQueryService
+
+# 동의어를 같은 축에 두는 가짜 임베딩 (회식 ≈ 팀 저녁)
+_AXES = {"회식": 0, "저녁": 0, "커피": 1, "카페": 1, "택시": 2}
+
+
+class FakeEmbedder:
+    def embed(self, texts, batch_size=64):
+        for text in texts:
+            vector = np.full(4, 0.01, dtype=np.float32)
+            for word, axis in _AXES.items():
+                if word in text:
+                    vector[axis] += 1
+            yield vector
+
+
+@pytest.fixture(autouse=True)
+def _fake_model():
+    semantic_index._MATRICES.clear()
+    with override_settings(SEMANTIC_SEARCH_MODEL="fake-model"), patch(
+        "ledger.services.semantic_index._embedder", return_value=FakeEmbedder()
+    ):
+        yield
+
+
+def _tx(tx_id, merchant=None, memo=None):
+    return SimpleNamespace(
+        tx_id=tx_id, user_id="1", merchant=merchant, memo=memo, source_text=None
+    )
+
+
+class TestIndexing:
+    @patch("ledger.services.semantic_index.get_redis_connection")
+    def test_float16_벡터를_사용자별로_배치_저장(self, mock_conn):
+        pipe = mock_conn.return_value.pipeline.return_value
+        count = index_transactions(
+            [_tx("a", memo="팀 저녁"), _tx("b", merchant="스타벅스"), _tx("c")]
+        )
+
+        assert count == 2  # 텍스트 없는 거래는 제외
+        mapping = pipe.hset.call_args.kwargs["mapping"]
+        assert set(mapping) == {"a", "b"}
+        assert len(mapping["a"]) == 4 * 2  # dim × float16
+        pipe.incr.assert_called_once_with("txvec_ver:1")
+
+    @pytest.mark.django_db
+    @patch("ledger.services.semantic_index.embed_texts")
+    @patch("ledger.services.semantic_index.get_redis_connection")
+    def test_커밋_후_대기열에만_추가(
+        self, mock_conn, mock_embed, django_capture_on_commit_callbacks
+    ):
+        # 요청 스레드에서는 임베딩하지 않음
+        with django_capture_on_commit_callbacks(execute=True):
+            schedule_index([_tx("a", memo="팀 저녁"), _tx("b")])
+            mock_conn.return_value.lpush.assert_not_called()
+
+        mock_conn.return_value.lpush.assert_called_once_with(PENDING_KEY, "a", "b")
+        mock_embed.assert_not_called()
+
+    @pytest.mark.django_db
+    @patch("ledger.services.semantic_index.get_redis_connection")
+    def test_워커가_대기열을_배치_임베딩(self, mock_conn, user):
+        live, deleted = (
+            Transaction.objects.create(
+                user_id=str(user.id),
+                occurred_date=date(2026, 2, 13),
+                type="expense",
+                amount=8000,
+                category="식비",
+                memo=memo,
+            )
+            for memo in ("팀 저녁", "커피")
+        )
+        Transaction.objects.filter(tx_id=deleted.tx_id).update(
+            deleted_at=deleted.created_at
+        )
+        redis = mock_conn.return_value
+        redis.brpop.return_value = (PENDING_KEY.encode(), str(live.tx_id).encode())
+        redis.rpop.return_value = [str(deleted.tx_id).encode()]
+
+        assert index_pending(batch_size=10, timeout=1) == 2
+
+        redis.rpop.assert_called_once_with(PENDING_KEY, 9)
+        mapping = redis.pipeline.return_value.hset.call_args.kwargs["mapping"]
+        assert set(mapping) == {str(live.tx_id)}  # 삭제된 거래는 건너뜀
+
+    @patch("ledger.services.semantic_index.get_redis_connection")
+    def test_대기열이_비면_0(self, mock_conn):
+        mock_conn.return_value.brpop.return_value = None
+        assert index_pending(timeout=1) == 0
+
+    def test_임베딩_대상_문장(self):
+        assert transaction_text(_tx("a", "스타벅스", "라떼")) == "스타벅스 라떼"
+
+
+class TestSemanticSearch:
+    @patch("ledger.services.semantic_index._load_matrix")
+    def test_유사도_순으로_임계값_이상만(self, mock_load):
+        vectors = semantic_index.embed_texts(["팀 저녁", "카페 라떼", "택시"])
+        mock_load.return_value = (np.array(["a", "b", "c"], dtype=object), vectors)
+
+        assert semantic_search("1", "회식") == ["a"]
+        assert semantic_search("1", "커피") == ["b"]
+
+    @override_settings(SEMANTIC_SEARCH_MODEL="")
+    @patch("ledger.services.semantic_index._load_matrix")
+    def test_비활성화면_조회_안함(self, mock_load):
+        assert semantic_search("1", "회식") == []
+        mock_load.assert_not_called()
+
+
+@pytest.mark.django_db
+class TestHybridSearch:
+    def test_SQL_필터와_함께_적용(self, user):
+        uid = str(user.id)
+        dinner = Transaction.objects.create(
+            user_id=uid,
+            occurred_date=date(2026, 2, 13),
+            type="expense",
+            amount=120000,
+            category="식비",
+            memo="팀 저녁",
+        )
+        old_dinner = Transaction.objects.create(
+            user_id=uid,
+            occurred_date=date(2026, 1, 5),
+            type="expense",
+            amount=80000,
+            category="식비",
+            memo="팀 저녁",
+        )
+
+        with patch(
+            "ledger.services.transaction_query.semantic_search",
+            return_value=[str(dinner.tx_id), str(old_dinner.tx_id)],
+        ), patch(
+            "ledger.services.transaction_query.expand_merchant_keyword",
+            return_value=[],
+        ):
+            rows = TransactionQueryService.search_transactions(
+                uid, keyword="회식", start_date=date(2026, 2, 1)
+            )
+
+        assert [r["tx_id"] for r in rows] == [str(dinner.tx_id)]
@@ -11,6 +11,8 @@ import pytest
 
 from accounts.serializers import RegisterSerializer
 from ledger.serializers import (
+    BudgetQuerySerializer,
+    BudgetRequestSerializer,
     ChatRequestSerializer,
     CreateTransactionSerializer,
     SummaryQuerySerializer,
@@ -111,6 +113,37 @@ class TestSummaryQuerySerializer:
         assert not serializer.is_valid()
 
 
+# ══════════════════════════════════════════
+# BudgetRequestSerializer / BudgetQuerySerializer
+# ══════════════════════════════════════════
+
+
+class TestBudgetSerializers:
+    """POST/GET /budgets/ 입력 검증."""
+
+    def test_정상_입력(self):
+        data = {"month": "2026-02", "category": "식비", "amount": 300000}
+        serializer = BudgetRequestSerializer(data=data)
+        assert serializer.is_valid(), serializer.errors
+
+    @pytest.mark.parametrize("month", ["2026-13", "2026-00", "2026/02"])
+    def test_없는_월은_에러(self, month):
+        data = {"month": month, "category": "식비", "amount": 300000}
+        assert not BudgetRequestSerializer(data=data).is_valid()
+        assert not BudgetQuerySerializer(data={"month": month}).is_valid()
+
+    def test_모르는_카테고리는_에러(self):
+        data = {"month": "2026-02", "category": "식비 ", "amount": 300000}
+        serializer = BudgetRequestSerializer(data=data)
+        assert not serializer.is_valid()
+        assert "category" in serializer.errors
+
+    def test_조회_month_생략_가능(self):
+        serializer = BudgetQuerySerializer(data={})
+        assert serializer.is_valid(), serializer.errors
+        assert serializer.validated_data["month"] is None
+
+
 # ══════════════════════════════════════════
 # RegisterSerializer (accounts)
 # ══════════════════════════════════════════
@@ -12,12 +12,16 @@ test_services.py — 비즈니스 로직 테스트 (DB 사용, Redis Mock)
 실행: pytest tests/test_services.py -v
 """
 
-from datetime import date
+from datetime import date, timedelta
 from unittest.mock import patch
 
 import pytest
+from django.core.management import call_command
+from django.db.models import F
+from django.utils import timezone
 
-from ledger.models import Transaction
+from ledger.exceptions import TransactionConflictError, TransactionNotFoundError
+from ledger.models import AuditLog, CategoryMonthTotal, IdempotencyKey, Transaction
 from ledger.services.transaction_command import TransactionCommandService
 from ledger.services.transaction_query import TransactionQueryService
 
@@ -27,7 +31,7 @@ class TestCreateTransaction:
     """TransactionService.create_transaction() 테스트."""
 
     # Redis 호출을 Mock으로 대체 — 실제 Redis 없이 테스트 가능
-    @patch("ledger.services.transaction_command.save_undo_token")
+    @patch("ledger.services.transaction_command.record_undo")
     @patch("ledger.services.transaction_command.log_audit")
     @patch("ledger.services.transaction_command.get_cached_tx_id", return_value=None)
     def test_정상_거래_생성(self, mock_cache, mock_audit, mock_undo, user):
@@ -53,9 +57,9 @@ class TestCreateTransaction:
         # DB에 실제로 저장되었는지 확인
         tx = Transaction.objects.get(tx_id=result["tx_id"])
         assert tx.amount == 8000
-        assert tx.user_id == str(user.id)
+        assert tx.user_id == user.id
 
-    @patch("ledger.services.transaction_command.save_undo_token")
+    @patch("ledger.services.transaction_command.record_undo")
     @patch("ledger.services.transaction_command.log_audit")
     @patch("ledger.services.transaction_command.get_cached_tx_id", return_value=None)
     def test_금액_0이하면_에러(self, mock_cache, mock_audit, mock_undo, user):
@@ -71,7 +75,7 @@ class TestCreateTransaction:
                 },
             )
 
-    @patch("ledger.services.transaction_command.save_undo_token")
+    @patch("ledger.services.transaction_command.record_undo")
     @patch("ledger.services.transaction_command.log_audit")
     @patch(
         "ledger.services.transaction_command.get_cached_tx_id",
@@ -93,7 +97,7 @@ class TestCreateTransaction:
         assert result["cached"] is True
         assert result["tx_id"] == "existing-tx-id"
 
-    @patch("ledger.services.transaction_command.save_undo_token")
+    @patch("ledger.services.transaction_command.record_undo")
     @patch("ledger.services.transaction_command.log_audit")
     @patch("ledger.services.transaction_command.get_cached_tx_id", return_value=None)
     def test_만원_단위_금액_정규화(self, mock_cache, mock_audit, mock_undo, user):
@@ -168,3 +172,196 @@ class TestGetSummary:
         )
         assert result["total"] == 0
         assert result["by_category"] == {}
+
+    def test_카테고리_타입_필터(self, user, multiple_transactions):
+        """category/tx_type으로 좁혀서 집계."""
+        food = TransactionQueryService.get_summary(
+            user_id=str(user.id), month="2026-02", category="식비"
+        )
+        assert food["total"] == 5000
+        assert list(food["by_category"]) == ["식비"]
+
+        income = TransactionQueryService.get_summary(
+            user_id=str(user.id), month="2026-02", tx_type="income"
+        )
+        assert income["total"] == 100000
+
+    def test_전월_비교는_쿼리_한_번(
+        self, user, multiple_transactions, django_assert_num_queries
+    ):
+        """현재/직전 기간을 조건부 SUM 하나의 쿼리로 집계."""
+        Transaction.objects.create(
+            user_id=str(user.id),
+            occurred_date=date(2026, 1, 20),
+            type="expense",
+            amount=7000,
+            category="식비",
+        )
+        with django_assert_num_queries(1):
+            result = TransactionQueryService.get_summary(
+                user_id=str(user.id), month="2026-02", compare_previous=True
+            )
+
+        assert result["total"] == 50000
+        assert result["previous"] == {
+            "label": "2026-01",
+            "total": 7000,
+            "by_category": {"식비": 7000},
+        }
+        assert result["change"] == 43000
+
+    def test_기간_비교는_같은_길이의_직전_기간(self, user, multiple_transactions):
+        """2/12~2/13 ↔ 2/10~2/11."""
+        result = TransactionQueryService.get_summary(
+            user_id=str(user.id),
+            from_date="2026-02-12",
+            to_date="2026-02-13",
+            compare_previous=True,
+        )
+        assert result["total"] == 30000
+        assert result["previous"]["label"] == "2026-02-10 ~ 2026-02-11"
+        assert result["previous"]["total"] == 20000
+
+
+@pytest.mark.django_db
+@patch("ledger.services.transaction_command.record_undo")
+class TestSoftDelete:
+    def test_삭제는_표시만_하고_목록에서_제외(
+        self, mock_undo, user, sample_transaction
+    ):
+        uid = str(user.id)
+        result = TransactionCommandService.delete_transactions_by_ids(
+            uid, [sample_transaction.tx_id]
+        )
+
+        assert result["success"] is True
+        assert not Transaction.objects.filter(user_id=uid).exists()
+        row = Transaction.all_objects.get(tx_id=sample_transaction.tx_id)
+        assert row.deleted_at is not None
+        assert not TransactionQueryService.list_transactions(user_id=uid).exists()
+        assert mock_undo.call_args.args[1] == [
+            {"op": "delete", "tx_id": str(sample_transaction.tx_id)}
+        ]
+
+    def test_보존기간_지난_삭제만_정리(self, mock_undo, user, multiple_transactions):
+        old, recent, live = multiple_transactions[:3]
+        IdempotencyKey.objects.create(user_id=user.id, idem_key="k1", tx=old)
+        now = timezone.now()
+        Transaction.all_objects.filter(tx_id=old.tx_id).update(
+            deleted_at=now - timedelta(days=40)
+        )
+        Transaction.all_objects.filter(tx_id=recent.tx_id).update(
+            deleted_at=now - timedelta(days=1)
+        )
+
+        purged = list(TransactionCommandService.purge_deleted(now - timedelta(days=30)))
+
+        assert purged == [1]
+        assert not Transaction.all_objects.filter(tx_id=old.tx_id).exists()
+        assert not IdempotencyKey.objects.filter(idem_key="k1").exists()
+        assert Transaction.all_objects.filter(tx_id=recent.tx_id).exists()
+        assert Transaction.objects.filter(tx_id=live.tx_id).exists()
+
+    def test_정리_관리_커맨드(self, mock_undo, user, sample_transaction):
+        Transaction.all_objects.filter(tx_id=sample_transaction.tx_id).update(
+            deleted_at=timezone.now() - timedelta(days=31)
+        )
+        call_command("purge_deleted_transactions", "--batch-size", "10")
+        assert not Transaction.all_objects.exists()
+
+
+@pytest.mark.django_db
+@patch("ledger.services.transaction_command.record_undo", return_value="undo-1")
+class TestUpdateTransaction:
+    def test_바뀐_필드만_조건부_UPDATE(self, mock_undo, user, sample_transaction):
+        uid = str(user.id)
+        result = TransactionCommandService.update_transaction(
+            uid, str(sample_transaction.tx_id), {"amount": "5000", "memo": "할인"}
+        )
+
+        assert result["changed"] == ["amount", "memo"]
+        assert result["version"] == 2
+        assert result["undo_token"] == "undo-1"
+        tx = Transaction.objects.get(tx_id=sample_transaction.tx_id)
+        assert (tx.amount, tx.memo, tx.version) == (5000, "할인", 2)
+        assert tx.created_at == sample_transaction.created_at
+
+        audit = AuditLog.objects.get(action="update")
+        assert audit.before_snapshot == {"amount": 8000, "memo": "점심"}
+        assert audit.after_snapshot == {"amount": 5000, "memo": "할인"}
+        op = mock_undo.call_args.args[1][0]
+        assert op == {
+            "op": "update",
+            "tx_id": str(sample_transaction.tx_id),
+            "before": {"amount": 8000, "memo": "점심"},
+            "version": 2,
+        }
+
+    def test_예산_누계를_옮김(self, mock_undo, user):
+        uid = str(user.id)
+        with patch(
+            "ledger.services.transaction_command.get_cached_tx_id", return_value=None
+        ):
+            created = TransactionCommandService.create_transaction(
+                uid,
+                {
+                    "occurred_date": "2026-02-13",
+                    "type": "expense",
+                    "amount": "8000",
+                    "category": "식비",
+                },
+            )
+
+        TransactionCommandService.update_transaction(
+            uid, created["tx_id"], {"category": "교통", "occurred_date": "2026-03-02"}
+        )
+
+        totals = {
+            (t.month, t.category): t.spent
+            for t in CategoryMonthTotal.objects.filter(user_id=uid)
+        }
+        assert totals == {("2026-02", "식비"): 0, ("2026-03", "교통"): 8000}
+
+    def test_버전이_다르면_충돌(self, mock_undo, user, sample_transaction):
+        with pytest.raises(TransactionConflictError):
+            TransactionCommandService.update_transaction(
+                str(user.id),
+                str(sample_transaction.tx_id),
+                {"amount": 5000},
+                expected_version=3,
+            )
+        assert Transaction.objects.get(tx_id=sample_transaction.tx_id).amount == 8000
+
+    def test_읽은_뒤_먼저_수정되면_충돌(self, mock_undo, user, sample_transaction):
+        """조회와 UPDATE 사이에 다른 요청이 version을 올린 경우."""
+
+        def concurrent_update(tx, args):
+            Transaction.objects.filter(tx_id=tx.tx_id).update(version=F("version") + 1)
+            return {"amount": 5000}
+
+        with patch(
+            "ledger.services.transaction_command._normalize_changes",
+            side_effect=concurrent_update,
+        ):
+            with pytest.raises(TransactionConflictError):
+                TransactionCommandService.update_transaction(
+                    str(user.id), str(sample_transaction.tx_id), {"amount": 5000}
+                )
+        assert not AuditLog.objects.filter(action="update").exists()
+
+    def test_바뀐_것이_없으면_쓰지_않음(self, mock_undo, user, sample_transaction):
+        result = TransactionCommandService.update_transaction(
+            str(user.id), str(sample_transaction.tx_id), {"amount": 8000}
+        )
+        assert result["changed"] == []
+        assert result["version"] == 1
+        mock_undo.assert_not_called()
+
+    def test_삭제된_거래는_수정_불가(self, mock_undo, user, sample_transaction):
+        Transaction.objects.filter(tx_id=sample_transaction.tx_id).update(
+            deleted_at=timezone.now()
+        )
+        with pytest.raises(TransactionNotFoundError):
+            TransactionCommandService.update_transaction(
+                str(user.id), str(sample_transaction.tx_id), {"amount": 5000}
+            )
@@ -0,0 +1,80 @@
+"""
+test_snapshot.py — 감사로그 스냅샷 코덱 + 시점 복원 테스트
+
+실행: pytest tests/test_snapshot.py -v
+"""
+
+from unittest.mock import patch
+
+import pytest
+from django.utils import timezone
+
+from ledger.models import AuditLog
+from ledger.services.snapshot import (
+    apply_event,
+    encode_delta,
+    reconstruct_transaction,
+    transaction_image,
+)
+from ledger.services.transaction_command import TransactionCommandService
+
+
+class TestCodec:
+    def test_delta는_바뀐_필드만(self):
+        before = {"amount": 8000, "category": "식비", "memo": "점심"}
+        after = {"amount": 9000, "category": "식비"}
+
+        old, new = encode_delta(before, after)
+
+        assert old == {"amount": 8000, "memo": "점심"}
+        assert new == {"amount": 9000, "memo": None}
+
+    def test_update_적용_후_삭제(self):
+        state = apply_event(None, "create", {"amount": 8000, "memo": "점심"})
+        state = apply_event(state, "update", {"amount": 9000, "memo": None})
+        assert state == {"amount": 9000}
+        assert apply_event(state, "delete", None) is None
+
+
+@pytest.mark.django_db
+class TestAuditSnapshots:
+    def test_이미지는_None_필드_생략(self, sample_transaction):
+        image = transaction_image(sample_transaction)
+        assert image["occurred_date"] == "2026-02-13"
+        assert "tx_id" not in image and "user_id" not in image
+
+        sample_transaction.memo = None
+        assert "memo" not in transaction_image(sample_transaction)
+
+    @patch("ledger.services.transaction_command.get_cached_tx_id", return_value=None)
+    def test_생성은_전체_이미지_삭제는_스냅샷_없음(self, mock_cache, user):
+        user_id = str(user.id)
+        created = TransactionCommandService.create_transaction(
+            user_id=user_id,
+            args={
+                "occurred_date": "2026-02-13",
+                "type": "expense",
+                "amount": "8000",
+                "category": "식비",
+                "memo": "점심",
+                "source_text": "점심 8000원",
+            },
+        )
+        before_delete = timezone.now()
+        TransactionCommandService.delete_transactions_by_ids(
+            user_id, [created["tx_id"]]
+        )
+
+        create_log = AuditLog.objects.get(action="create")
+        delete_log = AuditLog.objects.get(action="delete")
+        assert create_log.after_snapshot["source_text"] == "점심 8000원"
+        assert delete_log.before_snapshot is None
+        # 거래가 삭제돼도 감사로그의 tx_id는 유지
+        assert str(delete_log.tx_id) == created["tx_id"]
+
+        # 시점 복원: 삭제 전에는 존재, 현재는 없음
+        restored = reconstruct_transaction(created["tx_id"], at=before_delete)
+        assert restored["amount"] == 8000
+        assert restored["memo"] == "점심"
+        assert restored["user_id"] == user_id
+        assert reconstruct_transaction(created["tx_id"]) is None
@@ -0,0 +1,260 @@
+"""
+test_undo.py — 사용자별 undo 스택 테스트 (DB 사용, Redis Mock)
+
+실행: pytest tests/test_undo.py -v
+"""
+
+import json
+import time
+from unittest.mock import patch
+
+import pytest
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+
+from ledger.exceptions import TransactionNotFoundError, UndoTokenExpiredError
+from ledger.models import AuditLog, CategoryMonthTotal, Transaction
+from ledger.services.transaction_command import TransactionCommandService
+from ledger.services.undo import pop_undo_group, record_undo, undo_group
+
+
+@pytest.fixture
+def no_redis():
+    with patch(
+        "ledger.services.transaction_command.get_cached_tx_id", return_value=None
+    ):
+        yield
+
+
+def _create(user_id, amount, category="식비"):
+    return TransactionCommandService.create_transaction(
+        user_id=user_id,
+        args={
+            "occurred_date": "2026-02-13",
+            "type": "expense",
+            "amount": str(amount),
+            "category": category,
+        },
+    )
+
+
+@pytest.mark.django_db
+class TestUndoStack:
+    @patch("ledger.services.undo.push_undo_group")
+    def test_그룹_밖_기록은_커밋_후_단독_그룹(
+        self, mock_push, django_capture_on_commit_callbacks
+    ):
+        with django_capture_on_commit_callbacks(execute=True):
+            token = record_undo("1", [{"op": "create", "tx_id": "a"}])
+
+        user_id, group = mock_push.call_args.args
+        assert user_id == "1"
+        assert group["group_id"] == token
+        assert group["ops"] == [{"op": "create", "tx_id": "a"}]
+
+    @patch("ledger.services.undo.push_undo_group")
+    def test_그룹_안의_쓰기는_한_번에_적재(
+        self, mock_push, django_capture_on_commit_callbacks
+    ):
+        with django_capture_on_commit_callbacks(execute=True):
+            with undo_group("1") as group:
+                first = record_undo("1", [{"op": "create", "tx_id": "a"}])
+                second = record_undo("1", [{"op": "delete", "tx_id": "b"}])
+
+        assert first == second == group["group_id"]
+        mock_push.assert_called_once()
+        assert [op["tx_id"] for op in mock_push.call_args.args[1]["ops"]] == [
+            "a",
+            "b",
+        ]
+
+    @patch("ledger.services.undo.push_undo_group")
+    def test_롤백된_쓰기는_적재_안함(
+        self, mock_push, django_capture_on_commit_callbacks
+    ):
+        with django_capture_on_commit_callbacks(execute=True):
+            with undo_group("1"):
+                with pytest.raises(ValueError):
+                    with transaction.atomic():
+                        record_undo("1", [{"op": "create", "tx_id": "a"}])
+                        raise ValueError
+
+        mock_push.assert_not_called()
+
+    @patch("ledger.services.undo.get_redis_connection")
+    def test_꺼내기는_Redis_1회_만료면_None(self, mock_conn):
+        redis = mock_conn.return_value
+        group = {"group_id": "g1", "created_at": time.time(), "ops": []}
+        redis.eval.return_value = json.dumps(group).encode()
+
+        assert pop_undo_group("1")["group_id"] == "g1"
+        assert redis.eval.call_args.args[1:] == (1, "undo:stack:1", "")
+
+        group["created_at"] = time.time() - 3600
+        redis.eval.return_value = json.dumps(group).encode()
+        assert pop_undo_group("1", "g1") is None
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("no_redis")
+class TestUndoTransaction:
+    def test_생성과_삭제를_한_번에_되돌림(self, user):
+        uid = str(user.id)
+        first = _create(uid, 8000)
+        second = _create(uid, 12000)
+        third = _create(uid, 5000)
+        deleted = Transaction.objects.get(tx_id=third["tx_id"])
+        group = {
+            "ops": [
+                {"op": "create", "tx_id": first["tx_id"]},
+                {"op": "create", "tx_id": second["tx_id"]},
+                {"op": "delete", "tx_id": third["tx_id"]},
+            ]
+        }
+        TransactionCommandService.delete_transactions_by_ids(uid, [third["tx_id"]])
+
+        with patch(
+            "ledger.services.transaction_command.pop_undo_group", return_value=group
+        ):
+            result = TransactionCommandService.undo_transaction(uid)
+
+        assert result["undone"] == {"created": 2, "deleted": 1, "updated": 0}
+        restored = Transaction.objects.get(user_id=uid)
+        assert str(restored.tx_id) == third["tx_id"]
+        assert restored.deleted_at is None
+        assert restored.created_at == deleted.created_at
+        # 생성 취소분은 삭제 표시만 남음
+        assert (
+            Transaction.all_objects.filter(
+                user_id=uid, deleted_at__isnull=False
+            ).count()
+            == 2
+        )
+        assert (
+            CategoryMonthTotal.objects.get(
+                user_id=uid, month="2026-02", category="식비"
+            ).spent
+            == 5000
+        )
+        assert AuditLog.objects.filter(action="undo").count() == 2
+        # 복원은 생성 이벤트로 기록 (스냅샷 복원과 같은 규칙)
+        assert (
+            AuditLog.objects.filter(action="create", tx_id=third["tx_id"]).count() == 2
+        )
+
+    def test_여러_번_수정은_처음_값으로_되돌림(self, user):
+        uid = str(user.id)
+        created = _create(uid, 8000)
+        with patch("ledger.services.transaction_command.record_undo") as mock_undo:
+            TransactionCommandService.update_transaction(
+                uid, created["tx_id"], {"amount": 9000}
+            )
+            TransactionCommandService.update_transaction(
+                uid, created["tx_id"], {"category": "교통", "amount": 10000}
+            )
+            ops = [call.args[1][0] for call in mock_undo.call_args_list]
+
+        with patch(
+            "ledger.services.transaction_command.pop_undo_group",
+            return_value={"ops": ops},
+        ):
+            result = TransactionCommandService.undo_transaction(uid)
+
+        assert result["undone"] == {"created": 0, "deleted": 0, "updated": 1}
+        tx = Transaction.objects.get(tx_id=created["tx_id"])
+        assert (tx.amount, tx.category, tx.version) == (8000, "식비", 4)
+        totals = {
+            t.category: t.spent
+            for t in CategoryMonthTotal.objects.filter(user_id=uid, month="2026-02")
+        }
+        assert totals == {"식비": 8000, "교통": 0}
+
+    def test_여러_거래_수정은_UPDATE_한_번으로_되돌림(self, user):
+        uid = str(user.id)
+        first = _create(uid, 8000)
+        second = _create(uid, 3000)
+        with patch("ledger.services.transaction_command.record_undo") as mock_undo:
+            TransactionCommandService.update_transaction(
+                uid, first["tx_id"], {"amount": 9000}
+            )
+            TransactionCommandService.update_transaction(
+                uid, second["tx_id"], {"category": "교통"}
+            )
+            ops = [call.args[1][0] for call in mock_undo.call_args_list]
+
+        with patch(
+            "ledger.services.transaction_command.pop_undo_group",
+            return_value={"ops": ops},
+        ), CaptureQueriesContext(connection) as ctx:
+            result = TransactionCommandService.undo_transaction(uid)
+
+        assert result["undone"] == {"created": 0, "deleted": 0, "updated": 2}
+        updates = [
+            q["sql"]
+            for q in ctx.captured_queries
+            if q["sql"].startswith('UPDATE "transactions"') and '"version"' in q["sql"]
+        ]
+        assert len(updates) == 1
+        rows = {
+            str(tx.tx_id): (tx.amount, tx.category, tx.version)
+            for tx in Transaction.objects.filter(user_id=uid)
+        }
+        assert rows == {
+            first["tx_id"]: (8000, "식비", 3),
+            second["tx_id"]: (3000, "식비", 3),
+        }
+        assert AuditLog.objects.filter(action="update").count() == 4
+
+    def test_되돌리기_전에_다시_수정됐으면_건너뜀(self, user):
+        uid = str(user.id)
+        created = _create(uid, 8000)
+        with patch("ledger.services.transaction_command.record_undo") as mock_undo:
+            TransactionCommandService.update_transaction(
+                uid, created["tx_id"], {"amount": 9000}
+            )
+        group = {"ops": [mock_undo.call_args.args[1][0]]}
+        Transaction.objects.filter(tx_id=created["tx_id"]).update(version=5)
+
+        with patch(
+            "ledger.services.transaction_command.pop_undo_group", return_value=group
+        ):
+            with pytest.raises(TransactionNotFoundError):
+                TransactionCommandService.undo_transaction(uid)
+        assert Transaction.objects.get(tx_id=created["tx_id"]).amount == 9000
+
+    def test_스택이_비면_만료_오류(self, user):
+        with patch(
+            "ledger.services.transaction_command.pop_undo_group", return_value=None
+        ):
+            with pytest.raises(UndoTokenExpiredError):
+                TransactionCommandService.undo_transaction(str(user.id))
+
+    def test_다른_사용자_거래는_되돌리지_않음(self, user, other_user):
+        created = _create(str(other_user.id), 8000)
+        group = {"ops": [{"op": "create", "tx_id": created["tx_id"]}]}
+
+        with patch(
+            "ledger.services.transaction_command.pop_undo_group", return_value=group
+        ):
+            with pytest.raises(TransactionNotFoundError):
+                TransactionCommandService.undo_transaction(str(user.id))
+        assert Transaction.objects.filter(tx_id=created["tx_id"]).exists()
+
+    def test_DB_실패시_그룹을_스택에_되돌림(self, user):
+        uid = str(user.id)
+        created = _create(uid, 8000)
+        group = {"ops": [{"op": "create", "tx_id": created["tx_id"]}]}
+
+        with patch(
+            "ledger.services.transaction_command.pop_undo_group", return_value=group
+        ), patch(
+            "ledger.services.transaction_command.revert_spending",
+            side_effect=RuntimeError("db"),
+        ), patch(
+            "ledger.services.transaction_command.push_undo_group"
+        ) as mock_push:
+            with pytest.raises(RuntimeError):
+                TransactionCommandService.undo_transaction(uid)
+
+        mock_push.assert_called_once_with(uid, group)
+        assert Transaction.objects.filter(tx_id=created["tx_id"]).exists()